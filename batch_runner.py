@@ -0,0 +1,320 @@
+"""
+Batch simulation runner. Plays many seeded games over a process pool and
+streams back one GameResult per game.
+
+Usage:
+```
+python batch_runner.py 0 100000 Alice Bob Charlie
+python batch_runner.py 0 100000 Alice Bob --processes 4 --quiet
+python batch_runner.py 0 1000000 Alice Bob --quiet --stats stats.json --output results.csv
+python batch_runner.py 0 1000000 Alice Bob --quiet --stats stats.json --checkpoint sweep.ckpt [--resume]
+python batch_runner.py 0 1000000 Alice Bob --quiet --store results.bin
+```
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import time
+from contextlib import nullcontext
+from multiprocessing import Pool
+from typing import Iterator
+
+from checkpoint import CheckpointMismatch, SweepCheckpoint
+from game import Game, GameOutcome
+from metrics import GameCounts, MetricsCollector
+from player import Player
+from random_gen import RandomGen
+from result_store import ResultStore
+from stats import ResultWriter, SimulationStats, FORMATS
+from data_structures import *
+
+__author__ = "Divyana (Divi) Ahuja"
+
+
+class GameResult:
+    """
+    Outcome of a single simulated game
+    """
+
+    def __init__(
+        self, seed: int, players, winner_seat: int | None, turns: int, reshuffles: int, outcome: GameOutcome,
+        cards_drawn: int = None, special_plays: tuple = None,
+    ) -> None:
+        """
+        Constructor for the GameResult class
+
+        Args:
+            seed (int): The seed the game was played with
+            players: The names of the players in seat order, shared by the results of a batch
+            winner_seat (int): The seat of the winning player, None if nobody won
+            turns (int): The number of turns played
+            reshuffles (int): The number of times the discard pile was reshuffled
+            outcome (GameOutcome): How the game ended
+            cards_drawn (int): The number of cards drawn, if counted
+            special_plays (tuple): The plays of each of metrics.SPECIAL_LABELS, if counted
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: o(1)
+            Worst Case Complexity: o(1)
+        """
+        self.seed = seed
+        self.players = players
+        self.winner_seat = winner_seat
+        self.winner = None if winner_seat is None else players[winner_seat]
+        self.turns = turns
+        self.reshuffles = reshuffles
+        self.outcome = outcome
+        self.cards_drawn = cards_drawn
+        self.special_plays = special_plays
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the result, one line per game.
+        """
+        winner = "" if self.winner is None else self.winner
+        return f"{self.seed},{winner},{self.turns},{self.reshuffles},{self.outcome.name}"
+
+    def __repr__(self) -> str:
+        """
+        Method to return the string representation of the GameResult
+
+        Args:
+            None
+
+        Returns:
+            str: The string representation of the GameResult
+        """
+        return str(self)
+
+
+def play_seed(seed: int, player_names, metrics: MetricsCollector = None, counts: bool = False) -> GameResult:
+    """
+    Plays one full game with the given seed
+
+    Args:
+        seed (int): The seed for the game
+        player_names: The names of the players, in seating order
+        metrics (MetricsCollector): Collector to attach to the game, if any
+        counts (bool): Count the cards drawn and special cards played into the result
+
+    Returns:
+        GameResult: The outcome of the game
+
+    Complexity:
+        Best Case Complexity: o(p + m log m) where p is the number of players and m the deck size
+        Worst Case Complexity: the cost of Game.play_game
+    """
+    players: ArrayList[Player] = ArrayList(len(player_names))
+    for i in range(len(player_names)):
+        players.insert(i, Player(player_names[i]))
+
+    game = Game(RandomGen(seed))
+    game.initialise_game(players)
+    if metrics is not None:
+        game.attach_metrics(metrics)
+    game_counts = None
+    if counts:
+        game_counts = GameCounts()
+        game.attach_metrics(game_counts)
+    winner = game.play_game()
+    result = GameResult(
+        seed, player_names, None if winner is None else winner.seat, game.turns, game.game_board.reshuffles,
+        game.outcome,
+    )
+    if game_counts is not None:
+        result.cards_drawn = game_counts.cards_drawn
+        result.special_plays = game_counts.special_plays()
+    return result
+
+
+def _play_chunk(
+    seeds: range, player_names, collect_metrics: bool, collect_stats: bool = False, counts: bool = False
+) -> list:
+    """
+    Worker entry point, plays a contiguous chunk of seeds so the
+    inter-process overhead is paid once per chunk instead of once per game.
+    Returns the results, the chunk's metrics and the chunk's stats (None when not collected).
+    """
+    metrics = MetricsCollector() if collect_metrics or collect_stats else None
+    results = [play_seed(seed, player_names, metrics, counts) for seed in seeds]
+    stats = None
+    if collect_stats:
+        stats = SimulationStats()
+        for result in results:
+            stats.add(result)
+        stats.metrics = metrics
+    return [results, metrics if collect_metrics else None, stats]
+
+
+def _star_play_chunk(job) -> list:
+    """
+    Unpacks a (seeds, player_names, collect_metrics, collect_stats, counts) job for Pool.imap_unordered,
+    and returns the seeds played alongside the chunk's results.
+    """
+    return [job[0]] + _play_chunk(*job)
+
+
+def _chunks(seeds: range, chunk_size: int) -> Iterator[range]:
+    """
+    Splits a seed range into consecutive sub-ranges of at most chunk_size seeds.
+    """
+    for start in range(0, len(seeds), chunk_size):
+        yield seeds[start:start + chunk_size]
+
+
+def run_batch(
+    seeds: range, player_names, processes: int = None, chunk_size: int = 256,
+    metrics: MetricsCollector = None, stats: SimulationStats = None, checkpoint: SweepCheckpoint = None,
+    counts: bool = False,
+) -> Iterator[GameResult]:
+    """
+    Plays one game per seed, spread over a pool of worker processes
+
+    Results are streamed back as chunks finish, so they arrive grouped by
+    chunk but not necessarily in seed order.
+
+    Args:
+        seeds (range): The seeds to play
+        player_names: The names of the players, in seating order
+        processes (int): The number of worker processes, defaults to the number of cores
+        chunk_size (int): The number of games sent to a worker at a time
+        metrics (MetricsCollector): Collector that the metrics of every game are merged into, if any
+        stats (SimulationStats): Stats that every result is merged into, if any, each chunk
+            is aggregated where it was played so only the partial stats are sent back
+        checkpoint (SweepCheckpoint): Progress of the sweep, if any: only its unfinished chunks are
+            played, and each chunk is marked finished once all its results have been consumed
+        counts (bool): Count the cards drawn and special cards played of every game into its result
+
+    Returns:
+        Iterator[GameResult]: The outcome of every game
+
+    Complexity:
+        Best Case Complexity: o(g/w) game plays where g is the number of seeds and w the number of workers
+        Worst Case Complexity: o(g/w) game plays
+    """
+    processes = os.cpu_count() if processes is None else processes
+    player_names = list(player_names)
+
+    if processes <= 1 and stats is None and checkpoint is None:
+        for seed in seeds:
+            yield play_seed(seed, player_names, metrics, counts)
+        return
+
+    chunks = _chunks(seeds, chunk_size) if checkpoint is None else checkpoint.pending()
+    jobs = [(chunk, player_names, metrics is not None, stats is not None, counts) for chunk in chunks]
+    with Pool(processes) if processes > 1 else nullcontext() as pool:
+        played = map(_star_play_chunk, jobs) if pool is None else pool.imap_unordered(_star_play_chunk, jobs)
+        for chunk, results, chunk_metrics, chunk_stats in played:
+            if metrics is not None:
+                metrics.merge(chunk_metrics)
+            if stats is not None:
+                stats.merge(chunk_stats)
+            yield from results
+            if checkpoint is not None:
+                checkpoint.chunk_done(chunk)
+
+
+if __name__ == "__main__":
+
+    p = argparse.ArgumentParser(description="Play a range of seeded games in parallel.")
+    p.add_argument("start", type=int, help="First seed to play.")
+    p.add_argument("stop", type=int, help="Seed to stop at (exclusive).")
+    p.add_argument("players", nargs="+", help="Player names, in seating order.")
+    p.add_argument("--processes", type=int, default=None, help="Worker processes (default: all cores).")
+    p.add_argument("--chunk-size", type=int, default=256, help="Games per worker task.")
+    p.add_argument("--quiet", action="store_true", help="Only print the summary.")
+    p.add_argument("--metrics", help="Write the merged game metrics to this JSON file.")
+    p.add_argument("--stats", help="Write win rates, histograms and special card frequencies to this JSON file.")
+    p.add_argument("--output", help="Write one result per game to this .csv or .jsonl file.")
+    p.add_argument("--format", choices=FORMATS, help="Format of --output (default: from its extension).")
+    p.add_argument("--store", help="Write one fixed-width record per game to this binary file, see result_store.")
+    p.add_argument("--checkpoint", help="Save the progress of the sweep to this file.")
+    p.add_argument("--checkpoint-every", type=float, default=60.0, help="Seconds between checkpoints.")
+    p.add_argument("--resume", action="store_true", help="Continue the sweep saved in --checkpoint.")
+    args = p.parse_args()
+
+    if len(args.players) < 2:
+        p.error("at least two players are needed")
+    if args.resume and not args.checkpoint:
+        p.error("--resume needs --checkpoint")
+    if args.resume and not os.path.exists(args.checkpoint):
+        p.error(f"no checkpoint to resume at {args.checkpoint}")
+
+    start_time = time.perf_counter()
+    games = 0
+    seeds = range(args.start, args.stop)
+    metrics = MetricsCollector() if args.metrics else None
+    stats = SimulationStats() if args.stats else None
+    output_format = args.format or ("jsonl" if (args.output or "").endswith(".jsonl") else "csv")
+    checkpoint = None
+    if args.checkpoint:
+        config = {
+            "players": args.players, "metrics": metrics is not None, "stats": stats is not None,
+            "output": args.output, "format": output_format, "store": args.store,
+        }
+        if args.resume:
+            try:
+                checkpoint = SweepCheckpoint.load(
+                    args.checkpoint, seeds, config, args.chunk_size, args.checkpoint_every
+                )
+            except CheckpointMismatch as e:
+                p.error(str(e))
+            metrics, stats = checkpoint.metrics, checkpoint.stats
+            print(f"# resuming after {checkpoint.games} games")
+        else:
+            checkpoint = SweepCheckpoint(args.checkpoint, seeds, config, args.chunk_size, args.checkpoint_every)
+            checkpoint.metrics, checkpoint.stats = metrics, stats
+    writer = None
+    if args.output:
+        if checkpoint is not None and checkpoint.output_offset > 0:
+            # drop whatever was written after the checkpoint, those games are played again
+            stream = open(args.output, "r+", newline="")
+            stream.seek(checkpoint.output_offset)
+            stream.truncate()
+            writer = ResultWriter(stream, output_format)
+            writer.header_written = True
+        else:
+            writer = ResultWriter(open(args.output, "w", newline=""), output_format)
+        if checkpoint is not None:
+            checkpoint.writer = writer
+    store = None
+    if args.store:
+        store = ResultStore(args.store, checkpoint.store_count if args.resume else None)
+        if checkpoint is not None:
+            checkpoint.store = store
+    for result in run_batch(
+        seeds, args.players, args.processes, args.chunk_size, metrics, stats, checkpoint, store is not None
+    ):
+        games += 1
+        if writer is not None:
+            writer.write(result)
+        if store is not None:
+            store.append(result)
+        if not args.quiet:
+            print(result)
+    if checkpoint is not None:
+        checkpoint.save()
+    if writer is not None:
+        writer.close()
+        writer.stream.close()
+    if store is not None:
+        store.close()
+    elapsed = time.perf_counter() - start_time
+
+    rate = games / elapsed if elapsed > 0 else float("inf")
+    print(f"# {games} games in {elapsed:.2f}s ({rate:.0f} games/sec)")
+    if checkpoint is not None:
+        share = checkpoint.save_time / elapsed * 100 if elapsed > 0 else 0.0
+        print(f"# {checkpoint.saves} checkpoints in {checkpoint.save_time:.3f}s ({share:.2f}% of the sweep)")
+
+    if metrics is not None:
+        with open(args.metrics, "w") as f:
+            json.dump(metrics.to_dict(), f, indent=2)
+
+    if stats is not None:
+        with open(args.stats, "w") as f:
+            json.dump(stats.to_dict(), f, indent=2)
@@ -0,0 +1,486 @@
+"""
+Benchmarks for the hot paths of the game engine.
+
+Measures games/sec for Game.play_game (and for the same games played turn by
+turn with Game.iter_turns) and the per-call latency of
+Player.play_card, GameBoard.draw_card, GameBoard.reshuffle (in both modes),
+Game.generate_cards and Game.reverse_players, sweeping player count and hand
+size, the overhead of choosing cards through a player strategy and of writing
+a transcript, the cost per turn of tables of up to 50 players on several decks,
+the cost of checkpointing a seed sweep, and of writing and reading per-game
+results as CSV and as a binary results store. Results are stored as JSON so runs can be compared.
+
+Usage:
+```
+python benchmark.py --output bench.json
+python benchmark.py --output new.json --compare bench.json
+python benchmark.py --quick --only play_game
+```
+"""
+from __future__ import annotations
+import argparse
+import csv
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from batch_runner import GameResult, run_batch
+from checkpoint import SweepCheckpoint
+from config import Config
+from game import Game, GameOutcome
+from game_board import GameBoard
+from player import Player
+from random_gen import RandomGen
+from result_store import ResultStore, load_results, np
+from stats import ResultWriter, SimulationStats
+from strategy import LowestCardStrategy, PlayableView
+from transcript import TranscriptWriter
+from data_structures import *
+
+__author__ = "Divyana (Divi) Ahuja"
+
+PLAYER_COUNTS = [2, 4, 6, 8]
+HAND_SIZES = [2, 7, 12]
+PLAY_CARD_HAND_SIZES = [5, 20, 40]
+RESHUFFLE_SIZES = [20, 60, 100]
+TABLE_SIZES = [(2, 1), (10, 1), (25, 2), (50, 4)] # (players, decks)
+
+
+def _best_time(func, number: int, repeat: int) -> float:
+    """
+    Returns the best time in seconds of `repeat` runs of `number` calls to func.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _make_players(count: int) -> ArrayList[Player]:
+    """
+    Returns `count` fresh players in seating order.
+    """
+    players: ArrayList[Player] = ArrayList(count)
+    for i in range(count):
+        players.insert(i, Player(f"P{i}"))
+    return players
+
+
+def _new_game(seed: int, players: int) -> Game:
+    """
+    Returns an initialised game with its own random stream.
+    """
+    game = Game(RandomGen(seed))
+    game.initialise_game(_make_players(players))
+    return game
+
+
+def bench_play_game(games: int, repeat: int) -> dict:
+    """
+    games/sec of full games (setup included) for every player count and starting hand size
+    """
+    results = {}
+    init_cards = Config.NUM_CARDS_AT_INIT
+    try:
+        for hand_size in HAND_SIZES:
+            Config.NUM_CARDS_AT_INIT = hand_size
+            for players in PLAYER_COUNTS:
+                if players * hand_size >= Config.DECK_SIZE:
+                    continue
+                seeds = iter(range(sys.maxsize))
+                elapsed = _best_time(
+                    lambda: _new_game(next(seeds), players).play_game(), games, repeat
+                )
+                results[f"play_game/players={players}/hand={hand_size}"] = {
+                    "games_per_sec": games / elapsed,
+                }
+    finally:
+        Config.NUM_CARDS_AT_INIT = init_cards
+    return results
+
+
+def bench_step_api(games: int, repeat: int) -> dict:
+    """
+    games/sec of the same games played to completion with play_game and turn by turn with iter_turns
+    """
+    results = {}
+    drivers = {
+        "play_game": lambda game: game.play_game(),
+        "iter_turns": lambda game: sum(1 for _ in game.iter_turns()),
+    }
+    for name, drive in drivers.items():
+        seeds = iter(range(sys.maxsize))
+        elapsed = _best_time(lambda: drive(_new_game(next(seeds), 4)), games, repeat)
+        results[f"step_api/{name}"] = {"games_per_sec": games / elapsed}
+    return results
+
+
+def bench_transcript(games: int, repeat: int) -> dict:
+    """
+    games/sec of games played with no transcript, a full transcript and a delta transcript kept in memory
+    """
+    results = {}
+    writers = {
+        "none": None,
+        "full": lambda: TranscriptWriter(io.StringIO(), "full"),
+        "delta": lambda: TranscriptWriter(io.StringIO(), "delta", full_every=10),
+    }
+    for name, writer in writers.items():
+        def play(seeds=iter(range(sys.maxsize)), writer=writer) -> None:
+            game = _new_game(next(seeds), 4)
+            if writer is not None:
+                game.attach_transcript(writer())
+            game.play_game()
+        elapsed = _best_time(play, games, repeat)
+        results[f"transcript/{name}"] = {"games_per_sec": games / elapsed}
+    return results
+
+
+def bench_table_size(games: int, repeat: int) -> dict:
+    """
+    us per turn of play_game (setup excluded) from 2 to 50 players, with enough decks to deal them
+    """
+    results = {}
+    for players, decks in TABLE_SIZES:
+        best = float("inf")
+        for _ in range(repeat):
+            tables = []
+            for seed in range(games):
+                game = Game(RandomGen(seed), decks)
+                game.initialise_game(_make_players(players))
+                tables.append(game)
+            start = time.perf_counter()
+            for game in tables:
+                game.play_game()
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed / sum(game.turns for game in tables))
+        results[f"table_size/players={players}/decks={decks}"] = {"us_per_turn": best * 1e6}
+    return results
+
+
+def bench_checkpoint(games: int, repeat: int) -> dict:
+    """
+    Cost of one checkpoint save of a sweep's progress and stats, and its share of the sweep
+    time when saving after every chunk and at the default interval of SweepCheckpoint
+    """
+    names = ["0", "1", "2", "3"]
+    seeds = range(games)
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = SweepCheckpoint(os.path.join(tmp, "sweep.ckpt"), seeds, {"players": names}, 50)
+        checkpoint.stats = SimulationStats()
+        start = time.perf_counter()
+        for _ in run_batch(seeds, names, 1, 50, stats=checkpoint.stats, checkpoint=checkpoint):
+            pass
+        sweep = time.perf_counter() - start
+        save = _best_time(checkpoint.save, 20, repeat) / 20
+    chunks = -(-games // 50)
+    return {
+        "checkpoint/save": {"us_per_call": save * 1e6},
+        "checkpoint/every_chunk": {"pct_of_sweep": save * chunks / sweep * 100},
+        "checkpoint/default_interval": {"pct_of_sweep": save / checkpoint.interval * 100},
+    }
+
+
+def bench_result_store(calls: int, repeat: int) -> dict:
+    """
+    us per result to write per-game results as CSV and to a ResultStore, and to read the
+    mean game length back (by parsing the CSV, and through load_results when NumPy is installed)
+    """
+    names = ["0", "1", "2", "3"]
+    results = [
+        GameResult(seed, names, seed % 4, 20 + seed % 50, seed % 3, GameOutcome.WIN, 40 + seed % 30, (1, 2, 3, 1, 1))
+        for seed in range(calls)
+    ]
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, store_path = os.path.join(tmp, "results.csv"), os.path.join(tmp, "results.bin")
+
+        def write_csv() -> None:
+            with open(csv_path, "w", newline="") as f, ResultWriter(f, "csv") as writer:
+                for result in results:
+                    writer.write(result)
+
+        def write_store() -> None:
+            with ResultStore(store_path) as store:
+                for result in results:
+                    store.append(result)
+
+        def read_csv() -> float:
+            with open(csv_path, newline="") as f:
+                turns = [int(row["turns"]) for row in csv.DictReader(f)]
+            return sum(turns) / len(turns)
+
+        timings["write/csv"] = _best_time(write_csv, 1, repeat)
+        timings["write/store"] = _best_time(write_store, 1, repeat)
+        timings["read/csv"] = _best_time(read_csv, 1, repeat)
+        if np is not None:
+            timings["read/store"] = _best_time(lambda: float(load_results(store_path)["turns"].mean()), 1, repeat)
+    return {f"result_store/{name}": {"us_per_call": elapsed / calls * 1e6} for name, elapsed in timings.items()}
+
+
+def bench_play_card(calls: int, repeat: int) -> dict:
+    """
+    Latency of Player.play_card for hands of different sizes, the played card is put back
+    """
+    results = {}
+    rng = RandomGen(1)
+    for hand_size in PLAY_CARD_HAND_SIZES:
+        player = Player("P0")
+        deck = Game(rng).generate_cards()
+        for i in range(hand_size):
+            player.add_card(deck[i])
+        states = [deck[i] for i in range(hand_size, len(deck))]
+        position = [0]
+
+        def call() -> None:
+            top = states[position[0] % len(states)]
+            position[0] += 1
+            card = player.play_card(top.color, top.label)
+            if card is not None:
+                player.add_card(card)
+
+        elapsed = _best_time(call, calls, repeat)
+        results[f"play_card/hand={hand_size}"] = {"us_per_call": elapsed / calls * 1e6}
+    return results
+
+
+class _HighestCardStrategy(LowestCardStrategy):
+    """
+    Plays the last playable card, so every call builds the full playable list.
+    """
+
+    def choose_card(self, view: PlayableView):
+        playable = view.playable()
+        return playable[-1] if playable else None
+
+
+def bench_strategy(calls: int, repeat: int) -> dict:
+    """
+    Overhead of choosing cards through a strategy: the bare hand lookup against
+    Player.play_card with the default strategy and with one that reads every playable card
+    """
+    results = {}
+    rng = RandomGen(7)
+    hand_size = Config.NUM_CARDS_AT_INIT
+    deck = Game(rng).generate_cards()
+    states = [deck[i] for i in range(hand_size, len(deck))]
+    for name, strategy in (("direct", None), ("default", LowestCardStrategy()), ("playable_list", _HighestCardStrategy())):
+        player = Player("P0", strategy)
+        for i in range(hand_size):
+            player.add_card(deck[i])
+        position = [0]
+
+        def call() -> None:
+            top = states[position[0] % len(states)]
+            position[0] += 1
+            if strategy is None:
+                card = player.hand.lowest_playable(top.color, top.label)
+                if card is not None:
+                    player.hand.remove(card)
+            else:
+                card = player.play_card(top.color, top.label)
+            if card is not None:
+                player.add_card(card)
+
+        elapsed = _best_time(call, calls, repeat)
+        results[f"strategy/{name}"] = {"us_per_call": elapsed / calls * 1e6}
+    return results
+
+
+def bench_draw_card(calls: int, repeat: int) -> dict:
+    """
+    Latency of GameBoard.draw_card from a full draw pile, without reshuffles
+    """
+    game = Game(RandomGen(2))
+    deck = game.generate_cards()
+    draws = min(calls, len(deck))
+    best = float("inf")
+    for _ in range(repeat * max(1, calls // draws)):
+        board = GameBoard(deck, game.rng)
+        start = time.perf_counter()
+        for _ in range(draws):
+            board.draw_card()
+        best = min(best, time.perf_counter() - start)
+    return {"draw_card": {"us_per_call": best / draws * 1e6}}
+
+
+def bench_reshuffle(calls: int, repeat: int) -> dict:
+    """
+    Latency of GameBoard.reshuffle for discard piles of different sizes, in the
+    legacy mode and in the swap mode together with drawing the whole pile back
+    """
+    results = {}
+    game = Game(RandomGen(3))
+    deck = game.generate_cards()
+    for swap in (False, True):
+        for size in RESHUFFLE_SIZES:
+            best = float("inf")
+            for _ in range(repeat):
+                total = 0.0
+                for _ in range(calls):
+                    board = GameBoard(deck, game.rng, swap)
+                    for _ in range(len(deck)):
+                        board.draw_card()
+                    for i in range(size):
+                        board.discard_card(deck[i])
+                    start = time.perf_counter()
+                    board.reshuffle()
+                    total += time.perf_counter() - start
+                best = min(best, total)
+            mode = "swap" if swap else "legacy"
+            results[f"reshuffle/{mode}/discard={size}"] = {"us_per_call": best / calls * 1e6}
+    return results
+
+
+def bench_random_draw(calls: int, repeat: int) -> dict:
+    """
+    Latency of GameBoard.draw_card after a swap reshuffle, when every draw picks a random card
+    """
+    game = Game(RandomGen(6))
+    deck = game.generate_cards()
+    draws = len(deck) - 1
+    best = float("inf")
+    for _ in range(repeat * max(1, calls // draws)):
+        board = GameBoard(deck, game.rng, True)
+        for _ in range(len(deck)):
+            board.discard_card(board.draw_card())
+        board.reshuffle()
+        start = time.perf_counter()
+        for _ in range(draws):
+            board.draw_card()
+        best = min(best, time.perf_counter() - start)
+    return {"draw_card/random": {"us_per_call": best / draws * 1e6}}
+
+
+def bench_generate_cards(calls: int, repeat: int) -> dict:
+    """
+    Latency of Game.generate_cards, which includes the deck shuffle
+    """
+    game = Game(RandomGen(4))
+    elapsed = _best_time(game.generate_cards, calls, repeat)
+    return {"generate_cards": {"us_per_call": elapsed / calls * 1e6}}
+
+
+def bench_reverse_players(calls: int, repeat: int) -> dict:
+    """
+    Latency of Game.reverse_players for every player count
+    """
+    results = {}
+    for players in PLAYER_COUNTS:
+        game = _new_game(5, players)
+        elapsed = _best_time(game.reverse_players, calls, repeat)
+        results[f"reverse_players/players={players}"] = {"us_per_call": elapsed / calls * 1e6}
+    return results
+
+
+# name -> (function, number of games or calls per run)
+BENCHMARKS = {
+    "play_game": (bench_play_game, 200),
+    "step_api": (bench_step_api, 200),
+    "transcript": (bench_transcript, 200),
+    "table_size": (bench_table_size, 50),
+    "checkpoint": (bench_checkpoint, 500),
+    "result_store": (bench_result_store, 100000),
+    "play_card": (bench_play_card, 20000),
+    "strategy": (bench_strategy, 20000),
+    "draw_card": (bench_draw_card, 20000),
+    "reshuffle": (bench_reshuffle, 200),
+    "random_draw": (bench_random_draw, 20000),
+    "generate_cards": (bench_generate_cards, 2000),
+    "reverse_players": (bench_reverse_players, 20000),
+}
+
+
+def run(only=None, quick: bool = False, repeat: int = 3) -> dict:
+    """
+    Runs the selected benchmarks and returns their results keyed by case name
+
+    Args:
+        only: Names of the benchmarks to run, defaults to all of them
+        quick (bool): Run a tenth of the calls, for a fast smoke check
+        repeat (int): The number of runs per case, the best one is kept
+
+    Returns:
+        dict: The results of every case
+    """
+    results = {}
+    for name, (bench, number) in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        number = max(1, number // 10) if quick else number
+        results.update(bench(number, repeat))
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """
+    Prints the change of every case against a baseline run
+
+    Args:
+        results (dict): The results of this run
+        baseline (dict): The results of the baseline run
+        threshold (float): The relative slowdown above which a case counts as a regression
+
+    Returns:
+        bool: True if no case regressed
+    """
+    ok = True
+    for case, values in results.items():
+        if case not in baseline:
+            continue
+        for metric, value in values.items():
+            old = baseline[case].get(metric)
+            if not old:
+                continue
+            # games_per_sec is better when higher, us_per_call when lower
+            speedup = value / old if metric == "games_per_sec" else old / value
+            flag = ""
+            if speedup < 1 / (1 + threshold):
+                flag = "  REGRESSION"
+                ok = False
+            print(f"{case:40} {metric:14} {old:12.2f} -> {value:12.2f}  x{speedup:.2f}{flag}")
+    return ok
+
+
+if __name__ == "__main__":
+
+    p = argparse.ArgumentParser(description="Benchmark the game engine hot paths.")
+    p.add_argument("--output", help="Write the results to this JSON file.")
+    p.add_argument("--compare", help="Compare against the results in this JSON file.")
+    p.add_argument("--threshold", type=float, default=0.10, help="Slowdown counted as a regression (default 10%%).")
+    p.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Only run these benchmarks.")
+    p.add_argument("--repeat", type=int, default=3, help="Runs per case, the best is kept.")
+    p.add_argument("--quick", action="store_true", help="Run a tenth of the calls.")
+    args = p.parse_args()
+
+    results = run(args.only, args.quick, args.repeat)
+    for case, values in results.items():
+        for metric, value in values.items():
+            print(f"{case:40} {metric:14} {value:12.2f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        print()
+        if not compare(results, baseline, args.threshold):
+            sys.exit(1)
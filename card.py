@@ -62,24 +62,66 @@ class CardLabel(IntEnum):
         pass
         '''
 
+# number of labels per colour, a card's code is color * NUM_LABELS + label
+NUM_COLORS = len(CardColor)
+NUM_LABELS = len(CardLabel)
+NUM_CARD_CODES = NUM_COLORS * NUM_LABELS
+
+
 class Card:
-    def __init__(self, color: CardColor, label: CardLabel) -> None:
+    """
+    A card is identified by its integer code (color * NUM_LABELS + label), which orders
+    cards by color then label. Cards are immutable and interned: Card(color, label)
+    returns the single shared object for that pair from CARD_TABLE, so every deck
+    in every game reuses the same NUM_CARD_CODES objects.
+    """
+
+    __slots__ = ("color", "label", "code")
+
+    def __new__(cls, color: CardColor, label: CardLabel) -> Card:
         """
-        Initialize the card with the given color and value.
+        Return the card with the given color and value.
 
         Args:
             color (CardColor): The color of the card.
             value (CardValue): The value of the card.
 
         Returns:
-            None
+            Card: The shared card for this color and value.
 
         Complexity:
             Best Case:o(1)
             Worst Case:o(1)
         """
-        self.color = color
-        self.label = label
+        return CARD_TABLE[color * NUM_LABELS + label]
+
+    @classmethod
+    def _create(cls, code: int) -> Card:
+        """
+        Builds the card for a code, only used to fill CARD_TABLE.
+        """
+        card = object.__new__(cls)
+        card.color = CardColor(code // NUM_LABELS)
+        card.label = CardLabel(code % NUM_LABELS)
+        card.code = code
+        return card
+
+    @staticmethod
+    def from_code(code: int) -> Card:
+        """
+        Return the card with the given integer code.
+
+        Args:
+            code (int): The code of the card, color * NUM_LABELS + label.
+
+        Returns:
+            Card: The shared card for this code.
+
+        Complexity:
+            Best Case:o(1)
+            Worst Case:o(1)
+        """
+        return CARD_TABLE[code]
     
     def __str__(self) -> str:
         """
@@ -107,9 +149,60 @@ class Card:
         Check if this card is equal to another card.
 
         Args:
-            other (Card): The other card to compare to.
+            other (Card): The other card, or card code, to compare to.
 
         Returns:
             bool: True if this card is equal to the other card, False otherwise.
         """
-        return self.color == other.color and self.label == other.label
+        if isinstance(other, Card):
+            return self.code == other.code
+        return self.code == other
+
+    def __hash__(self) -> int:
+        """
+        Cards hash as their integer code.
+        """
+        return self.code
+
+    def __int__(self) -> int:
+        """
+        Return the integer code of the card.
+        """
+        return self.code
+
+    def __reduce__(self):
+        """
+        Pickle and copy cards by code so they stay interned.
+        """
+        return (Card.from_code, (self.code,))
+
+
+# One shared Card object per code, indexed by Card.code
+CARD_TABLE = [None] * NUM_CARD_CODES
+for _code in range(NUM_CARD_CODES):
+    CARD_TABLE[_code] = Card._create(_code)
+del _code
+
+# Playability of every card on every position, indexed like a card code by the current
+# colour and label: bit c of PLAYABLE_MASK[current_color * NUM_LABELS + current_label]
+# is set if the card with code c is black, or has the current colour or label.
+# AND it with Hand.mask for all the playable cards of a hand at once.
+PLAYABLE_MASK = [0] * NUM_CARD_CODES
+for _state in range(NUM_CARD_CODES):
+    for _code in range(NUM_CARD_CODES):
+        if (_code // NUM_LABELS == CardColor.BLACK or _code // NUM_LABELS == _state // NUM_LABELS
+                or _code % NUM_LABELS == _state % NUM_LABELS):
+            PLAYABLE_MASK[_state] |= 1 << _code
+del _state, _code
+
+
+def is_playable(card: Card, current_color: CardColor, current_label: CardLabel) -> bool:
+    """
+    Returns True if the card can be played on the current colour and label
+
+    Complexity:
+        Best Case Complexity:o(1)
+        Worst Case Complexity:o(1)
+        - one lookup in PLAYABLE_MASK
+    """
+    return PLAYABLE_MASK[current_color * NUM_LABELS + current_label] >> card.code & 1 == 1
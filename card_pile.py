@@ -0,0 +1,220 @@
+from __future__ import annotations
+from typing import Iterator
+from card import Card
+
+__author__ = "Divyana (Divi) Ahuja"
+
+
+class CardPile:
+    """
+    Stack of cards used for the draw and discard piles.
+
+    Works like ArrayStack (same push/pop/peek behaviour and errors, and the
+    cards are kept in `array` from the bottom of the pile up) but its contents
+    can be copied or replaced in one step, which is what snapshots and forks
+    of a game need.
+    """
+
+    def __init__(self, max_capacity: int) -> None:
+        """
+        Constructor for the CardPile class
+
+        Args:
+            max_capacity (int): The maximum number of cards the pile can hold
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        self.array = [] # bottom of the pile first, top of the pile last
+        self.max_capacity = max_capacity
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cards in the pile
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return len(self.array)
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if the pile has no cards
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return len(self.array) == 0
+
+    def is_full(self) -> bool:
+        """
+        Returns True if no more cards can be pushed
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return len(self.array) >= self.max_capacity
+
+    def push(self, card: Card) -> None:
+        """
+        Puts a card on top of the pile
+
+        Args:
+            card (Card): The card to be pushed
+
+        Returns:
+            None
+
+        Raises:
+            Exception: if the pile is full
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        if len(self.array) >= self.max_capacity:
+            raise Exception("Stack is full")
+        self.array.append(card)
+
+    def fill(self, cards) -> None:
+        """
+        Puts cards on top of the pile in one step, the last of them ends up on top
+
+        Args:
+            cards: The cards to be pushed, in push order
+
+        Returns:
+            None
+
+        Raises:
+            Exception: if the cards do not all fit, the pile is left as it was
+
+        Complexity:
+            Best Case Complexity:o(k) where k is the number of cards pushed
+            Worst Case Complexity:o(k)
+            - a single block extend of the card references
+        """
+        cards = list(cards)
+        if len(self.array) + len(cards) > self.max_capacity:
+            raise Exception("Stack is full")
+        self.array.extend(cards)
+
+    def pop(self) -> Card:
+        """
+        Takes the card on top of the pile
+
+        Returns:
+            Card: The card that was on top
+
+        Raises:
+            Exception: if the pile is empty
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        if not self.array:
+            raise Exception("Stack is empty")
+        return self.array.pop()
+
+    def peek(self) -> Card:
+        """
+        Returns the card on top of the pile without removing it
+
+        Raises:
+            Exception: if the pile is empty
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        if not self.array:
+            raise Exception("Stack is empty")
+        return self.array[-1]
+
+    def pop_random(self, rng) -> Card:
+        """
+        Takes a card chosen uniformly at random from the pile
+
+        The chosen card is swapped with the top card and then popped, so the
+        order of the rest of the pile changes but nothing is moved or copied.
+
+        Args:
+            rng (RandomGen): The random stream used to pick the card
+
+        Returns:
+            Card: The card that was taken
+
+        Raises:
+            Exception: if the pile is empty
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        array = self.array
+        if not array:
+            raise Exception("Stack is empty")
+        i = rng.randint(0, len(array) - 1)
+        array[i], array[-1] = array[-1], array[i]
+        return array.pop()
+
+    def swap(self, other: CardPile) -> None:
+        """
+        Exchanges the cards of this pile with the cards of another pile
+
+        Args:
+            other (CardPile): The pile to swap with, it must have the same capacity
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - only the backing lists are exchanged
+        """
+        self.array, other.array = other.array, self.array
+
+    def clear(self) -> None:
+        """
+        Removes every card from the pile
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        self.array = []
+
+    def copy(self) -> CardPile:
+        """
+        Returns an independent pile holding the same cards
+
+        The cards themselves are shared, they are immutable.
+
+        Complexity:
+            -n is the number of cards in the pile
+            Best Case Complexity:o(n)
+            Worst Case Complexity:o(n)
+            - a single block copy of the card references
+        """
+        other = CardPile(self.max_capacity)
+        other.array = self.array[:]
+        return other
+
+    def __iter__(self) -> Iterator[Card]:
+        """
+        Yields the cards from the bottom of the pile to the top
+
+        Complexity:
+            Best Case Complexity:o(n) where n is the number of cards in the pile
+            Worst Case Complexity:o(n)
+        """
+        return iter(self.array)
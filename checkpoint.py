@@ -0,0 +1,219 @@
+"""
+Crash safe checkpoints of long seed sweeps run with batch_runner.
+
+A SweepCheckpoint records which chunks of seeds are finished, the running
+aggregates (SimulationStats and MetricsCollector) of exactly those chunks,
+and how far the per-game output file and results store had been written.
+Every game plays from its own RandomGen(seed), so no random state needs
+saving. It is saved at most every `interval` seconds, always between
+chunks, by writing a temporary file next to the checkpoint, syncing it to
+disk and renaming it over the old one, so a crash leaves either the old or
+the new checkpoint and never half of one.
+
+On resume only the unfinished chunks are played. Output written after the
+last checkpoint is cut off first, so every game is counted and written
+exactly once.
+
+Usage:
+```
+python batch_runner.py 0 100000000 Alice Bob --quiet --stats stats.json --checkpoint sweep.ckpt
+python batch_runner.py 0 100000000 Alice Bob --quiet --stats stats.json --checkpoint sweep.ckpt --resume
+```
+"""
+from __future__ import annotations
+import bisect
+import os
+import pickle
+import time
+from typing import Iterator
+
+__author__ = "Divyana (Divi) Ahuja"
+
+
+class CheckpointMismatch(Exception):
+    """
+    Raised when a checkpoint is resumed with a different sweep than the one it was saved from
+    """
+
+
+class SweepCheckpoint:
+    """
+    Progress of a sweep over a range of seeds, played in chunks of chunk_size seeds
+    """
+
+    VERSION = 3
+
+    def __init__(self, path: str, seeds: range, config: dict, chunk_size: int, interval: float = 60.0) -> None:
+        """
+        Constructor for the SweepCheckpoint class, for a sweep that has not started
+
+        Args:
+            path (str): The file the checkpoint is saved to
+            seeds (range): The seeds of the whole sweep
+            config (dict): Everything else a resumed sweep must agree on, e.g. the player names
+            chunk_size (int): The number of seeds per chunk
+            interval (float): The minimum number of seconds between two saves
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.seeds = seeds
+        self.config = config
+        self.chunk_size = chunk_size
+        self.interval = interval
+        self.done = [] # sorted, disjoint and non touching [start, stop) seed ranges that are finished
+        self.games = 0
+        self.stats = None   # SimulationStats of the finished chunks, if collected
+        self.metrics = None # MetricsCollector of the finished chunks, if collected
+        self.writer = None  # ResultWriter of the per-game output, if any
+        self.output_offset = 0
+        self.store = None   # ResultStore of the per-game records, if any
+        self.store_count = 0
+        self.saves = 0
+        self.save_time = 0.0
+        self.last_save = time.monotonic()
+
+    def is_done(self, chunk: range) -> bool:
+        """
+        Returns True if every seed of the chunk is finished
+
+        Complexity:
+            Best Case Complexity:o(log r) where r is the number of finished ranges
+            Worst Case Complexity:o(log r)
+        """
+        i = bisect.bisect_right(self.done, [chunk.start, float("inf")]) - 1
+        return i >= 0 and self.done[i][0] <= chunk.start and chunk.stop <= self.done[i][1]
+
+    def pending(self) -> Iterator[range]:
+        """
+        Yields the chunks of the sweep that are not finished, in seed order
+        """
+        for start in range(0, len(self.seeds), self.chunk_size):
+            chunk = self.seeds[start:start + self.chunk_size]
+            if not self.is_done(chunk):
+                yield chunk
+
+    def chunk_done(self, chunk: range) -> None:
+        """
+        Marks a chunk as finished, its results must already be in the aggregates and
+        the output, and saves the checkpoint if the last save is older than the interval
+
+        Args:
+            chunk (range): The seeds that were played
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(log r) where r is the number of finished ranges
+            Worst Case Complexity:o(r) plus the cost of save
+            - chunks finish nearly in order, so r stays around the number of workers
+        """
+        done = self.done
+        i = bisect.bisect_left(done, [chunk.start])
+        new = [chunk.start, chunk.stop]
+        if i > 0 and done[i - 1][1] == chunk.start:# joins the range before it
+            i -= 1
+            new[0] = done[i][0]
+            del done[i]
+        if i < len(done) and done[i][0] == chunk.stop:# and the range after it
+            new[1] = done[i][1]
+            del done[i]
+        done.insert(i, new)
+        self.games += len(chunk)
+        if time.monotonic() - self.last_save >= self.interval:
+            self.save()
+
+    def finished(self) -> bool:
+        """
+        Returns True once every seed of the sweep is finished
+        """
+        return len(self.seeds) == 0 or self.done == [[self.seeds.start, self.seeds.stop]]
+
+    def save(self) -> None:
+        """
+        Writes the checkpoint atomically: to a temporary file that is synced to disk and
+        renamed over the previous checkpoint
+
+        Complexity:
+            Best Case Complexity:o(s) where s is the size of the aggregates
+            Worst Case Complexity:o(s) plus one fsync
+        """
+        start = time.perf_counter()
+        if self.writer is not None:
+            self.writer.flush()
+            self.output_offset = self.writer.stream.tell()
+        if self.store is not None:
+            self.store.flush()
+            self.store_count = len(self.store)
+        state = {
+            "version": self.VERSION,
+            "seeds": (self.seeds.start, self.seeds.stop, self.seeds.step),
+            "config": self.config,
+            "chunk_size": self.chunk_size,
+            "done": self.done,
+            "games": self.games,
+            "stats": self.stats,
+            "metrics": self.metrics,
+            "output_offset": self.output_offset,
+            "store_count": self.store_count,
+        }
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        _fsync_dir(os.path.dirname(os.path.abspath(self.path)))
+        self.saves += 1
+        self.last_save = time.monotonic()
+        self.save_time += time.perf_counter() - start
+
+    @classmethod
+    def load(cls, path: str, seeds: range, config: dict, chunk_size: int, interval: float = 60.0) -> SweepCheckpoint:
+        """
+        Reads a checkpoint to resume the sweep it was saved from
+
+        Args:
+            path (str): The checkpoint file
+            seeds (range): The seeds of the sweep being resumed
+            config (dict): The settings of the sweep being resumed
+            chunk_size (int): The number of seeds per chunk
+            interval (float): The minimum number of seconds between two saves
+
+        Returns:
+            SweepCheckpoint: The checkpoint
+
+        Raises:
+            CheckpointMismatch: if the checkpoint was saved by a different sweep
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        saved = (state["version"], range(*state["seeds"]), state["config"], state["chunk_size"])
+        if saved != (cls.VERSION, seeds, config, chunk_size):
+            raise CheckpointMismatch(f"{path} was saved by a different sweep: {saved}")
+        checkpoint = cls(path, seeds, config, chunk_size, interval)
+        checkpoint.done = state["done"]
+        checkpoint.games = state["games"]
+        checkpoint.stats = state["stats"]
+        checkpoint.metrics = state["metrics"]
+        checkpoint.output_offset = state["output_offset"]
+        checkpoint.store_count = state["store_count"]
+        return checkpoint
+
+
+def _fsync_dir(path: str) -> None:
+    """
+    Syncs a directory so a rename inside it survives a crash, where the platform allows it.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -8,5 +8,17 @@ class Config:
     DECK_SIZE = 112
     NUM_CARDS_AT_INIT = 7
 
-    # Optional for debugging purposes, not required for the game
-    MAX_ROUNDS_PER_PLAYER = 100
+    # Table size, see Game.initialise_game: each deck is DECK_SIZE cards
+    NUM_DECKS = 1
+    MAX_DECKS = 8
+    MIN_PLAYERS = 2
+    MAX_PLAYERS = 50
+
+    # Reshuffle by swapping the piles (keeping the top discard) and drawing at random
+    # afterwards, instead of shuffling the discard pile into the draw pile
+    SWAP_RESHUFFLE = False
+
+    # Limits on how long a game may run, see Game.play_game
+    # normal games stay well below both, long games run past 100 rounds
+    MAX_ROUNDS_PER_PLAYER = 1000 # rounds before the game is aborted
+    MAX_ROUNDS_WITHOUT_PROGRESS = 500 # rounds without any hand getting smaller than ever before
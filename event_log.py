@@ -0,0 +1,420 @@
+"""
+Compact binary log of the events of a game, and a replayer that rebuilds the
+state of the game at any turn from it.
+
+A log starts with a header holding the position the game was in when the log
+was attached (names, hands, piles, turn order, current colour and label),
+followed by fixed size 4 byte events: type, seat and a 16 bit argument
+(a card code, a colour or a card count).
+
+Usage:
+```
+with open("game.unolog", "wb") as f:
+    game.initialise_game(players)
+    game.attach_event_log(EventLogWriter(f))
+    game.play_game()
+
+with open("game.unolog", "rb") as f:
+    state = replay(f, turn=10)   # the game as it was after 10 turns
+```
+"""
+from __future__ import annotations
+import struct
+from enum import auto, IntEnum
+from typing import BinaryIO, Iterator
+
+from card import Card, CardColor, CardLabel
+from hand import Hand
+
+__author__ = "Divyana (Divi) Ahuja"
+
+MAGIC = b"UNOLOG"
+VERSION = 1
+
+# seat used for events that do not belong to a player
+NO_SEAT = 255
+
+_EVENT = struct.Struct("<BBH")
+_COUNT = struct.Struct("<H")
+_HEADER = struct.Struct("<6sBHBBHbI")
+
+
+class EventType(IntEnum):
+    """
+    Enum class for the type of a logged event
+    """
+
+    TURN = 0          # seat starts a turn
+    PLAY = auto()     # seat plays the card, arg is the card code
+    DRAW = auto()     # seat draws the card on their turn, arg is the card code
+    PENALTY_DRAW = auto() # seat is made to draw the card (draw two, draw four), arg is the card code
+    DISCARD = auto()  # the card goes on top of the discard pile, arg is the card code
+    SKIP = auto()     # seat loses their turn
+    REVERSE = auto()  # seat reverses the turn order
+    COLOR_CHOICE = auto() # seat picks the colour after a black card, arg is the colour
+    RESHUFFLE = auto() # arg cards from the bottom of the discard pile go back to the draw pile
+    GAME_END = auto() # the game is over, seat is the winner (NO_SEAT if none), arg is the GameOutcome
+
+
+class EventLogWriter:
+    """
+    Buffered, append only writer of an event log
+    """
+
+    def __init__(self, stream: BinaryIO, buffer_size: int = 1 << 16) -> None:
+        """
+        Constructor for the EventLogWriter class
+
+        Args:
+            stream (BinaryIO): The binary stream the log is written to
+            buffer_size (int): The number of bytes buffered before they are written
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+
+    def start(self, game) -> None:
+        """
+        Starts the log of a game, called when the log is attached to it
+        """
+        self.write_header(game)
+
+    def write_header(self, game) -> None:
+        """
+        Writes the current position of an initialised game as the start of the log
+
+        Args:
+            game (Game): The game the log is attached to
+
+        Returns:
+            None
+
+        Complexity:
+        -n is the number of players
+        -m is the number of cards in the game
+            Best Case Complexity:o(n+m)
+            Worst Case Complexity:o(n+m)
+        """
+        seats = game.players.seats
+        buffer = self.buffer
+        buffer += _HEADER.pack(
+            MAGIC, VERSION, len(seats), game.current_color, game.current_label,
+            game.players.cursor, game.players.direction, game.turns,
+        )
+        for player in seats:
+            name = player.name.encode("utf-8")
+            buffer += _COUNT.pack(len(name))
+            buffer += name
+        for player in seats:
+            self._write_cards(player.hand)
+        self._write_cards(game.game_board.draw_pile)
+        self._write_cards(game.game_board.discard_pile)
+        if len(buffer) >= self.buffer_size:
+            self.flush()
+
+    def _write_cards(self, cards) -> None:
+        """
+        Writes a count followed by one byte per card code.
+        """
+        codes = bytes(card.code for card in cards)
+        self.buffer += _COUNT.pack(len(codes))
+        self.buffer += codes
+
+    def record(self, event_type: EventType, seat: int, arg: int = 0) -> None:
+        """
+        Appends one event to the log
+
+        Args:
+            event_type (EventType): The type of the event
+            seat (int): The seat of the player the event belongs to, NO_SEAT if none
+            arg (int): The card code, colour or count of the event
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(b) when the buffer of b bytes is written out
+        """
+        self.buffer += _EVENT.pack(event_type, seat, arg)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes every buffered byte to the stream
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(b) where b is the number of buffered bytes
+        """
+        if self.buffer:
+            self.stream.write(self.buffer)
+            self.buffer = bytearray()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the log, the stream itself is left open for its owner to close
+        """
+        self.flush()
+
+    def __enter__(self) -> EventLogWriter:
+        """
+        Use the writer as a context manager that flushes on exit
+        """
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Flushes the log when leaving the with block
+        """
+        self.close()
+
+
+class EventTee:
+    """
+    Sends every event to several recorders, used when more than one is attached to a game
+    """
+
+    def __init__(self, *recorders) -> None:
+        """
+        Constructor for the EventTee class
+
+        Args:
+            recorders: The recorders (event logs, metrics collectors) to send events to
+
+        Returns:
+            None
+        """
+        self.recorders = recorders
+
+    def record(self, event_type: EventType, seat: int, arg: int = 0) -> None:
+        """
+        Sends one event to every recorder
+
+        Complexity:
+            Best Case Complexity:o(r) where r is the number of recorders
+            Worst Case Complexity:o(r)
+        """
+        for recorder in self.recorders:
+            recorder.record(event_type, seat, arg)
+
+    def flush(self) -> None:
+        """
+        Flushes every recorder
+        """
+        for recorder in self.recorders:
+            recorder.flush()
+
+
+class ReplayState:
+    """
+    State of a game rebuilt from an event log
+    """
+
+    def __init__(self, names, hands, draw_pile: Hand, discard_pile, current_color: CardColor,
+                 current_label: CardLabel, cursor: int, direction: int, turns: int) -> None:
+        """
+        Constructor for the ReplayState class
+
+        Args:
+            names: The player names in seat order
+            hands: The hand of each seat
+            draw_pile (Hand): The cards in the draw pile, as a multiset since the
+                order of a reshuffled pile is not logged
+            discard_pile: The cards in the discard pile, bottom first
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+            cursor (int): The seat at the front of the turn order, the next one to play,
+                kept up to date by apply like TurnOrder.cursor
+            direction (int): The direction of the turn order, 1 or -1
+            turns (int): The number of turns already played when the log started
+
+        Returns:
+            None
+        """
+        self.names = names
+        self.hands = hands
+        self.draw_pile = draw_pile
+        self.discard_pile = discard_pile
+        self.current_color = current_color
+        self.current_label = current_label
+        self.cursor = cursor
+        self.direction = direction
+        self.current_seat = None
+        self.turns = turns
+        self.reshuffles = 0
+
+    def apply(self, event_type: EventType, seat: int, arg: int) -> None:
+        """
+        Applies one logged event to the state
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(m) for a reshuffle of m cards
+        """
+        if event_type == EventType.TURN:# the seat at the front is served, see TurnOrder.advance
+            self.turns += 1
+            self.current_seat = seat
+            self.cursor = (seat + self.direction) % len(self.names)
+        elif event_type == EventType.PLAY:
+            card = Card.from_code(arg)
+            self.hands[seat].remove(card)
+            self.current_color = card.color
+            self.current_label = card.label
+        elif event_type == EventType.DRAW or event_type == EventType.PENALTY_DRAW:
+            card = Card.from_code(arg)
+            self.draw_pile.remove(card)
+            self.hands[seat].append(card)
+        elif event_type == EventType.DISCARD:
+            self.discard_pile.append(Card.from_code(arg))
+        elif event_type == EventType.COLOR_CHOICE:
+            self.current_color = CardColor(arg)
+        elif event_type == EventType.REVERSE:
+            # TurnOrder.reverse, then Game.play_turn serves the new front player straight away
+            self.cursor = (self.cursor - self.direction) % len(self.names)
+            self.direction = -self.direction
+            self.current_seat = self.cursor
+            self.cursor = (self.cursor + self.direction) % len(self.names)
+        elif event_type == EventType.SKIP:# the skipped seat goes to the rear, see TurnOrder.skip
+            self.cursor = (seat + self.direction) % len(self.names)
+        elif event_type == EventType.RESHUFFLE:
+            for card in self.discard_pile[:arg]:
+                self.draw_pile.append(card)
+            self.discard_pile = self.discard_pile[arg:]
+            self.reshuffles += 1
+        elif event_type != EventType.GAME_END:
+            raise ValueError(f"unknown event type {event_type}")
+
+    def winner(self) -> str | None:
+        """
+        Returns the name of the player with no cards left, None while the game is on
+        """
+        for seat in range(len(self.hands)):
+            if len(self.hands[seat]) == 0:
+                return self.names[seat]
+        return None
+
+
+class EventLogReader:
+    """
+    Reader of an event log written by EventLogWriter
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        """
+        Constructor for the EventLogReader class, reads the header of the log
+
+        Args:
+            stream (BinaryIO): The binary stream the log is read from
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the stream is not an event log
+        """
+        self.stream = stream
+        magic, version, players, color, label, cursor, direction, turns = _HEADER.unpack(
+            self._read(_HEADER.size)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not an event log, or an unsupported version")
+        names = [self._read(self._read_count()).decode("utf-8") for _ in range(players)]
+        hands = [self._read_hand() for _ in range(players)]
+        draw_pile = self._read_hand()
+        discard_pile = self._read_cards()
+        self._initial = ReplayState(
+            names, hands, draw_pile, discard_pile, CardColor(color), CardLabel(label), cursor, direction, turns
+        )
+
+    def initial_state(self) -> ReplayState:
+        """
+        Returns a fresh copy of the state the log starts from
+        """
+        initial = self._initial
+        return ReplayState(
+            initial.names, [hand.copy() for hand in initial.hands], initial.draw_pile.copy(),
+            initial.discard_pile[:], initial.current_color, initial.current_label,
+            initial.cursor, initial.direction, initial.turns,
+        )
+
+    def _read(self, size: int) -> bytes:
+        """
+        Reads exactly size bytes.
+        """
+        data = self.stream.read(size)
+        if len(data) != size:
+            raise ValueError("truncated event log")
+        return data
+
+    def _read_count(self) -> int:
+        """
+        Reads a 16 bit count.
+        """
+        return _COUNT.unpack(self._read(_COUNT.size))[0]
+
+    def _read_cards(self) -> list:
+        """
+        Reads a count followed by that many card codes.
+        """
+        return [Card.from_code(code) for code in self._read(self._read_count())]
+
+    def _read_hand(self) -> Hand:
+        """
+        Reads a list of cards into a Hand.
+        """
+        hand = Hand()
+        for card in self._read_cards():
+            hand.append(card)
+        return hand
+
+    def events(self, chunk_size: int = 1 << 16) -> Iterator:
+        """
+        Yields every (event type, seat, arg) after the header, reading the stream in chunks
+
+        Complexity:
+            Best Case Complexity:o(e) where e is the number of events
+            Worst Case Complexity:o(e)
+        """
+        chunk_size -= chunk_size % _EVENT.size
+        while True:
+            data = self.stream.read(chunk_size)
+            if not data:
+                return
+            if len(data) % _EVENT.size:
+                raise ValueError("truncated event log")
+            for event_type, seat, arg in _EVENT.iter_unpack(data):
+                yield EventType(event_type), seat, arg
+
+
+def replay(stream: BinaryIO, turn: int = None) -> ReplayState:
+    """
+    Rebuilds the state of a logged game
+
+    Args:
+        stream (BinaryIO): The binary stream the log is read from
+        turn (int): Stop once the game has played this many turns, defaults to the end of the log
+
+    Returns:
+        ReplayState: The state of the game after that turn
+
+    Complexity:
+        Best Case Complexity:o(e) where e is the number of events up to that turn
+        Worst Case Complexity:o(e)
+    """
+    reader = EventLogReader(stream)
+    state = reader.initial_state()
+    for event_type, seat, arg in reader.events():
+        if turn is not None and event_type == EventType.TURN and state.turns == turn:
+            break
+        state.apply(event_type, seat, arg)
+    return state
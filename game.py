@@ -1,28 +1,189 @@
 from __future__ import annotations
 from player import Player
-from game_board import GameBoard
-from card import CardColor, CardLabel, Card
+from turn_order import TurnOrder
+from game_board import GameBoard, DeckExhausted
+from card import CardColor, CardLabel, Card, NUM_LABELS, PLAYABLE_MASK
 from random_gen import RandomGen
+from event_log import EventLogWriter, EventTee, EventType, NO_SEAT
+from metrics import MetricsCollector
 from config import Config
 from data_structures import *
-from data_structures.queue_adt import CircularQueue
+from enum import auto, IntEnum
+from typing import Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from transcript import TranscriptWriter
 
 __author__ = "Divyana (Divi) Ahuja"
+
+
+def _build_deck() -> tuple:
+    """
+    Returns the cards of one deck in the order they have always been generated in.
+    """
+    cards = []
+    for color in CardColor:
+        if color != CardColor.BLACK:
+            # 2 of each card from 0 to 9, then 2 of each special card
+            for i in range(10):
+                cards += [Card(color, CardLabel(i))] * 2
+            cards += [Card(color, CardLabel.SKIP), Card(color, CardLabel.REVERSE), Card(color, CardLabel.DRAW_TWO)] * 2
+        else:
+            cards += [Card(CardColor.BLACK, CardLabel.CRAZY), Card(CardColor.BLACK, CardLabel.DRAW_FOUR)] * 4
+    return tuple(cards)
+
+
+# One deck, built once: per colour two of each number and special card, then four black
+# crazy and four black draw four cards. The legacy shuffle starts from the same cards sorted.
+DECK_TEMPLATE = _build_deck()
+SORTED_DECK_TEMPLATE = tuple(sorted(DECK_TEMPLATE, key=lambda card: card.code))
+_deck_templates = {(1, False): DECK_TEMPLATE, (1, True): SORTED_DECK_TEMPLATE}
+
+
+def deck_template(num_decks: int = 1, legacy: bool = True) -> tuple:
+    """
+    Returns the cards of num_decks decks in the order the shuffle of Game.generate_cards starts
+    from, built once per number of decks and reused by every game
+
+    Args:
+        num_decks (int): The number of decks
+        legacy (bool): True for the legacy shuffle, lowest code first, False for the
+            Fisher-Yates shuffle, deck after deck in generation order
+
+    Returns:
+        tuple: The cards
+
+    Complexity:
+        Best Case Complexity:o(1) once built
+        Worst Case Complexity:o(m) the first time, where m is the number of cards
+    """
+    template = _deck_templates.get((num_decks, legacy))
+    if template is None:
+        if legacy:
+            template = tuple(card for card in SORTED_DECK_TEMPLATE for _ in range(num_decks))
+        else:
+            template = DECK_TEMPLATE * num_decks
+        _deck_templates[(num_decks, legacy)] = template
+    return template
+
+
+class GameOutcome(IntEnum):
+    """
+    Enum class for how a game ended
+    """
+
+    WIN = 0
+    DRAW = auto()    # nobody can win: the deck ran out or the game stopped making progress
+    ABORTED = auto() # the turn budget ran out
+
+
+class TurnEvent:
+    """
+    What happened in one turn, returned by Game.step
+    """
+
+    __slots__ = ("turn", "seat", "card", "drew", "color", "label")
+
+    def __init__(self, turn: int, seat: int, card: Card | None, drew: bool,
+                 color: CardColor, label: CardLabel) -> None:
+        """
+        Constructor for the TurnEvent class
+
+        Args:
+            turn (int): The number of the turn, from 1
+            seat (int): The seat of the player who took the turn
+            card (Card): The card they played, None if they drew a card they could not play
+            drew (bool): True if they drew a card because they had nothing to play
+            color (CardColor): The current colour after the turn (the colour named after a black card)
+            label (CardLabel): The current label after the turn
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        self.turn = turn
+        self.seat = seat
+        self.card = card
+        self.drew = drew
+        self.color = color
+        self.label = label
+
+    def __repr__(self) -> str:
+        """
+        Method to return the string representation of the TurnEvent
+        """
+        return (
+            f"TurnEvent(turn={self.turn}, seat={self.seat}, card={self.card}, drew={self.drew}, "
+            f"color={self.color.name}, label={self.label.name})"
+        )
+
+
+class GameSnapshot:
+    """
+    Saved position of a game, made by Game.snapshot and put back by Game.restore.
+    Holds copies of every hand and pile (sharing the immutable cards), the turn
+    order position, the current colour/label, the random stream position and
+    how the game ended, if it has.
+    """
+
+    def __init__(self, game: Game) -> None:
+        """
+        Constructor for the GameSnapshot class
+
+        Args:
+            game (Game): The game to save, it must have been initialised
+
+        Returns:
+            None
+
+        Complexity:
+        -n is the number of players
+        -m is the number of cards in the piles
+            Best Case Complexity:o(n+m)
+            Worst Case Complexity:o(n+m)
+            - each hand is a fixed size copy and each pile a single block copy
+        """
+        seats = game.players.seats
+        self.hands = [player.hand.copy() for player in seats]
+        self.draw_pile = game.game_board.draw_pile.copy()
+        self.discard_pile = game.game_board.discard_pile.copy()
+        self.reshuffles = game.game_board.reshuffles
+        self.random_draws = game.game_board.random_draws
+        self.cursor = game.players.cursor
+        self.direction = game.players.direction
+        self.current_seat = None if game.current_player is None else seats.index(game.current_player)
+        self.current_color = game.current_color
+        self.current_label = game.current_label
+        self.turns = game.turns
+        self.lowest_hand = game.lowest_hand
+        self.last_progress_turn = game.last_progress_turn
+        self.rng_seed = game.rng.seed
+        self.outcome = game.outcome
+        self.end_reason = game.end_reason
+
+
 class Game:
     """
     Game class to play the game
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rng: RandomGen = None, num_decks: int = None) -> None:
         """
         Constructor for the Game class
 
         Args:
-            None
+            rng (RandomGen): The random stream used by this game, defaults to the shared RandomGen stream
+            num_decks (int): The number of decks shuffled together, defaults to Config.NUM_DECKS
 
         Returns:
             None
 
+        Raises:
+            ValueError: if the number of decks is not between 1 and Config.MAX_DECKS
+
         Complexity:
             Best Case Complexity: o(1)
             Worst Case Complexity:o(1)
@@ -33,55 +194,47 @@ class Game:
         self.current_color = None 
         self.current_label = None
         self.game_board = None
+        self.turns = 0
+        self.lowest_hand = None # smallest hand anyone has had, and the turn it happened
+        self.last_progress_turn = 0
+        self.outcome = None
+        self.end_reason = None
+        self.max_turns = None # runtime limits, set by start_play
+        self.stalemate_turns = None
+        self.turn_player = None # who played the last turn, whether they drew and the card they played
+        self.turn_drew = False
+        self.turn_card = None
+        self.rng = RandomGen if rng is None else rng
+        self.event_log = None
+        self.num_decks = Config.NUM_DECKS if num_decks is None else num_decks
+        if not 1 <= self.num_decks <= Config.MAX_DECKS:
+            raise ValueError(f"a game uses 1 to {Config.MAX_DECKS} decks, not {self.num_decks}")
 
 
         
 
-    def generate_cards(self) -> ArrayList[Card]:
+    def generate_cards(self) -> list[Card]:
         """
-        Method to generate the cards for the game
+        Method to generate the cards for the game, self.num_decks full decks shuffled together
+
+        The decks are never built again: the shuffle only picks the order of the
+        cards of deck_template, so the same seed deals the same cards as ever.
 
         Args:
             None
 
         Returns:
-            ArrayList[Card]: The list of Card objects generated
-        """
-        list_of_cards: ArrayList[Card] = ArrayList(Config.DECK_SIZE)
-        idx: int = 0
-
-        # Generate 4 sets of cards from 0 to 9 for each color
-        for color in CardColor:
-            if color != CardColor.BLACK:
-                # Generate 4 sets of cards from 0 to 9 for each color
-                for i in range(10):
-                    list_of_cards.insert(idx, Card(color, CardLabel(i)))
-                    idx += 1
-                    list_of_cards.insert(idx, Card(color, CardLabel(i)))
-                    idx += 1
-
-                # Generate 2 of each special card for each color
-                for i in range(2):
-                    list_of_cards.insert(idx, Card(color, CardLabel.SKIP))
-                    idx += 1
-                    list_of_cards.insert(idx, Card(color, CardLabel.REVERSE))
-                    idx += 1
-                    list_of_cards.insert(idx, Card(color, CardLabel.DRAW_TWO))
-                    idx += 1
-            else:
-                # Generate black crazy and draw 4 cards
-                for i in range(4):
-                    list_of_cards.insert(idx, Card(CardColor.BLACK, CardLabel.CRAZY))
-                    idx += 1
-                    list_of_cards.insert(
-                        idx, Card(CardColor.BLACK, CardLabel.DRAW_FOUR)
-                    )
-                    idx += 1
+            list[Card]: The cards in the order they are drawn
 
-                # Randomly shuffle the cards
-                RandomGen.random_shuffle(list_of_cards)
-
-                return list_of_cards
+        Complexity:
+        -where m is the number of cards
+            Best Case Complexity:o(m) with the Fisher-Yates shuffle
+            Worst Case Complexity:o(m log m) with the legacy shuffle, which sorts its random numbers
+        """
+        legacy = self.rng.legacy_shuffle
+        template = deck_template(self.num_decks, legacy)
+        order = self.rng.permutation(len(template), legacy)
+        return [template[i] for i in order]
 
     def initialise_game(self, players: ArrayList[Player]) -> None:
         """
@@ -93,6 +246,12 @@ class Game:
         Returns:
             None
 
+        Raises:
+            ValueError: if there are not Config.MIN_PLAYERS to Config.MAX_PLAYERS players,
+                or not enough cards to deal every hand and start the discard pile
+            DeckExhausted: if the cards left after dealing are all special cards,
+                so the discard pile cannot be started with a number card
+
         Complexity:
         - n is the number of players 
         -m is the no of cards 
@@ -119,14 +278,18 @@ class Game:
             which simplifies to 
 
         """
-        # setting up players , game board
-        self.players = CircularQueue(len(players))
+        if not Config.MIN_PLAYERS <= len(players) <= Config.MAX_PLAYERS:
+            raise ValueError(f"a game seats {Config.MIN_PLAYERS} to {Config.MAX_PLAYERS} players, not {len(players)}")
+        if len(players) * Config.NUM_CARDS_AT_INIT >= Config.DECK_SIZE * self.num_decks:
+            raise ValueError(
+                f"{self.num_decks} deck(s) cannot deal {Config.NUM_CARDS_AT_INIT} cards to {len(players)} players"
+            )
 
-        for player in players:
-            self.players.append(player)
+        # setting up players , game board
+        self.players = TurnOrder(players)
             
 
-        self.game_board = GameBoard(self.generate_cards())# o (m log M ) as it only loops M times, where m is the number of cards
+        self.game_board = GameBoard(self.generate_cards(), self.rng)# o (m log M ) as it only loops M times, where m is the number of cards
         
         
         # while each player not have certain amount of cards in hand 
@@ -142,6 +305,8 @@ class Game:
         while draw_card.label.value > 9:  # complexity: runs a set number of times sine  finding a normal card
             
             self.game_board.discard_card(draw_card) #  discarding the top card 
+            if self.game_board.draw_pile.is_empty():# every card left on the board is a special card
+                raise DeckExhausted("no number card left to start the discard pile")
             draw_card = self.game_board.draw_card()
         
         self.game_board.discard_card(draw_card) 
@@ -185,22 +350,15 @@ class Game:
             None
 
         Complexity: 
-        -n is the number of players 
-            Best Case Complexity: o(n)
-            Worst Case Complexity:o(n)
+            Best Case Complexity: o(1)
+            Worst Case Complexity:o(1)
 
-        - at point 1, we push n players in the stack therefore it has a complexity of o(1).
-        - at point 2, we append n players into the queue.
+        - the turn order keeps a cursor and a direction, reversing moves the cursor
+        to the last player in the queue and flips the direction
         """
-
-        player_store = ArrayStack(len(self.players))
-
-        # pushing the into the draw stack 
-        while not self.players.is_empty():#  pushing players in a player storage stack, serving from queue
-            player_store.push(self.players.serve())
-        
-        while not player_store.is_empty():#poping players fro stack back into queue 
-            self.players.append(player_store.pop())
+        self.players.reverse()
+        if self.event_log is not None:
+            self.event_log.record(EventType.REVERSE, self._current_seat())
         
         
     def skip_next_player(self) -> None:
@@ -217,12 +375,11 @@ class Game:
             Best Case Complexity: o(1)
             Worst Case Complexity:o(1)
 
-            append and serve have a complexity of o(1)
+            moving the turn order cursor has a complexity of o(1)
         """
-        
-        
-        next_player = self.players.serve()        
-        self.players.append(next_player) # skipping next player 
+        if self.event_log is not None:
+            self.event_log.record(EventType.SKIP, self.next_player().seat)
+        self.players.skip() # skipping next player 
 
 
     def play_draw_two(self) -> None:
@@ -246,6 +403,8 @@ class Game:
         for i in range(2):
             card_draw = self.game_board.draw_card()
             self.next_player().add_card(card_draw)
+            if self.event_log is not None:
+                self.event_log.record(EventType.PENALTY_DRAW, self.next_player().seat, card_draw.code)
         
        
 
@@ -264,13 +423,21 @@ class Game:
         Complexity:
             Best Case Complexity:o(1)
             Worst Case Complexity:o(1)
-            - CardColor(RandomGen.randint(0, 3)) has a complexity of o(1)
-            as it returns a number bwteen 0 to 3, the next player getting 4 cards is also o(1) 
+            - choosing the colour has a complexity of o(1), the default strategy
+            returns a random number bwteen 0 to 3, the next player getting 4 cards is also o(1) 
             since the overall complexity of the draw_card function is o(1) and next_player 
             function is o(1)
         """
-        # Change the game's current color to a random color (excluding black)
-        self.current_color = CardColor(RandomGen.randint(0, 3))     
+        # Change the game's current color to the one the player picks (excluding black),
+        # a random one with the default strategy
+        if self.current_player is None:# outside play_game there is no player to ask
+            self.current_color = CardColor(self.rng.randint(0, 3))
+        else:
+            self.current_color = self.current_player.choose_color(
+                self.current_color, self.current_label, self.rng, self.players
+            )
+        if self.event_log is not None:
+            self.event_log.record(EventType.COLOR_CHOICE, self._current_seat(), self.current_color)
         
         
         # # If the card is a Draw Four card, apply the draw effect and skip the next player
@@ -302,9 +469,10 @@ class Game:
         """
         
         drawn_card = self.game_board.draw_card()
-        
+        if self.event_log is not None:
+            self.event_log.record(EventType.DRAW if playing else EventType.PENALTY_DRAW, player.seat, drawn_card.code)
 
-        if ( drawn_card.color == CardColor.BLACK or drawn_card.color == self.current_color or drawn_card.label == self.current_label) and  playing == True:
+        if playing and PLAYABLE_MASK[self.current_color * NUM_LABELS + self.current_label] >> drawn_card.code & 1:
             
             # remember to pass the black card through self.play_black when calling this function
             
@@ -322,68 +490,406 @@ class Game:
             None
 
         Returns:
-            Player: The winner of the game
+            Player: The winner of the game, None if the game ended without a winner
+
+        A game restored or forked part way through carries on from where it was.
+
+        The game always ends: self.outcome is set to a WIN, to a DRAW when the
+        deck runs out or when Config.MAX_ROUNDS_WITHOUT_PROGRESS rounds pass
+        without any hand getting smaller than the smallest one so far, or to
+        ABORTED after Config.MAX_ROUNDS_PER_PLAYER rounds. self.end_reason
+        says why a game without a winner ended.
         """
-        
-        # starts game intialiseing frist player
-        
-        self.current_player = self.players.serve()
-        self.players.append(self.current_player)
-        turn = 0 # number of players played 
-        
-        while len(self.current_player.hand)  !=0  :# the while loop represents the game, when a player has no cards in hand the loop ends 
+        if self.max_turns is None:
+            self.start_play()
+        while self.play_turn():
+            pass
+        return self.winner()
 
-            if  turn != 0 :# error occured when placed at the end so only suitable option to iterate through players duing rounds 
-                self.current_player = self.players.serve()
-                self.players.append(self.current_player)
-            turn +=1 
+    def start_play(self) -> None:
+        """
+        Method to get an initialised (or restored) game ready for play_turn, once:
+        play_game, step and iter_turns only call it while self.max_turns is None
 
+        Args:
+            None
 
-            playable_card = self.current_player.play_card(self.current_color,self.current_label)
+        Returns:
+            None
 
-            
+        Complexity:
+            Best Case Complexity:o(n) where n is the number of players
+            Worst Case Complexity:o(n)
+        """
+        # starts game intialiseing frist player, self.turns counts the number of players played 
+        if self.turns == 0:
+            self.current_player = self.players.advance()
+            self.lowest_hand = min(len(player.hand) for player in self.players.seats)
+            self.last_progress_turn = 0
+        self.max_turns = Config.MAX_ROUNDS_PER_PLAYER * len(self.players)
+        self.stalemate_turns = Config.MAX_ROUNDS_WITHOUT_PROGRESS * len(self.players)
+
+    def player_to_move(self) -> Player:
+        """
+        Method to get the player whose turn play_turn plays next
+
+        Returns:
+            Player: The player about to play
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return self.current_player if self.turns == 0 else self.players.peek()
+
+    def play_turn(self) -> bool:
+        """
+        Method to play one turn of a game started with start_play, one pass of the
+        play_game loop, so a caller can interleave games or wait between turns
+
+        Args:
+            None
+
+        Returns:
+            bool: True if the game goes on, False once it is over (see self.outcome)
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:the cost of a reshuffle, see GameBoard.reshuffle
+        """
+        if self.is_over():
+            return False
+
+        try:
+            if  self.turns != 0 :# error occured when placed at the end so only suitable option to iterate through players duing rounds 
+                self.current_player = self.players.advance()
+            self.turns +=1 
+            self.turn_player = self.current_player # what this turn did, read by step
+            self.turn_drew = False
+            self.turn_card = None
+            if self.event_log is not None:
+                self.event_log.record(EventType.TURN, self.current_player.seat)
+
+
+            playable_card = self.current_player.play_card(self.current_color,self.current_label,self.players)
+
+    
             if  playable_card is None:# player dosen't have any cards to play pick up CARD
+                self.turn_drew = True
                 playable_card = self.draw_card(self.current_player,True) #draw _card 
 
-                
+        
                 if playable_card is None  :
-                    continue
-            
+                    return True
+
+            self.turn_card = playable_card
+            if self.event_log is not None:
+                self.event_log.record(EventType.PLAY, self.current_player.seat, playable_card.code)
+            if len(self.current_player.hand) < self.lowest_hand:# closer to winning than anyone so far
+                self.lowest_hand = len(self.current_player.hand)
+                self.last_progress_turn = self.turns
+    
             self.current_color  = playable_card.color # reset current colour and label 
             self.current_label = playable_card.label 
-                    
+            
 
             if playable_card.label <= 9 :# if cards is a number card
-            
+    
                 self.game_board.discard_card(playable_card)
 
             elif playable_card.label > 9:#  implementing speacial cards 
-                
+        
                 if  playable_card.color == CardColor.BLACK:
                     self.play_black(playable_card)
 
                 elif  playable_card.label == CardLabel.DRAW_TWO:
                     self.play_draw_two()
-                    
+            
                 elif  playable_card.label == CardLabel.REVERSE:
-                
+        
                     # after reversing the current player becomes the next frist player 
                     # so we need to skip over the current 
 
                     self.reverse_players()
-                    self.current_player = self.players.serve()
-                    self.players.append(self.current_player)
-                
+                    self.current_player = self.players.advance()
+        
                 elif  playable_card.label == CardLabel.SKIP:
                     self.skip_next_player()
 
                 else:
                     raise Exception(f"card is playable, but not speacial {playable_card}")
             else:
-                raise Exception(f"card playablity failed: {playable_card}")       
-        
-        
-        return  self.current_player
-    
-        
+                raise Exception(f"card playablity failed: {playable_card}")
+        except DeckExhausted:# every card is in a hand, nobody can draw
+            self._end_game(GameOutcome.DRAW, "deck exhausted")
+            return False
+        return True
+
+    def is_over(self) -> bool:
+        """
+        Method to check, between turns of a game started with start_play, whether
+        the next turn will be played: the checks play_turn makes first, so a caller
+        can stop before asking a player for a turn that never happens
+
+        Args:
+            None
+
+        Returns:
+            bool: True if the game is over, self.outcome is then set
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        if self.outcome is not None:
+            return True
+        # the loop ends when the current player has no cards in hand 
+        if len(self.current_player.hand) == 0:
+            self._end_game(GameOutcome.WIN, None)
+            return True
+        if self.turns >= self.max_turns:# turn budget used up
+            self._end_game(GameOutcome.ABORTED, "turn limit reached")
+            return True
+        if self.turns - self.last_progress_turn >= self.stalemate_turns:# nobody is getting closer to winning
+            self._end_game(GameOutcome.DRAW, "no progress")
+            return True
+        return False
+
+    def step(self) -> TurnEvent | None:
+        """
+        Method to play exactly one turn and say what happened, starting the game
+        (see start_play) on the first call
+
+        Args:
+            None
+
+        Returns:
+            TurnEvent: The turn that was played, None once the game is over (see
+            self.outcome), including a turn cut short because the deck ran out
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:the cost of play_turn
+        """
+        if self.max_turns is None:
+            self.start_play()
+        if not self.play_turn():
+            return None
+        return TurnEvent(
+            self.turns, self.turn_player.seat, self.turn_card, self.turn_drew, self.current_color, self.current_label
+        )
+
+    def iter_turns(self) -> Iterator[TurnEvent]:
+        """
+        Method to play the game lazily, one turn per item, stopping the iteration
+        early leaves the game where it is so it can carry on later
+
+        Args:
+            None
+
+        Returns:
+            Iterator[TurnEvent]: The turns of the game until it is over
+
+        Complexity:
+            Best Case Complexity:o(1) per turn
+            Worst Case Complexity:the cost of play_turn per turn
+        """
+        if self.max_turns is None:
+            self.start_play()
+        while True:
+            event = self.step()
+            if event is None:
+                return
+            yield event
+
+    def winner(self) -> Player | None:
+        """
+        Method to get the winner of a finished game
+
+        Returns:
+            Player: The winner, None if the game is not over or ended without a winner
+        """
+        return self.current_player if self.outcome == GameOutcome.WIN else None
+
+    def _end_game(self, outcome: GameOutcome, reason: str | None) -> None:
+        """
+        Records how the game ended.
+        """
+        self.outcome = outcome
+        self.end_reason = reason
+        if self.event_log is not None:
+            winner = self.winner()
+            self.event_log.record(EventType.GAME_END, NO_SEAT if winner is None else winner.seat, outcome)
+            self.event_log.flush()
+
+    def attach_event_log(self, event_log: EventLogWriter) -> None:
+        """
+        Method to start logging every event of the game
+
+        The current position is written as the header of the log, so the game
+        must have been initialised. Every event after that is recorded.
+
+        Args:
+            event_log (EventLogWriter): The log to write to
+
+        Returns:
+            None
+
+        Complexity:
+        -n is the number of players
+        -m is the number of cards in the game
+            Best Case Complexity:o(n+m)
+            Worst Case Complexity:o(n+m)
+            - writing the header copies every hand and pile once
+        """
+        self._attach(event_log)
+
+    def attach_metrics(self, metrics: MetricsCollector) -> None:
+        """
+        Method to start collecting metrics from the events of the game
+
+        The game must have been initialised. A collector can watch many games
+        one after the other, and can share a game with an event log.
+
+        Args:
+            metrics (MetricsCollector): The collector to update, or a GameCounts for one game
+
+        Returns:
+            None
+
+        Complexity:
+        -n is the number of players
+            Best Case Complexity:o(n)
+            Worst Case Complexity:o(n)
+        """
+        self._attach(metrics)
+
+    def attach_transcript(self, transcript: TranscriptWriter) -> None:
+        """
+        Method to start writing the transcript of the game, round by round
+
+        The beginning position is written straight away, so the game must have
+        been initialised. Can share the game with an event log and metrics.
+
+        Args:
+            transcript (TranscriptWriter): The transcript to write
+
+        Returns:
+            None
+
+        Complexity:
+        -n is the number of players
+        -h is the number of cards in a hand
+            Best Case Complexity:o(n*h)
+            Worst Case Complexity:o(n*h)
+        """
+        self._attach(transcript)
+
+    def _attach(self, recorder) -> None:
+        """
+        Starts a recorder on the game and routes every event to it, alongside
+        any recorder that is already attached.
+        """
+        recorder.start(self)
+        if self.event_log is not None:
+            recorder = EventTee(self.event_log, recorder)
+        self.event_log = recorder
+        self.game_board.event_log = recorder
+
+    def _current_seat(self) -> int:
+        """
+        Returns the seat of the current player, NO_SEAT before the first turn
+        """
+        return NO_SEAT if self.current_player is None else self.current_player.seat
+
+    def snapshot(self) -> GameSnapshot:
+        """
+        Method to save the current position of the game
+
+        Args:
+            None
+
+        Returns:
+            GameSnapshot: The saved position, it can be restored any number of times
+
+        Complexity:
+        -n is the number of players
+        -m is the number of cards in the piles
+            Best Case Complexity:o(n+m)
+            Worst Case Complexity:o(n+m)
+        """
+        return GameSnapshot(self)
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """
+        Method to put the game back to a saved position
+
+        Args:
+            snapshot (GameSnapshot): A position saved from this game
 
+        Returns:
+            None
+
+        Complexity:
+        -n is the number of players
+        -m is the number of cards in the piles
+            Best Case Complexity:o(n+m)
+            Worst Case Complexity:o(n+m)
+            - the snapshot is copied again so it stays reusable
+        """
+        seats = self.players.seats
+        for i in range(len(seats)):
+            seats[i].hand = snapshot.hands[i].copy()
+        self.game_board.draw_pile = snapshot.draw_pile.copy()
+        self.game_board.discard_pile = snapshot.discard_pile.copy()
+        self.game_board.reshuffles = snapshot.reshuffles
+        self.game_board.random_draws = snapshot.random_draws
+        self.players.cursor = snapshot.cursor
+        self.players.direction = snapshot.direction
+        self.current_player = None if snapshot.current_seat is None else seats[snapshot.current_seat]
+        self.current_color = snapshot.current_color
+        self.current_label = snapshot.current_label
+        self.turns = snapshot.turns
+        self.lowest_hand = snapshot.lowest_hand
+        self.last_progress_turn = snapshot.last_progress_turn
+        self.rng.seed = snapshot.rng_seed
+        self.outcome = snapshot.outcome # a finished game restored to a position in play goes on
+        self.end_reason = snapshot.end_reason
+        if self.current_player is None:# saved before play started, start_play runs again
+            self.max_turns = None
+
+    def fork(self) -> Game:
+        """
+        Method to clone the game at its current position
+
+        The clone has its own players, hands, piles, turn order and random stream
+        (starting where this game's stream is), so playing it on does not touch
+        this game. The cards themselves are shared.
+
+        Args:
+            None
+
+        Returns:
+            Game: The clone of the game
+
+        Complexity:
+        -n is the number of players
+        -m is the number of cards in the piles
+            Best Case Complexity:o(n+m)
+            Worst Case Complexity:o(n+m)
+        """
+        rng = self.rng.copy()
+        other = Game(rng, self.num_decks)
+        seats = [player.copy() for player in self.players.seats]
+        other.players = self.players.copy(seats)
+        other.game_board = self.game_board.copy(rng)
+        if self.current_player is not None:
+            other.current_player = seats[self.players.seats.index(self.current_player)]
+        other.current_color = self.current_color
+        other.current_label = self.current_label
+        other.turns = self.turns
+        other.lowest_hand = self.lowest_hand
+        other.last_progress_turn = self.last_progress_turn
+        other.outcome = self.outcome # a fork of a finished game is finished too
+        other.end_reason = self.end_reason
+        return other
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from card import Card
+from card_pile import CardPile
 from random_gen import RandomGen
+from event_log import EventType, NO_SEAT
 from config import Config
 from data_structures import *
 
@@ -8,17 +10,26 @@ from data_structures.array_list import ArrayList
 
 __author__ = "Divyana (Divi) Ahuja"
 
+
+class DeckExhausted(Exception):
+    """
+    Raised when a card has to be drawn but both the draw and discard piles are empty
+    """
+
 class GameBoard:
     """
     GameBoard class to store cards in draw pile and discard pile
     """
 
-    def __init__(self, cards: ArrayList[Card]):
+    def __init__(self, cards: ArrayList[Card], rng: RandomGen = None, swap_reshuffle: bool = None):
         """
         Constructor for the GameBoard class
 
         Args:
-            cards (ArrayList[Card]): The list of cards to be used in the game
+            cards (ArrayList[Card]): The list of cards to be used in the game, the first one is drawn first
+            rng (RandomGen): The random stream used to reshuffle, defaults to the shared RandomGen stream
+            swap_reshuffle (bool): Reshuffle by swapping the piles, see reshuffle,
+                defaults to Config.SWAP_RESHUFFLE
 
         Returns:
             None
@@ -27,22 +38,22 @@ class GameBoard:
         -where n is the number of cards in the deck
             Best Case Complexity:o(n)
             Worst Case Complexity:o(n)
-            - push the cards into the stack giving a overal complexity of o(n)
+            - push the cards into the stack in one block giving a overal complexity of o(n)
 
         """
-        # intialising piles 
-        self.draw_pile = ArrayStack(Config.DECK_SIZE)
-        self.discard_pile = ArrayStack(Config.DECK_SIZE)
+        # intialising piles, each big enough for every card of the game (several decks in large games)
+        capacity = max(len(cards), Config.DECK_SIZE)
+        self.draw_pile = CardPile(capacity)
+        self.discard_pile = CardPile(capacity)
+        self.reshuffles = 0 # number of times the discard pile has been recycled
+        self.rng = RandomGen if rng is None else rng
+        self.event_log = None # set by Game.attach_event_log
+        self.swap_reshuffle = Config.SWAP_RESHUFFLE if swap_reshuffle is None else swap_reshuffle
+        self.random_draws = False # True while the draw pile is unshuffled and must be drawn from at random
 
         # pushing the into the draw stack in reverse so they are in right order when drawing 
-        
-        for i in range(len(cards)-1,-1,-1):
-            
-            self.draw_pile.push(cards[i])
-            
-        
-        
-        
+        self.draw_pile.fill(reversed(cards))
+
 
     def discard_card(self, card: Card) -> None:
         """
@@ -63,6 +74,8 @@ class GameBoard:
         
        
         self.discard_pile.push(card)
+        if self.event_log is not None:
+            self.event_log.record(EventType.DISCARD, NO_SEAT, card.code)
         
 
 
@@ -84,7 +97,18 @@ class GameBoard:
         since we need to pop of the cards from the dec into an array list then shuffle them. 
         shuffleing has a complexity of O(NlogN). Then we reshuffle them back into the dec o(n). 
         Since O(NlogN) is more dominineering  O(NlogN) is the overall complexity
+
+        With swap_reshuffle set the top card stays on the discard pile and the rest
+        of the discard pile becomes the draw pile by swapping the two piles, o(1).
+        Nothing is shuffled: draw_card takes random cards until the next reshuffle.
         """
+        if self.swap_reshuffle:
+            self._swap_reshuffle()
+            return
+
+        if self.event_log is not None:
+            self.event_log.record(EventType.RESHUFFLE, NO_SEAT, len(self.discard_pile))
+
         #intiallising variables and array
         tempArray = ArrayList(len(self.discard_pile))
         cardIndex = 0 
@@ -99,13 +123,26 @@ class GameBoard:
             
             tempArray.append(card) 
             cardIndex +=1
-        RandomGen.random_shuffle(tempArray)
+        self.rng.random_shuffle(tempArray)
 
         # taking the shuffled list of cards and pushing them into the stack 
         # Complxity: o(n):where n is the number of cards in discard pile
         while cardIndex !=0: 
             cardIndex -=1
             self.draw_pile.push(tempArray.delete_at_index(cardIndex))
+        self.reshuffles += 1
+
+    def _swap_reshuffle(self) -> None:
+        """
+        Swaps the empty draw pile with the discard pile, keeping the top discard.
+        """
+        if self.event_log is not None:
+            self.event_log.record(EventType.RESHUFFLE, NO_SEAT, len(self.discard_pile) - 1)
+        top = self.discard_pile.pop()
+        self.draw_pile.swap(self.discard_pile)
+        self.discard_pile.push(top)
+        self.random_draws = True
+        self.reshuffles += 1
 
     def draw_card(self) -> Card:
         """
@@ -127,8 +164,44 @@ class GameBoard:
             
             in the best case the drawpile is not empty and we just pop 
             a card from the csard pile which has a complexity of o(1)
+
+            with swap_reshuffle set both cases are o(1), after a reshuffle the
+            card is picked at random and swap-removed from the draw pile
+
+        Raises:
+            DeckExhausted: if there is no card left to draw or reshuffle
         """
         if self.draw_pile.is_empty():
-            
+            kept = 1 if self.swap_reshuffle else 0 # the swap keeps the top discard
+            if len(self.discard_pile) <= kept:# every other card is in a player's hand
+                raise DeckExhausted("no cards left to draw or reshuffle")
             self.reshuffle()
+        if self.random_draws:
+            return self.draw_pile.pop_random(self.rng)
         return self.draw_pile.pop()
+
+    def copy(self, rng: RandomGen = None) -> GameBoard:
+        """
+        Returns an independent copy of the board, the cards themselves are shared.
+
+        Args:
+            rng (RandomGen): The random stream used by the copy, defaults to the shared RandomGen stream
+
+        Returns:
+            GameBoard: The copy of the board
+
+        Complexity:
+        -where n is the number of cards in the deck
+            Best Case Complexity:o(n)
+            Worst Case Complexity:o(n)
+            - both piles are copied as a single block of card references
+        """
+        other = GameBoard.__new__(GameBoard)
+        other.draw_pile = self.draw_pile.copy()
+        other.discard_pile = self.discard_pile.copy()
+        other.reshuffles = self.reshuffles
+        other.rng = RandomGen if rng is None else rng
+        other.event_log = None
+        other.swap_reshuffle = self.swap_reshuffle
+        other.random_draws = self.random_draws
+        return other
@@ -0,0 +1,279 @@
+from __future__ import annotations
+from typing import Iterator
+from card import Card, CardColor, CardLabel, CARD_TABLE, NUM_CARD_CODES, NUM_COLORS, NUM_LABELS, PLAYABLE_MASK
+
+__author__ = "Divyana (Divi) Ahuja"
+
+
+class Hand:
+    """
+    A player's hand stored as a count per card code, plus a card count per colour.
+    The black cards live in their own colour bucket (CardColor.BLACK). `mask` has
+    bit c set while the hand holds at least one card with code c.
+
+    Since card codes order cards by color then label, walking the codes in order
+    visits the hand exactly in the order the old insertion sort produced, and the
+    lowest set bit of a mask is the lowest card by color then label.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the Hand class
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - the count tables have a fixed size of NUM_CARD_CODES and NUM_COLORS
+        """
+        self.counts = [0] * NUM_CARD_CODES
+        self.color_counts = [0] * NUM_COLORS
+        self.length = 0
+        self.mask = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cards in the hand
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if the hand has no cards
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return self.length == 0
+
+    def append(self, card: Card) -> None:
+        """
+        Adds a card to the hand
+
+        Args:
+            card (Card): The card to be added
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        if self.counts[card.code] == 0:
+            self.mask |= 1 << card.code
+        self.counts[card.code] += 1
+        self.color_counts[card.color] += 1
+        self.length += 1
+
+    def remove(self, card: Card) -> None:
+        """
+        Removes one copy of a card from the hand
+
+        Args:
+            card (Card): The card to be removed
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the card is not in the hand
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        if self.counts[card.code] == 0:
+            raise ValueError(f"{card} not in the hand")
+        self.counts[card.code] -= 1
+        if self.counts[card.code] == 0:
+            self.mask &= ~(1 << card.code)
+        self.color_counts[card.color] -= 1
+        self.length -= 1
+
+    def count(self, card: Card) -> int:
+        """
+        Returns the number of copies of a card in the hand
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return self.counts[card.code]
+
+    def __contains__(self, card: Card) -> bool:
+        """
+        Returns True if at least one copy of the card is in the hand
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return self.counts[card.code] != 0
+
+    def playable_mask(self, current_color: CardColor, current_label: CardLabel) -> int:
+        """
+        Returns the playable cards of the hand as a bitmask over card codes, bit c set if
+        a card with code c is in the hand and can be played on the current color and label
+
+        A card is playable if it has the same colour, the same label, or is black.
+
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            int: The bitmask of playable card codes, 0 if nothing is playable
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - one lookup in PLAYABLE_MASK and one AND, whatever the hand size
+        """
+        return self.mask & PLAYABLE_MASK[current_color * NUM_LABELS + current_label]
+
+    def lowest_playable(self, current_color: CardColor, current_label: CardLabel) -> Card | None:
+        """
+        Returns the lowest card by color then label that can be played on the current
+        color and label, without removing it from the hand
+
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            Card: The lowest playable card, None if there is no playable card
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - the lowest set bit of playable_mask is the lowest playable code
+        """
+        playable = self.mask & PLAYABLE_MASK[current_color * NUM_LABELS + current_label]
+        if playable == 0:
+            return None
+        return CARD_TABLE[(playable & -playable).bit_length() - 1]
+
+    def playable(self, current_color: CardColor, current_label: CardLabel) -> list:
+        """
+        Returns every distinct card of the hand that can be played on the current
+        color and label, lowest by color then label first
+
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            list: The playable cards, one entry per card code held
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - one step per set bit of playable_mask, at most NUM_CARD_CODES
+        """
+        playable = self.mask & PLAYABLE_MASK[current_color * NUM_LABELS + current_label]
+        cards = []
+        while playable:
+            lowest = playable & -playable
+            cards.append(CARD_TABLE[lowest.bit_length() - 1])
+            playable ^= lowest
+        return cards
+
+    def copy(self) -> Hand:
+        """
+        Returns an independent copy of the hand
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - copies the fixed size count tables
+        """
+        other = Hand.__new__(Hand)
+        other.counts = self.counts[:]
+        other.color_counts = self.color_counts[:]
+        other.length = self.length
+        other.mask = self.mask
+        return other
+
+    def clear(self) -> None:
+        """
+        Removes every card from the hand
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        self.counts = [0] * NUM_CARD_CODES
+        self.color_counts = [0] * NUM_COLORS
+        self.length = 0
+        self.mask = 0
+
+    def __iter__(self) -> Iterator[Card]:
+        """
+        Yields every card in the hand, ordered by color then label
+
+        Complexity:
+            Best Case Complexity:o(n) where n is the number of cards in the hand
+            Worst Case Complexity:o(n + NUM_CARD_CODES)
+        """
+        counts = self.counts
+        for code in range(NUM_CARD_CODES):
+            for _ in range(counts[code]):
+                yield CARD_TABLE[code]
+
+    def __getitem__(self, index: int) -> Card:
+        """
+        Returns the card at a position of the hand, ordered by color then label as
+        in __iter__, so a hand can still be indexed like the ArrayList it replaced
+
+        Args:
+            index (int): The position of the card, negative positions count from the end
+
+        Returns:
+            Card: The card at that position
+
+        Raises:
+            IndexError: if the position is outside the hand
+
+        Complexity:
+            Best Case Complexity:o(1) when the card is in the lowest code held
+            Worst Case Complexity:o(NUM_CARD_CODES)
+            - skips whole codes by their count, whatever the hand size
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Index out of range")
+        counts = self.counts
+        for code in range(NUM_CARD_CODES):
+            if index < counts[code]:
+                return CARD_TABLE[code]
+            index -= counts[code]
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the hand.
+        """
+        return f"[{', '.join(map(str, self))}]"
+
+    def __repr__(self) -> str:
+        """
+        Method to return the string representation of the Hand
+
+        Args:
+            None
+
+        Returns:
+            str: The string representation of the Hand
+        """
+        return str(self)
@@ -0,0 +1,333 @@
+"""
+Counters and histograms collected from the event stream of games.
+
+A MetricsCollector is attached to a game like an event log and only does
+work when events are recorded, so a game without one pays a single None
+check per event. Collectors from many games (or many worker processes)
+merge into one.
+
+Usage:
+```
+metrics = MetricsCollector()
+for seed in seeds:
+    game = Game(RandomGen(seed))
+    game.initialise_game(players)
+    game.attach_metrics(metrics)
+    game.play_game()
+print(metrics.to_dict())
+```
+"""
+from __future__ import annotations
+import time
+
+from card import CardLabel, NUM_LABELS
+from event_log import EventType
+
+__author__ = "Divyana (Divi) Ahuja"
+
+SPECIAL_LABELS = [label for label in CardLabel if label > CardLabel.NINE]
+
+
+class Histogram:
+    """
+    Histogram of non negative integers, with fixed width buckets or, when no
+    width is given, power of two buckets (bucket b holds values below 2^b)
+    """
+
+    def __init__(self, bucket_width: int = None) -> None:
+        """
+        Constructor for the Histogram class
+
+        Args:
+            bucket_width (int): The width of each bucket, None for power of two buckets
+
+        Returns:
+            None
+        """
+        self.bucket_width = bucket_width
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value: int) -> None:
+        """
+        Adds one value to the histogram
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        bucket = value.bit_length() if self.bucket_width is None else value // self.bucket_width
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: Histogram) -> None:
+        """
+        Adds every value of another histogram with the same buckets
+
+        Raises:
+            ValueError: if the histograms have different buckets
+
+        Complexity:
+            Best Case Complexity:o(b) where b is the number of buckets used
+            Worst Case Complexity:o(b)
+        """
+        if other.bucket_width != self.bucket_width:
+            raise ValueError("cannot merge histograms with different buckets")
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def mean(self) -> float:
+        """
+        Returns the mean of the values, 0 if there are none
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Returns the histogram as a dict keyed by the lower bound of each bucket
+        """
+        if self.bucket_width is None:
+            lower = lambda bucket: 0 if bucket == 0 else 1 << (bucket - 1)
+        else:
+            lower = lambda bucket: bucket * self.bucket_width
+        return {
+            "count": self.count,
+            "mean": self.mean(),
+            "max": self.max,
+            "buckets": {lower(bucket): self.buckets[bucket] for bucket in sorted(self.buckets)},
+        }
+
+
+class MetricsCollector:
+    """
+    Collects counters and histograms from the events of one or more games
+    """
+
+    GAME_LENGTH_BUCKET = 10
+
+    def __init__(self) -> None:
+        """
+        Constructor for the MetricsCollector class
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.games = 0
+        self.turns = 0
+        self.draws = 0           # cards drawn by a player on their own turn
+        self.penalty_cards = 0   # cards drawn because of a draw two or draw four
+        self.reshuffles = 0
+        self.plays = 0
+        self.plays_by_label = [0] * NUM_LABELS
+        self.hand_high_water = 0 # largest hand seen in any game
+        self.turn_duration_ns = Histogram()
+        self.game_length = Histogram(self.GAME_LENGTH_BUCKET)
+        self.game_hand_high_water = Histogram(1)
+
+        # state of the game currently being watched
+        self._hand_sizes = None
+        self._game_high_water = 0
+        self._game_turns = 0
+        self._turn_start = None
+        self._drawn_seat = None
+
+    def start(self, game) -> None:
+        """
+        Starts watching a game, called when the collector is attached to it
+
+        Args:
+            game (Game): The initialised game
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(n) where n is the number of players
+            Worst Case Complexity:o(n)
+        """
+        self._hand_sizes = [len(player.hand) for player in game.players.seats]
+        self._game_high_water = max(self._hand_sizes)
+        self._game_turns = 0
+        self._turn_start = None
+        self._drawn_seat = None
+
+    def record(self, event_type: EventType, seat: int, arg: int = 0) -> None:
+        """
+        Updates the counters with one event of the watched game
+
+        Args:
+            event_type (EventType): The type of the event
+            seat (int): The seat of the player the event belongs to
+            arg (int): The card code, colour or count of the event
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        if self._drawn_seat is not None:
+            # a card drawn on a turn is only kept if it was not played straight away
+            if event_type != EventType.PLAY:
+                self._grow_hand(self._drawn_seat)
+            self._drawn_seat = None
+
+        if event_type == EventType.TURN:
+            self._end_turn()
+            self._turn_start = time.perf_counter_ns()
+            self._game_turns += 1
+        elif event_type == EventType.PLAY:
+            self.plays += 1
+            self.plays_by_label[arg % NUM_LABELS] += 1
+            self._hand_sizes[seat] -= 1
+        elif event_type == EventType.DRAW:
+            self.draws += 1
+            self._hand_sizes[seat] += 1
+            self._drawn_seat = seat
+        elif event_type == EventType.PENALTY_DRAW:
+            self.penalty_cards += 1
+            self._hand_sizes[seat] += 1
+            self._grow_hand(seat)
+        elif event_type == EventType.RESHUFFLE:
+            self.reshuffles += 1
+        elif event_type == EventType.GAME_END:
+            self._end_turn()
+            self.games += 1
+            self.turns += self._game_turns
+            self.game_length.add(self._game_turns)
+            self.game_hand_high_water.add(self._game_high_water)
+            self.hand_high_water = max(self.hand_high_water, self._game_high_water)
+
+    def _grow_hand(self, seat: int) -> None:
+        """
+        Updates the high-water mark after a seat's hand got bigger.
+        """
+        if self._hand_sizes[seat] > self._game_high_water:
+            self._game_high_water = self._hand_sizes[seat]
+
+    def _end_turn(self) -> None:
+        """
+        Records the duration of the turn in progress, if any.
+        """
+        if self._turn_start is not None:
+            self.turn_duration_ns.add(time.perf_counter_ns() - self._turn_start)
+            self._turn_start = None
+
+    def flush(self) -> None:
+        """
+        Nothing is buffered, present so the collector can be attached like an event log
+        """
+
+    def special_plays(self) -> dict:
+        """
+        Returns the number of plays of each special card, keyed by label name
+        """
+        return {label.name: self.plays_by_label[label] for label in SPECIAL_LABELS}
+
+    def merge(self, other: MetricsCollector) -> None:
+        """
+        Adds the counters and histograms of another collector to this one
+
+        Args:
+            other (MetricsCollector): The collector to merge in
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(b) where b is the number of histogram buckets
+            Worst Case Complexity:o(b)
+        """
+        self.games += other.games
+        self.turns += other.turns
+        self.draws += other.draws
+        self.penalty_cards += other.penalty_cards
+        self.reshuffles += other.reshuffles
+        self.plays += other.plays
+        for label in range(NUM_LABELS):
+            self.plays_by_label[label] += other.plays_by_label[label]
+        self.hand_high_water = max(self.hand_high_water, other.hand_high_water)
+        self.turn_duration_ns.merge(other.turn_duration_ns)
+        self.game_length.merge(other.game_length)
+        self.game_hand_high_water.merge(other.game_hand_high_water)
+
+    def to_dict(self) -> dict:
+        """
+        Returns every counter and histogram as a JSON friendly dict
+        """
+        return {
+            "games": self.games,
+            "turns": self.turns,
+            "draws": self.draws,
+            "penalty_cards": self.penalty_cards,
+            "reshuffles": self.reshuffles,
+            "plays": self.plays,
+            "special_plays": self.special_plays(),
+            "hand_high_water": self.hand_high_water,
+            "turn_duration_ns": self.turn_duration_ns.to_dict(),
+            "game_length": self.game_length.to_dict(),
+            "game_hand_high_water": self.game_hand_high_water.to_dict(),
+        }
+
+
+class GameCounts:
+    """
+    Cards drawn and cards played by label in a single game, the per-game subset of
+    MetricsCollector without its timings and histograms, kept on each GameResult
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the GameCounts class
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.cards_drawn = 0 # on a player's own turn and as a penalty
+        self.plays_by_label = [0] * NUM_LABELS
+
+    def start(self, game) -> None:
+        """
+        Starts counting a game, called when the counts are attached to it
+        """
+        self.cards_drawn = 0
+        self.plays_by_label = [0] * NUM_LABELS
+
+    def record(self, event_type: EventType, seat: int, arg: int = 0) -> None:
+        """
+        Counts one event of the game
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        if event_type == EventType.PLAY:
+            self.plays_by_label[arg % NUM_LABELS] += 1
+        elif event_type == EventType.DRAW or event_type == EventType.PENALTY_DRAW:
+            self.cards_drawn += 1
+
+    def flush(self) -> None:
+        """
+        Nothing is buffered, present so the counts can be attached like an event log
+        """
+
+    def special_plays(self) -> tuple:
+        """
+        Returns the number of plays of each special card, in SPECIAL_LABELS order
+        """
+        return tuple(self.plays_by_label[label] for label in SPECIAL_LABELS)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from card import Card, CardColor, CardLabel
 from config import Config
+from hand import Hand
+from strategy import DEFAULT_STRATEGY, PlayableView, Strategy
 from data_structures import *
 from data_structures.array_list import ArrayList
 
@@ -11,13 +13,13 @@ class Player:
     Player class to store the player details
     """
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, strategy: Strategy = None) -> None:
         """
         Constructor for the Player class
 
         Args:
             name (str): The name of the player
-            position (int): The position of the player
+            strategy (Strategy): How the player picks cards and colours, defaults to LowestCardStrategy
 
         Returns:
             None
@@ -27,7 +29,9 @@ class Player:
             Worst Case Complexity:o(1)
         """
         self.name = name
-        self.hand = ArrayList(Config.DECK_SIZE)
+        self.hand = Hand()
+        self.seat = None # set when the player is seated in a TurnOrder
+        self.strategy = DEFAULT_STRATEGY if strategy is None else strategy
 
     def add_card(self, card: Card) -> None:
         """
@@ -47,6 +51,28 @@ class Player:
         
         self.hand.append(card)
 
+    def copy(self) -> Player:
+        """
+        Method to copy the player, the copy has its own hand holding the same cards
+
+        Args:
+            None
+
+        Returns:
+            Player: The copy of the player
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - the hand is copied as fixed size count tables
+        """
+        other = Player.__new__(Player)
+        other.name = self.name
+        other.hand = self.hand.copy()
+        other.seat = self.seat
+        other.strategy = self.strategy
+        return other
+
     def is_empty(self) -> bool:
         """
         Method to check if the player's hand is empty
@@ -80,84 +106,68 @@ class Player:
         return len(self.hand)
 
     def play_card(
-        self, current_color: CardColor, current_label: CardLabel
+        self, current_color: CardColor, current_label: CardLabel, players=None
     ) -> Card | None:
         """
-        Method to play a card from the player's hand
+        Method to play a card from the player's hand, the card is chosen by the player's strategy
 
         Args:
             current_color (CardColor): The current color of the game
             current_label (CardLabel): The current label of the game
+            players (TurnOrder): The turn order, lets the strategy see the other hands
 
         Returns:
-            Card: The first card that is playable from the player's hand
+            Card: The card chosen from the playable cards of the player's hand, by
+            default the first one by color then label, None if no card is played
+
+        Raises:
+            ValueError: if the strategy picks a card that is not playable or not in the hand
 
         Complexity:
-            -n is the number of cards in a players hand 
-            Best Case Complexity:o(n)
-            Worst Case Complexity:o(n^2)
-            - due to insertion sort  function being need  the worst case of insertion sort is o(n^2) 
-            and best case is o(1) of this function 
-            - iterating through the hand variable has a complexity of o(n)
-            therefore for the best case the complexity is o(n)+o(n) which is o(n) overall 
-            and for the worst case it is o(n^2) +o(n) which is o(n^2)
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - the hand is indexed by colour and label, so finding the lowest playable card
+            looks at a bounded number of slots whatever the hand size (see Hand.lowest_playable)
+            - removing a card from the hand is o(1)
         """
         # if the card is 1. same colour 2.same label or 3.black colour it is playable 
-       
-        playable_cards = ArrayList(Config.DECK_SIZE)
-
-        for i in range(len(self.hand)): #complexity o(n): iterates through all the cards in a player hand which is n 
-            if self.hand[i].color == current_color or self.hand[i].label == current_label or self.hand[i].color == CardColor.BLACK:
-                playable_cards.append(self.hand[i])
-
-       
-        if not playable_cards:# is it empty 
+        # the strategy picks one of them, which is removed from hand
+        view = PlayableView(self.hand, current_color, current_label, players, self)
+        card_to_play = self.strategy.choose_card(view)
+        if card_to_play is None:# nothing playable, or the strategy would rather draw
             return None
-        
-        # Sort by color first, then by label, then play the frist card and remove it from hand
-        
-        self.insertion_sort(playable_cards)
-            # order them by current colour and current lable
-        card_to_play = playable_cards[0]
+        if not view.is_playable(card_to_play):
+            raise ValueError(
+                f"{card_to_play} is not playable on {CardColor(current_color).name} {CardLabel(current_label).name}"
+            )
+
         self.hand.remove(card_to_play)
         return card_to_play
     
-    def insertion_sort(self,cards: ArrayList[Card]) -> None:
+    def choose_color(self, current_color: CardColor, current_label: CardLabel, rng, players=None) -> CardColor:
         """
-        Sorts the list of cards in place using Insertion Sort.
-        Sorting priority: Least color first, then least label.
+        Method to pick the colour named after the player plays a black card
 
         Args:
-            cards (list[Card]): List of playable cards.
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The label of the black card played
+            rng (RandomGen): The random stream of the game
+            players (TurnOrder): The turn order, lets the strategy see the other hands
 
         Returns:
-            None (Sorts in place)
-        complexity 
-            - n is the number of cards = len(cards)
-            worse:o(n^2)
+            CardColor: The colour chosen by the player's strategy
 
-            
-            - reversed sort is the worst case whereby 
-            the whole dec is in reverse, thereby we need to go once through the list 
-            to sort and annother to check if it is sorted 
+        Raises:
+            ValueError: if the strategy picks black, or anything that is not a colour
 
-
-            best :o(n)
-
-
-            the function will go through the whole list once to check if the list 
-            is sorted. 
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1) for the default strategy
         """
-        
-        for index in range(1, len(cards)):  # Start from the second element
-            temp = cards[index]  # Store the card to be inserted
-            i = index - 1
-            while index-1 >= 0 and (cards[index-1].color > temp.color or 
-                            (cards[index -1].color == temp.color and cards[index -1].label > temp.label)):
-                cards[index] = cards[index-1]  # Shift the larger card to the right
-                index-= 1
-            cards[index] = temp  # Place the temp card in its correct position
-
+        color = self.strategy.choose_color(PlayableView(self.hand, current_color, current_label, players, self), rng)
+        if not isinstance(color, int) or not 0 <= color < CardColor.BLACK:# an int colour other than black
+            raise ValueError(f"{color!r} is not a colour that can be chosen")
+        return CardColor(color)
 
     def __str__(self) -> str:
         """
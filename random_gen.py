@@ -6,6 +6,25 @@ __author__ = "dahu0002, divyana ahuaj"
 
 import time
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, random_many falls back to plain Python
+    np = None
+
+
+class _streammethod:
+    """
+    Method that runs against the object's own stream when called on a RandomGen
+    instance, and against the shared class-level stream when called on RandomGen itself.
+    """
+
+    def __init__(self, func) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, objtype=None):
+        return self.func.__get__(objtype if obj is None else obj, objtype)
+
 
 class RandomGen:
     """
@@ -13,12 +32,22 @@ class RandomGen:
 
     Uses LCG method. All methods are O(1) best/worst case time complexity unless stated otherwise.
 
+    Calling the methods on the class uses one shared stream. Creating a RandomGen
+    object gives an independent stream with its own seed, which can be handed to a
+    Game so that concurrent games do not interfere with each other.
+
     Usage:
     ```
     RandomGen.set_seed(123)
     RandomGen.random()           # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+
+    RandomGen.random_many(100)   # The next 100 numbers in one call
+
+    rng = RandomGen(123)         # Independent stream, same numbers as RandomGen.set_seed(123)
+    rng.jump(1000)               # Skip the next 1000 numbers in O(log 1000)
+    game_k = rng.split(k)        # Stream k of a sweep, STREAM_STRIDE numbers apart
     ```
     """
 
@@ -26,51 +55,206 @@ class RandomGen:
     A: int = 25214903917
     C: int = 11
 
+    # Numbers reserved for each stream handed out by split
+    STREAM_STRIDE: int = pow(2, 32)
+
+    # When True random_shuffle reproduces the original sort-based ordering (golden transcripts),
+    # when False it uses an O(N) Fisher-Yates shuffle. Can be set per stream.
+    legacy_shuffle: bool = True
+
     seed = time.time_ns()
 
-    @classmethod
+    # Cached (A^k, C_k) for k = 1..len, used by the NumPy path of random_many
+    _jump_table = None
+
+    def __init__(self, seed: int = None) -> None:
+        """Creates an independent stream, seeded like `set_seed`."""
+        self.seed = time.time_ns() if seed is None else seed
+
+    @_streammethod
     def set_seed(cls, seed: int = None) -> None:
         """Seed all future calls to `random`."""
         seed = time.time_ns() if seed is None else seed
         cls.seed = seed
 
-    @classmethod
+    @_streammethod
     def random(cls) -> int:
         """Returns a random integer from 0 to 2^32-1"""
         cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
         return cls.seed >> 16
 
-    @classmethod
+    @_streammethod
     def random_float(cls) -> float:
         """Returns a random floating point integer in the range 0 to 1."""
         return cls.random() / (1 << 32)
 
-    @classmethod
+    @_streammethod
     def randint(cls, lo: int, hi: int) -> int:
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
         return (cls.random() % (hi - lo + 1)) + lo
 
-    @classmethod
+    @_streammethod
     def random_chance(cls, ratio: float) -> bool:
         """Returns random()/2^32 < ratio"""
         return cls.random_float() < ratio
 
-    @classmethod
+    @_streammethod
     def random_choice(cls, collection) -> None:
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
         return collection[cls.randint(0, len(collection) - 1)]
 
+    @_streammethod
+    def random_many(cls, n: int, out=None, use_numpy: bool = False):
+        """
+        Returns the next `n` numbers of `random` in one call, written into `out[0:n]`.
+        `out` defaults to a new list, or a NumPy uint64 array when `use_numpy` is set.
+        :complexity: O(n)
+        """
+        if use_numpy and np is None:
+            raise ImportError("random_many(use_numpy=True) requires NumPy")
+        if use_numpy or (np is not None and isinstance(out, np.ndarray)):
+            return cls._random_many_numpy(n, out)
+
+        if out is None:
+            out = [0] * n
+        seed, a, c, mod = cls.seed, cls.A, cls.C, cls.MOD
+        for i in range(n):
+            seed = (a * seed + c) % mod
+            out[i] = seed >> 16
+        cls.seed = seed
+        return out
+
+    @_streammethod
+    def _random_many_numpy(cls, n: int, out):
+        """
+        Vectorised random_many: x_k = (A^k * x_0 + C_k) mod 2^48 for every k at once.
+        uint64 arithmetic wraps mod 2^64, which is exact mod 2^48 after masking.
+        :complexity: O(n)
+        """
+        if out is None:
+            out = np.empty(n, dtype=np.uint64)
+        if n == 0:
+            return out
+        a_k, c_k = RandomGen._numpy_jump_table(n)
+        mask = np.uint64(cls.MOD - 1)
+        # the state is only defined mod 2^48, a negative or wider seed would not fit a uint64
+        states = (a_k * np.uint64(cls.seed % cls.MOD) + c_k) & mask
+        np.right_shift(states, np.uint64(16), out=out[:n])
+        cls.seed = int(states[n - 1])
+        return out
+
     @classmethod
-    def random_shuffle(cls, collection) -> None:
+    def _numpy_jump_table(cls, n: int):
+        """
+        Returns the first n entries of the (A^k, C_k) tables, growing the cached tables by doubling.
+        :complexity: O(n) amortised
+        """
+        table = cls._jump_table
+        if table is None:
+            table = (np.array([cls.A], dtype=np.uint64), np.array([cls.C], dtype=np.uint64))
+        mask = np.uint64(cls.MOD - 1)
+        while len(table[0]) < n:
+            a_k, c_k = table
+            a_m, c_m = a_k[-1], c_k[-1]
+            # f^(m+j) = f^j after f^m: a_(m+j) = a_j * a_m, c_(m+j) = a_j * c_m + c_j
+            table = (
+                np.concatenate((a_k, (a_k * a_m) & mask)),
+                np.concatenate((c_k, (a_k * c_m + c_k) & mask)),
+            )
+        cls._jump_table = table
+        return table[0][:n], table[1][:n]
+
+    @_streammethod
+    def random_shuffle(cls, collection, legacy: bool = None) -> None:
         """
         Randomly shuffles a collection of cards that supports __getitem__, __setitem__ and __len__
-        :complexity: O(NlogN) where N is the number of elements in the collection.
+        `legacy` defaults to the stream's `legacy_shuffle` flag.
+        :complexity: O(NlogN) in legacy mode, O(N) otherwise, where N is the number of elements in the collection.
         """
+        legacy = cls.legacy_shuffle if legacy is None else legacy
+        if not legacy:
+            cls.fisher_yates_shuffle(collection)
+            return
+
+        n = len(collection)
         cards = [card for card in collection]
-        
+
         cards.sort(key=lambda x: (x.color, x.label))
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
-        positions.sort()  # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
-        tmp = [cards[p[1]] for p in positions]
-        for x in range(len(cards)):
-            collection[x] = tmp[x]
+        positions = cls.permutation(n, True)
+        for x in range(n):
+            collection[x] = cards[positions[x]]
+
+    @_streammethod
+    def permutation(cls, n: int, legacy: bool = None) -> list:
+        """
+        Returns the order random_shuffle puts n elements in, as the index of the element that ends
+        up at each position, drawing the same numbers but without touching any collection.
+        In legacy mode the indices are into the elements sorted by card, as that shuffle sorts first.
+        `legacy` defaults to the stream's `legacy_shuffle` flag.
+        :complexity: O(NlogN) in legacy mode, O(N) otherwise.
+        """
+        legacy = cls.legacy_shuffle if legacy is None else legacy
+        if not legacy:
+            positions = list(range(n))
+            cls.fisher_yates_shuffle(positions)
+            return positions
+        # Stable sort of the indices by value is the same order as sorting (value, index) pairs
+        values = cls.random_many(n)
+        return sorted(range(n), key=values.__getitem__)  # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
+
+    @_streammethod
+    def fisher_yates_shuffle(cls, collection) -> None:
+        """
+        Shuffles a collection that supports __getitem__, __setitem__ and __len__ in place.
+        Unlike the legacy shuffle the result depends on the starting order of the collection.
+        :complexity: O(N) where N is the number of elements in the collection.
+        """
+        n = len(collection)
+        values = cls.random_many(n - 1) if n > 1 else None
+        for i in range(n - 1, 0, -1):
+            j = values[n - 1 - i] % (i + 1)
+            collection[i], collection[j] = collection[j], collection[i]
+
+    @_streammethod
+    def copy(cls) -> "RandomGen":
+        """Returns an independent stream at the same position, with the same shuffle mode."""
+        other = RandomGen(cls.seed)
+        other.legacy_shuffle = cls.legacy_shuffle
+        return other
+
+    @classmethod
+    def jump_coefficients(cls, steps: int) -> tuple:
+        """
+        Returns (a, c) such that advancing the stream `steps` times maps seed to (a * seed + c) % MOD.
+        :complexity: O(log steps)
+        """
+        a_total, c_total = 1, 0
+        a, c = cls.A, cls.C
+        while steps > 0:
+            if steps & 1:
+                a_total = (a * a_total) % cls.MOD
+                c_total = (a * c_total + c) % cls.MOD
+            c = (c * (a + 1)) % cls.MOD
+            a = (a * a) % cls.MOD
+            steps >>= 1
+        return a_total, c_total
+
+    @_streammethod
+    def jump(cls, steps: int) -> None:
+        """
+        Advances the stream as if `random` had been called `steps` times.
+        :complexity: O(log steps)
+        """
+        a, c = cls.jump_coefficients(steps)
+        cls.seed = (a * cls.seed + c) % cls.MOD
+
+    @_streammethod
+    def split(cls, index: int, stride: int = None) -> "RandomGen":
+        """
+        Returns a new independent stream starting `index * stride` numbers ahead of this one.
+        The current stream is left untouched, so split(k) always gives the same stream k.
+        :complexity: O(log(index * stride))
+        """
+        stride = cls.STREAM_STRIDE if stride is None else stride
+        a, c = cls.jump_coefficients(index * stride)
+        return RandomGen((a * cls.seed + c) % cls.MOD)
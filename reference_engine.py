@@ -0,0 +1,248 @@
+"""
+Frozen reference implementation of the game rules, for verify_engine.
+
+This is a re-implementation, not the baseline code itself: it plays what the
+baseline Game.play_game did with the default player strategy and the legacy
+reshuffle, written against lists and integer card codes only, and was checked
+game for game against the baseline engine over seeded games before it became
+the reference. It shares no code with the engine (no Hand, CardPile,
+TurnOrder, PlayableView or RandomGen), so a change to any of those, however
+well meant, shows up as a difference against this module. Only change it when the rules themselves are meant to change.
+
+The quirks of the original engine are kept on purpose: only number cards
+go to the discard pile, black cards name a random colour, a reverse makes
+the player after the reversing player the current one (so in a two player
+game the same player plays again), and running out of cards in the middle
+of a turn ends the game as a draw without that turn.
+
+Usage:
+```
+game = ReferenceGame(seed=123, num_players=3, num_cards=7)
+for turn in iter(game.step, None):
+    print(turn)
+print(game.outcome, game.winner, game.hands)
+```
+"""
+from __future__ import annotations
+
+from card import CardColor, CardLabel
+
+__author__ = "Divyana (Divi) Ahuja"
+
+# the random stream of RandomGen
+A = 25214903917
+C = 11
+MOD = 2 ** 48
+
+NUM_LABELS = len(CardLabel)
+NUM_CODES = len(CardColor) * NUM_LABELS
+BLACK = int(CardColor.BLACK)
+NINE = int(CardLabel.NINE)
+SKIP = int(CardLabel.SKIP)
+REVERSE = int(CardLabel.REVERSE)
+DRAW_TWO = int(CardLabel.DRAW_TWO)
+DRAW_FOUR = int(CardLabel.DRAW_FOUR)
+
+WIN, DRAW, ABORTED = 0, 1, 2 # values of GameOutcome
+
+
+class OutOfCards(Exception):
+    """
+    Raised when a card has to be drawn and there is none left
+    """
+
+
+def deck_codes(num_decks: int = 1) -> list:
+    """
+    Returns the card codes of num_decks decks: per colour two of each number and special
+    card, plus four black crazy and four black draw four cards per deck
+    """
+    codes = []
+    for color in range(len(CardColor)):
+        for label in range(NUM_LABELS):
+            code = color * NUM_LABELS + label
+            if color == BLACK:
+                codes += [code] * (4 if label > DRAW_TWO else 0)
+            elif label <= DRAW_TWO:
+                codes += [code] * 2
+    return codes * num_decks
+
+
+class ReferenceGame:
+    """
+    A game played by the reference rules, one turn per call to step
+    """
+
+    def __init__(self, seed: int, num_players: int, num_cards: int, num_decks: int = 1,
+                 max_rounds_per_player: int = 1000, max_rounds_without_progress: int = 500) -> None:
+        """
+        Constructor for the ReferenceGame class, deals the game
+
+        Args:
+            seed (int): The seed of the random stream, as given to RandomGen
+            num_players (int): The number of players
+            num_cards (int): The number of cards dealt to each player
+            num_decks (int): The number of decks shuffled together
+            max_rounds_per_player (int): Config.MAX_ROUNDS_PER_PLAYER
+            max_rounds_without_progress (int): Config.MAX_ROUNDS_WITHOUT_PROGRESS
+
+        Returns:
+            None
+        """
+        self.seed = seed
+        self.hands = [[0] * NUM_CODES for _ in range(num_players)] # count of each code per seat
+        self.draw_pile = []    # top of the pile last, like the discard pile
+        self.discard_pile = []
+        self.reshuffles = 0
+        self.cursor = 0
+        self.direction = 1
+        self.current = None
+        self.color = None
+        self.label = None
+        self.turns = 0
+        self.outcome = None
+        self.winner = None
+        self.max_turns = max_rounds_per_player * num_players
+        self.stalemate_turns = max_rounds_without_progress * num_players
+
+        self.draw_pile = self._shuffle(deck_codes(num_decks))[::-1]
+        try:
+            for _ in range(num_cards):
+                for seat in range(num_players):
+                    self.hands[seat][self._draw()] += 1
+            code = self._draw()
+            while code % NUM_LABELS > NINE:
+                self.discard_pile.append(code)
+                if not self.draw_pile:
+                    raise OutOfCards
+                code = self._draw()
+        except OutOfCards:
+            self.outcome = DRAW
+            return
+        self.discard_pile.append(code)
+        self.color, self.label = divmod(code, NUM_LABELS)
+
+        self.current = self._advance()
+        self.lowest_hand = min(sum(hand) for hand in self.hands)
+        self.last_progress_turn = 0
+
+    def _random(self) -> int:
+        """
+        Returns the next number of the random stream.
+        """
+        self.seed = (A * self.seed + C) % MOD
+        return self.seed >> 16
+
+    def _shuffle(self, codes: list) -> list:
+        """
+        Returns the cards in shuffled order: sorted by code, then ordered by one random
+        number each, ties kept in code order.
+        """
+        codes = sorted(codes)
+        values = [self._random() for _ in codes]
+        return [codes[i] for i in sorted(range(len(codes)), key=lambda i: values[i])]
+
+    def _draw(self) -> int:
+        """
+        Takes the top card of the draw pile, shuffling the whole discard pile back first if it is empty.
+        """
+        if not self.draw_pile:
+            if not self.discard_pile:
+                raise OutOfCards
+            self.draw_pile = self._shuffle(self.discard_pile)[::-1]
+            self.discard_pile = []
+            self.reshuffles += 1
+        return self.draw_pile.pop()
+
+    def _advance(self) -> int:
+        """
+        Returns the seat at the front of the turn order and moves the front on.
+        """
+        seat = self.cursor
+        self.cursor = (self.cursor + self.direction) % len(self.hands)
+        return seat
+
+    def _playable(self, code: int) -> bool:
+        """
+        Returns True if the card can be played on the current colour and label.
+        """
+        color, label = divmod(code, NUM_LABELS)
+        return color == BLACK or color == self.color or label == self.label
+
+    def step(self) -> tuple | None:
+        """
+        Plays one turn
+
+        Returns:
+            tuple: (turn, seat, card code or -1, drew, colour, label) with the colour and
+            label after the turn, None once the game is over
+        """
+        if self.outcome is not None:
+            return None
+        if sum(self.hands[self.current]) == 0:
+            self.outcome, self.winner = WIN, self.current
+            return None
+        if self.turns >= self.max_turns:
+            self.outcome = ABORTED
+            return None
+        if self.turns - self.last_progress_turn >= self.stalemate_turns:
+            self.outcome = DRAW
+            return None
+        try:
+            return self._turn()
+        except OutOfCards:
+            self.outcome = DRAW
+            return None
+
+    def _turn(self) -> tuple:
+        """
+        Plays the turn of the next player, see step.
+        """
+        if self.turns != 0:
+            self.current = self._advance()
+        self.turns += 1
+        seat = self.current
+        hand = self.hands[seat]
+
+        card = -1
+        for code in range(NUM_CODES):# lowest playable card by colour then label
+            if hand[code] and self._playable(code):
+                card = code
+                hand[code] -= 1
+                break
+        drew = card == -1
+        if drew:
+            code = self._draw()
+            if not self._playable(code):
+                hand[code] += 1
+                return (self.turns, seat, -1, True, self.color, self.label)
+            card = code
+
+        if sum(hand) < self.lowest_hand:
+            self.lowest_hand = sum(hand)
+            self.last_progress_turn = self.turns
+        self.color, self.label = divmod(card, NUM_LABELS)
+        if self.label <= NINE:
+            self.discard_pile.append(card)
+        elif self.color == BLACK:
+            self.color = self._random() % 4
+            if self.label == DRAW_FOUR:
+                for _ in range(4):
+                    self.hands[self.cursor][self._draw()] += 1
+                self._advance()
+        elif self.label == DRAW_TWO:
+            for _ in range(2):
+                self.hands[self.cursor][self._draw()] += 1
+        elif self.label == REVERSE:
+            self.cursor = (self.cursor - self.direction) % len(self.hands)
+            self.direction = -self.direction
+            self.current = self._advance()
+        elif self.label == SKIP:
+            self._advance()
+        return (self.turns, seat, card, drew, self.color, self.label)
+
+    def hand_codes(self) -> list:
+        """
+        Returns the cards of every hand as sorted codes, one list per seat
+        """
+        return [[code for code in range(NUM_CODES) for _ in range(hand[code])] for hand in self.hands]
@@ -1,6 +1,196 @@
+"""
+Runs the unit tests, optionally only those of one task, across worker processes.
+
+Tests are found by reading the test files, not importing them, so only the
+modules holding the selected tests are ever imported. The selected tests are
+split into one shard per worker, balanced on how long each test took last
+time, and every shard runs in its own process.
+
+Passing tests are cached in .test_cache.json against a hash of the sources
+(the .py and .md files of the root and its packages, the golden transcripts
+included). A cached test is skipped until a source file changes. Use
+--no-cache to run everything.
+
+Usage:
+```
+python run_tests.py 4
+python run_tests.py --jobs 8 --no-cache
+```
+"""
 import argparse
+import ast
+import hashlib
+import json
+import multiprocessing
+import os
 import re
+import sys
+import time
 import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+CACHE_FILE = ROOT / ".test_cache.json"
+SOURCE_SUFFIXES = (".py", ".md")
+
+
+def discover(root: Path, task="") -> list:
+    """
+    Returns the (test id, number) of every test method whose @number starts with the task,
+    in file and source order, without importing anything
+    """
+    tests = []
+    for path in sorted(root.rglob("test*.py")):
+        package = path.parent.relative_to(root)
+        if any(part.startswith(".") or part == "__pycache__" for part in package.parts):
+            continue
+        if not all((root / Path(*package.parts[:i + 1]) / "__init__.py").exists() for i in range(len(package.parts))):
+            continue # unittest discovery only enters packages
+        module = ".".join(package.parts + (path.stem,))
+        tree = ast.parse(path.read_text(encoding="utf-8"), str(path))
+        for cls in tree.body:
+            if not isinstance(cls, ast.ClassDef):
+                continue
+            for func in cls.body:
+                if isinstance(func, ast.FunctionDef) and func.name.startswith("test"):
+                    number = _number(func)
+                    if task and not re.match(rf"^{task}\.", number):
+                        continue
+                    tests.append((f"{module}.{cls.name}.{func.name}", number))
+    return tests
+
+
+def _number(func: ast.FunctionDef) -> str:
+    """
+    Returns the argument of the @number decorator of a test method, "" if it has none.
+    """
+    for decorator in func.decorator_list:
+        if not isinstance(decorator, ast.Call) or not decorator.args:
+            continue
+        name = decorator.func.id if isinstance(decorator.func, ast.Name) else getattr(decorator.func, "attr", "")
+        if name == "number" and isinstance(decorator.args[0], ast.Constant):
+            return str(decorator.args[0].value)
+    return ""
+
+
+def source_files(root: Path) -> list:
+    """
+    Returns the source files and golden transcripts of the repo: the .py and .md files at
+    the root and in its packages (directories with an __init__.py), so a virtualenv or any
+    other directory that happens to sit under the root is not read
+    """
+    files = []
+    directories = [root]
+    while directories:
+        directory = directories.pop()
+        for path in directory.iterdir():
+            if path.is_dir():
+                if not path.name.startswith(".") and path.name != "__pycache__" and (path / "__init__.py").exists():
+                    directories.append(path)
+            elif path.suffix in SOURCE_SUFFIXES:
+                files.append(path)
+    return sorted(files)
+
+
+def source_hash(root: Path) -> str:
+    """
+    Returns a hash of every source file and golden transcript of the repo, see source_files
+    """
+    digest = hashlib.sha256()
+    for path in source_files(root):
+        digest.update(str(path.relative_to(root)).encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def shard(test_ids: list, jobs: int, durations: dict) -> list:
+    """
+    Splits the tests into at most `jobs` shards of about the same total duration,
+    each shard keeping the source order of its tests
+    """
+    order = {test_id: i for i, test_id in enumerate(test_ids)}
+    shards = [[] for _ in range(min(jobs, len(test_ids)))]
+    loads = [0.0] * len(shards)
+    for test_id in sorted(test_ids, key=lambda t: -durations.get(t, 1.0)):
+        i = loads.index(min(loads))
+        shards[i].append(test_id)
+        loads[i] += durations.get(test_id, 1.0)
+    return [sorted(tests, key=order.__getitem__) for tests in shards]
+
+
+class _Result(unittest.TestResult):
+    """
+    Collects the status, message and duration of every test as plain tuples
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.outcomes = []
+        self.started = 0.0
+
+    def startTest(self, test) -> None:
+        super().startTest(test)
+        self.started = time.perf_counter()
+
+    def _add(self, test, status: str, message: str = "") -> None:
+        self.outcomes.append((test.id(), status, message, time.perf_counter() - self.started))
+
+    def addSuccess(self, test) -> None:
+        self._add(test, "ok")
+
+    def addFailure(self, test, err) -> None:
+        self._add(test, "FAIL", self._exc_info_to_string(err, test))
+
+    def addError(self, test, err) -> None:
+        self._add(test, "ERROR", self._exc_info_to_string(err, test))
+
+    def addSkip(self, test, reason) -> None:
+        self._add(test, "skipped", reason)
+
+    def addExpectedFailure(self, test, err) -> None:
+        self._add(test, "expected failure")
+
+    def addUnexpectedSuccess(self, test) -> None:
+        self._add(test, "unexpected success")
+
+
+def run_shard(test_ids: list) -> list:
+    """
+    Imports and runs one shard of tests in this process and returns their outcomes
+    """
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    result = _Result()
+    for test_id in test_ids:
+        try:
+            suite = unittest.defaultTestLoader.loadTestsFromName(test_id)
+        except Exception as e:
+            result.outcomes.append((test_id, "ERROR", f"could not load {test_id}: {e!r}", 0.0))
+            continue
+        suite.run(result)
+    return result.outcomes
+
+
+def load_cache() -> dict:
+    """
+    Returns the cache of passing tests, empty if there is none or it is unreadable
+    """
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict) -> None:
+    """
+    Writes the cache of passing tests through a temporary file, so it is never left half written
+    """
+    tmp = CACHE_FILE.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(tmp, CACHE_FILE)
 
 
 if __name__ == "__main__":
@@ -17,32 +207,73 @@ if __name__ == "__main__":
         default="",
         nargs="?",
     )
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes.")
+    p.add_argument("--no-cache", action="store_true", help="Run every selected test, even cached ones.")
     args = p.parse_args()
 
-    while args.task == "":
-        try:
-            task = input("Enter task [1 - 4], leave blank to run all tests: ")
-            if task == "":
-                break
-            if 1 <= int(task) <= 4:
-                args.task = int(task)
-        except ValueError:
-            pass
-
-    suite = unittest.defaultTestLoader.discover(".")
-    for s in suite:
-        for t in s:
-            if "FailedTest" in str(type(t)):
-                continue
-            marked_remove = set()
-            for t2 in t:
-                func = getattr(t2, t2._testMethodName)
-                if args.task and not re.match(
-                    rf"^{args.task}\.", getattr(func, "__number__", "")
-                ):
-                    marked_remove.add(t2)
-            for t2 in marked_remove:
-                t._tests.remove(t2)
-
-    runner = unittest.runner.TextTestRunner(verbosity=2)
-    runner.run(suite)
+    if args.task == "" and sys.stdin.isatty():
+        tasks = sorted({int(number.split(".")[0]) for _, number in discover(ROOT) if number.split(".")[0].isdigit()})
+        while tasks:
+            try:
+                task = input(f"Enter task [{tasks[0]} - {tasks[-1]}], leave blank to run all tests: ")
+                if task == "":
+                    break
+                if int(task) in tasks:
+                    args.task = int(task)
+                    break
+            except ValueError:
+                pass
+
+    start = time.perf_counter()
+    tests = discover(ROOT, args.task)
+    cache = load_cache()
+    key = source_hash(ROOT)
+    if cache.get("key") != key:
+        cache = {"key": key, "passed": {}, "durations": cache.get("durations", {})}
+    passed = cache["passed"]
+    durations = cache["durations"]
+
+    cached = set() if args.no_cache else {test_id for test_id, _ in tests if test_id in passed}
+    to_run = [test_id for test_id, _ in tests if test_id not in cached]
+    shards = shard(to_run, max(1, args.jobs), durations)
+    if len(shards) > 1:
+        with multiprocessing.Pool(len(shards)) as pool:
+            outcomes = [outcome for shard_outcomes in pool.map(run_shard, shards) for outcome in shard_outcomes]
+    else:
+        outcomes = run_shard(to_run)
+
+    by_id = {outcome[0]: outcome for outcome in outcomes}
+    # errors outside any test, e.g. a failing setUpClass, are reported for the tests they stopped
+    selected = set(to_run)
+    setup_errors = "\n".join(message for test_id, _, message, _ in outcomes if test_id not in selected)
+    failed = []
+    for test_id, number in tests:
+        label = f"{number}: {test_id}" if number else test_id
+        if test_id in cached:
+            print(f"{label} ... ok (cached)")
+            continue
+        if test_id not in by_id:# never ran
+            by_id[test_id] = (test_id, "ERROR", setup_errors or "the test did not run", 0.0)
+        _, status, message, duration = by_id[test_id]
+        print(f"{label} ... {status}")
+        durations[test_id] = duration
+        if status == "ok":
+            passed[test_id] = True
+        else:
+            passed.pop(test_id, None)
+            if status in ("FAIL", "ERROR", "unexpected success"):
+                failed.append(by_id[test_id])
+    save_cache(cache)
+
+    for test_id, status, message, _ in failed:
+        print("=" * 70)
+        print(f"{status}: {test_id}")
+        print("-" * 70)
+        print(message)
+    print("-" * 70)
+    print(f"Ran {len(tests)} tests in {time.perf_counter() - start:.3f}s on {len(shards)} shards, {len(cached)} cached")
+    print()
+    if failed:
+        print(f"FAILED (failures={len(failed)})")
+        sys.exit(1)
+    print("OK")
@@ -0,0 +1,450 @@
+"""
+Asyncio game server hosting many concurrent tables in one process.
+
+Each table is a Game with its own RandomGen stream (split from the server's
+stream by table number, or seeded by the client), so tables never share
+random state. The game is played one Game.play_turn at a time: bot seats
+play inline and the table yields to the event loop after every turn, while
+a human seat is sent the position and awaited, with a per-turn timeout after
+which the default strategy plays for them.
+
+Clients talk newline delimited JSON over TCP:
+```
+client: {"type": "join", "name": "Alice", "bots": 3, "seed": 42}        seed is optional
+server: {"type": "joined", "table": 7, "seat": 0, "players": ["Alice", "bot1", "bot2", "bot3"]}
+server: {"type": "turn", "turn": 12, "color": 1, "label": 4, "hand": [...], "playable": [...],
+         "opponents": [5, 7, 2], "timeout": 5.0}                          cards are card codes
+client: {"type": "play", "turn": 12, "card": 19, "color": null}         card null to draw,
+                                                                         color after a black card
+server: {"type": "end", "winner": "Alice", "outcome": "WIN", "turns": 40}
+```
+
+A reply must carry the turn number of the prompt it answers. Replies to an
+earlier turn, such as one that arrived after its timeout, are dropped.
+
+Writes wait for the client to drain (back-pressure), and at most max_tables
+tables run at once, further joins wait for a free table.
+
+Usage:
+```
+python server.py serve --port 8765
+python server.py loadtest --tables 2000 --bots 3
+```
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import time
+
+from card import Card, CardColor
+from config import Config
+from data_structures.array_list import ArrayList
+from game import Game
+from metrics import Histogram
+from player import Player
+from random_gen import RandomGen
+from strategy import LowestCardStrategy, PlayableView
+
+__author__ = "Divyana (Divi) Ahuja"
+
+_AUTO = object() # no choice from the client, the default strategy plays
+LATENCY_BUCKET_NS = 10000 # turn latencies are counted in 10 microsecond buckets
+
+
+class SeatStrategy(LowestCardStrategy):
+    """
+    Strategy of a human seat: plays the card the client picked for this turn, and
+    falls back to the default strategy when the client did not answer in time or
+    picked a card it cannot play
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the SeatStrategy class
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.card = _AUTO
+        self.color = None
+
+    def choose(self, card, color: CardColor | None) -> None:
+        """
+        Sets the choice for the coming turn: the card to play (None to draw, _AUTO to
+        leave it to the default strategy) and the colour to name if a black card is played
+        """
+        self.card = card
+        self.color = color
+
+    def choose_card(self, view: PlayableView) -> Card | None:
+        """
+        Returns the card chosen by the client if it can be played, else the default choice
+        """
+        card, self.card = self.card, _AUTO
+        if card is None:# the client chose to draw
+            return None
+        if card is _AUTO or not view.count(card) or not view.is_playable(card):
+            return view.lowest_playable()
+        return card
+
+    def choose_color(self, view: PlayableView, rng) -> CardColor:
+        """
+        Returns the colour chosen by the client, a random one if they did not choose
+        """
+        color, self.color = self.color, None
+        if color is None or color == CardColor.BLACK:
+            return super().choose_color(view, rng)
+        return color
+
+
+class Connection:
+    """
+    A client connection speaking newline delimited JSON
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Constructor for the Connection class
+
+        Args:
+            reader (asyncio.StreamReader): The stream the client's messages are read from
+            writer (asyncio.StreamWriter): The stream messages to the client are written to
+
+        Returns:
+            None
+        """
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, message: dict) -> None:
+        """
+        Sends one message, waiting while the client is not reading (back-pressure)
+        """
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        await self.writer.drain()
+
+    async def receive(self) -> dict | None:
+        """
+        Returns the next message, None once the client has disconnected
+
+        Raises:
+            ValueError: if the client sends something that is not a JSON object
+        """
+        line = await self.reader.readline()
+        if not line:
+            return None
+        message = json.loads(line)
+        if not isinstance(message, dict):
+            raise ValueError("messages must be JSON objects")
+        return message
+
+    async def close(self) -> None:
+        """
+        Closes the connection
+        """
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class Table:
+    """
+    One game played turn by turn, with bot seats and at most one connected human seat
+    """
+
+    def __init__(self, table_id: int, rng: RandomGen, names, connections: dict, turn_timeout: float) -> None:
+        """
+        Constructor for the Table class, deals the game
+
+        Args:
+            table_id (int): The number of the table
+            rng (RandomGen): The random stream of this table only
+            names: The player names in seat order
+            connections (dict): The Connection of each human seat, by seat number
+            turn_timeout (float): Seconds a human seat has to answer before the default strategy plays
+
+        Returns:
+            None
+        """
+        self.table_id = table_id
+        self.connections = connections
+        self.turn_timeout = turn_timeout
+        self.turn_latency = Histogram(LATENCY_BUCKET_NS) # ns from the end of one turn to the end of the next
+        players: ArrayList[Player] = ArrayList(len(names))
+        for seat in range(len(names)):
+            players.insert(seat, Player(names[seat], SeatStrategy() if seat in connections else None))
+        self.game = Game(rng)
+        self.game.initialise_game(players)
+
+    async def run(self) -> Player | None:
+        """
+        Plays the game to the end, yielding to the event loop after every turn
+
+        Returns:
+            Player: The winner, None if the game ended without a winner
+        """
+        game = self.game
+        game.start_play()
+        last = time.perf_counter_ns()
+        while not game.is_over():# never prompt for a turn that will not be played
+            player = game.player_to_move()
+            connection = self.connections.get(player.seat)
+            if connection is not None:
+                await self._ask(connection, player)
+            going = game.play_turn()
+            self.turn_latency.add(time.perf_counter_ns() - last)
+            if not going:
+                break
+            await asyncio.sleep(0) # let the other tables play
+            last = time.perf_counter_ns()
+
+        winner = game.winner()
+        end = {
+            "type": "end",
+            "winner": None if winner is None else winner.name,
+            "outcome": game.outcome.name,
+            "turns": game.turns,
+        }
+        for connection in self.connections.values():
+            await connection.send(end)
+        return winner
+
+    async def _ask(self, connection: Connection, player: Player) -> None:
+        """
+        Sends the position to a human seat and sets their choice for the turn,
+        leaving the default strategy to play if they do not answer in time.
+        """
+        game = self.game
+        view = PlayableView(player.hand, game.current_color, game.current_label, game.players, player)
+        playable = [card.code for card in view.playable()]
+        turn = game.turns + 1
+        await connection.send({
+            "type": "turn",
+            "turn": turn,
+            "color": int(game.current_color),
+            "label": int(game.current_label),
+            "hand": [card.code for card in player.hand],
+            "playable": playable,
+            "opponents": view.opponent_hand_sizes(),
+            "timeout": self.turn_timeout,
+        })
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.turn_timeout
+        while True:
+            try:
+                message = await asyncio.wait_for(connection.receive(), max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                return
+            if message is None:
+                return
+            if message.get("type") == "play" and message.get("turn") == turn:
+                break
+            # a late answer to an earlier prompt, or not an answer at all
+        card = message.get("card")
+        color = message.get("color")
+        if card is not None:
+            # anything but the code of a card this seat can play leaves the turn to the default strategy
+            card = Card.from_code(card) if type(card) is int and card in playable else _AUTO
+        if not (type(color) is int and 0 <= color < CardColor.BLACK):
+            color = None
+        player.strategy.choose(card, None if color is None else CardColor(color))
+
+
+class GameServer:
+    """
+    TCP server that seats every joining client at a new table with bots
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, max_tables: int = 10000,
+                 turn_timeout: float = 5.0, seed: int = None) -> None:
+        """
+        Constructor for the GameServer class
+
+        Args:
+            host (str): The address to listen on
+            port (int): The port to listen on, 0 for any free port
+            max_tables (int): The number of tables that can run at once
+            turn_timeout (float): Seconds a human seat has to answer
+            seed (int): Seed of the stream the table streams are split from
+
+        Returns:
+            None
+        """
+        self.host = host
+        self.port = port
+        self.turn_timeout = turn_timeout
+        self.rng = RandomGen(seed)
+        self.slots = asyncio.Semaphore(max_tables)
+        self.tables = 0
+        self.finished = 0
+        self.turn_latency = Histogram(LATENCY_BUCKET_NS) # every turn of every finished table
+        self.server = None
+
+    async def start(self) -> None:
+        """
+        Starts listening, self.port is the port in use afterwards
+        """
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """
+        Stops listening
+        """
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Plays one table for a client that joined.
+        """
+        connection = Connection(reader, writer)
+        try:
+            join = await connection.receive()
+            if join is None or join.get("type") != "join":
+                return
+            bots = join.get("bots", 3)
+            if type(bots) is not int or not Config.MIN_PLAYERS <= bots + 1 <= Config.MAX_PLAYERS:
+                raise ValueError(f"bots must be a number from {Config.MIN_PLAYERS - 1} to {Config.MAX_PLAYERS - 1}")
+            seed = join.get("seed")
+            if seed is not None and type(seed) is not int:
+                raise ValueError("seed must be a number")
+            names = [str(join.get("name", "player"))]
+            names += [f"bot{i}" for i in range(1, bots + 1)]
+            async with self.slots:
+                table_id = self.tables
+                self.tables += 1
+                rng = self.rng.split(table_id) if seed is None else RandomGen(seed)
+                table = Table(table_id, rng, names, {0: connection}, self.turn_timeout)
+                await connection.send({"type": "joined", "table": table_id, "seat": 0, "players": names})
+                await table.run()
+                self.turn_latency.merge(table.turn_latency)
+                self.finished += 1
+        except (ConnectionError, ValueError) as e:
+            try:
+                await connection.send({"type": "error", "message": str(e)})
+            except ConnectionError:
+                pass
+        finally:
+            await connection.close()
+
+
+async def mock_client(host: str, port: int, name: str, bots: int, seed: int = None) -> dict:
+    """
+    Joins a table and plays it like the default strategy would, answering every turn
+
+    Returns:
+        dict: The end message of the table
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    connection = Connection(reader, writer)
+    join = {"type": "join", "name": name, "bots": bots}
+    if seed is not None:
+        join["seed"] = seed
+    await connection.send(join)
+    end = None
+    while end is None:
+        message = await connection.receive()
+        if message is None:
+            break
+        if message["type"] == "turn":
+            playable = message["playable"]
+            card = playable[0] if playable else None
+            await connection.send({"type": "play", "turn": message["turn"], "card": card, "color": None})
+        elif message["type"] in ("end", "error"):
+            end = message
+    await connection.close()
+    return end
+
+
+def percentile(histogram: Histogram, fraction: float) -> float:
+    """
+    Returns the value below which the given fraction of the values of a fixed width
+    histogram fall, rounded up to the end of its bucket and at most the largest value
+    """
+    if histogram.count == 0:
+        return 0.0
+    rank = min(histogram.count - 1, int(fraction * histogram.count))
+    seen = 0
+    for bucket in sorted(histogram.buckets):
+        seen += histogram.buckets[bucket]
+        if seen > rank:
+            return min((bucket + 1) * histogram.bucket_width, histogram.max)
+    return histogram.max
+
+
+async def load_test(tables: int, bots: int, concurrency: int, turn_timeout: float = 5.0) -> dict:
+    """
+    Starts a server and plays the given number of tables against it with mock clients
+
+    Args:
+        tables (int): The number of tables to play
+        bots (int): The number of bots at each table
+        concurrency (int): The number of clients connected at once
+        turn_timeout (float): Seconds a seat has to answer
+
+    Returns:
+        dict: Tables and turns per second and the turn latency percentiles in milliseconds
+    """
+    server = GameServer(turn_timeout=turn_timeout, seed=0)
+    await server.start()
+    clients = asyncio.Semaphore(concurrency)
+
+    async def client(i: int) -> dict:
+        async with clients:
+            return await mock_client(server.host, server.port, f"client{i}", bots)
+
+    start = time.perf_counter()
+    ends = await asyncio.gather(*(client(i) for i in range(tables)))
+    elapsed = time.perf_counter() - start
+    await server.close()
+
+    latencies = server.turn_latency
+    return {
+        "tables": tables,
+        "errors": sum(1 for end in ends if end is None or end["type"] != "end"),
+        "seconds": elapsed,
+        "tables_per_sec": tables / elapsed,
+        "turns_per_sec": latencies.count / elapsed,
+        "turn_latency_ms": {
+            "p50": percentile(latencies, 0.50) / 1e6,
+            "p99": percentile(latencies, 0.99) / 1e6,
+            "max": percentile(latencies, 1.0) / 1e6,
+        },
+    }
+
+
+if __name__ == "__main__":
+
+    p = argparse.ArgumentParser(description="Host game tables over TCP, or load test the server.")
+    sub = p.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="Run the server.")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--max-tables", type=int, default=10000, help="Tables that can run at once.")
+    serve.add_argument("--timeout", type=float, default=5.0, help="Seconds a human seat has to answer.")
+    serve.add_argument("--seed", type=int, default=None, help="Seed the table streams are split from.")
+    load = sub.add_parser("loadtest", help="Play tables against a local server with mock clients.")
+    load.add_argument("--tables", type=int, default=1000)
+    load.add_argument("--bots", type=int, default=3, help="Bots at each table.")
+    load.add_argument("--concurrency", type=int, default=500, help="Clients connected at once.")
+    load.add_argument("--timeout", type=float, default=5.0, help="Seconds a seat has to answer.")
+    args = p.parse_args()
+
+    if args.command == "serve":
+
+        async def serve_forever() -> None:
+            server = GameServer(args.host, args.port, args.max_tables, args.timeout, args.seed)
+            await server.start()
+            print(f"# listening on {server.host}:{server.port}")
+            await server.server.serve_forever()
+
+        asyncio.run(serve_forever())
+    else:
+        print(json.dumps(asyncio.run(load_test(args.tables, args.bots, args.concurrency, args.timeout)), indent=2))
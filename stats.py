@@ -0,0 +1,244 @@
+"""
+Streaming statistics over the results of many simulated games.
+
+SimulationStats keeps only running totals (win counts by seat and by player
+name, outcome counts, histograms of game length and reshuffles, and the
+special card plays from a MetricsCollector), so memory does not grow with the
+number of games. Partial stats from worker processes merge exactly.
+ResultWriter streams the per-game results to CSV or JSON lines in chunks.
+
+Usage:
+```
+stats = SimulationStats()
+with open("results.csv", "w", newline="") as f, ResultWriter(f, "csv") as writer:
+    for result in run_batch(range(1000000), names, stats=stats):
+        writer.write(result)
+print(stats.to_dict())
+```
+"""
+from __future__ import annotations
+import csv
+import json
+from typing import TextIO
+
+from game import GameOutcome
+from metrics import Histogram, MetricsCollector
+
+__author__ = "Divyana (Divi) Ahuja"
+
+FORMATS = ("csv", "jsonl")
+FIELDS = ("seed", "winner", "winner_seat", "turns", "reshuffles", "outcome")
+
+
+class SimulationStats:
+    """
+    Mergeable running totals over the results of many games
+    """
+
+    GAME_LENGTH_BUCKET = 10
+
+    def __init__(self) -> None:
+        """
+        Constructor for the SimulationStats class
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.games = 0
+        self.outcomes = [0] * len(GameOutcome)
+        self.seat_games = [] # games played with a player in each seat
+        self.seat_wins = []
+        self.name_games = {}
+        self.name_wins = {}
+        self.game_length = Histogram(self.GAME_LENGTH_BUCKET)
+        self.reshuffles = Histogram(1)
+        self.metrics = MetricsCollector() # special card plays, filled in by run_batch
+
+    def add(self, result) -> None:
+        """
+        Adds the result of one game
+
+        Args:
+            result (GameResult): The result of the game
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(n) where n is the number of players
+            Worst Case Complexity:o(n)
+        """
+        self.games += 1
+        self.outcomes[result.outcome] += 1
+        players = result.players
+        while len(self.seat_games) < len(players):
+            self.seat_games.append(0)
+            self.seat_wins.append(0)
+        for seat in range(len(players)):
+            self.seat_games[seat] += 1
+            name = players[seat]
+            self.name_games[name] = self.name_games.get(name, 0) + 1
+        if result.winner_seat is not None:
+            self.seat_wins[result.winner_seat] += 1
+            self.name_wins[result.winner] = self.name_wins.get(result.winner, 0) + 1
+        self.game_length.add(result.turns)
+        self.reshuffles.add(result.reshuffles)
+
+    def merge(self, other: SimulationStats) -> None:
+        """
+        Adds the totals of another SimulationStats to this one
+
+        Args:
+            other (SimulationStats): The stats to merge in
+
+        Returns:
+            None
+
+        Complexity:
+        -n is the number of seats and names
+        -b is the number of histogram buckets
+            Best Case Complexity:o(n+b)
+            Worst Case Complexity:o(n+b)
+        """
+        self.games += other.games
+        for outcome in range(len(self.outcomes)):
+            self.outcomes[outcome] += other.outcomes[outcome]
+        while len(self.seat_games) < len(other.seat_games):
+            self.seat_games.append(0)
+            self.seat_wins.append(0)
+        for seat in range(len(other.seat_games)):
+            self.seat_games[seat] += other.seat_games[seat]
+            self.seat_wins[seat] += other.seat_wins[seat]
+        for name, games in other.name_games.items():
+            self.name_games[name] = self.name_games.get(name, 0) + games
+        for name, wins in other.name_wins.items():
+            self.name_wins[name] = self.name_wins.get(name, 0) + wins
+        self.game_length.merge(other.game_length)
+        self.reshuffles.merge(other.reshuffles)
+        self.metrics.merge(other.metrics)
+
+    def win_rate_by_seat(self) -> list:
+        """
+        Returns the fraction of the games played from each seat that the seat won
+        """
+        return [
+            self.seat_wins[seat] / self.seat_games[seat] if self.seat_games[seat] else 0.0
+            for seat in range(len(self.seat_games))
+        ]
+
+    def win_rate_by_name(self) -> dict:
+        """
+        Returns the fraction of the games each player played that they won
+        """
+        return {name: self.name_wins.get(name, 0) / games for name, games in sorted(self.name_games.items())}
+
+    def special_plays_per_game(self) -> dict:
+        """
+        Returns the mean number of plays of each special card per game, keyed by label name
+        """
+        games = self.metrics.games
+        return {label: plays / games if games else 0.0 for label, plays in self.metrics.special_plays().items()}
+
+    def to_dict(self) -> dict:
+        """
+        Returns the totals and rates as a JSON friendly dict
+        """
+        return {
+            "games": self.games,
+            "outcomes": {outcome.name: self.outcomes[outcome] for outcome in GameOutcome},
+            "win_rate_by_seat": self.win_rate_by_seat(),
+            "win_rate_by_name": self.win_rate_by_name(),
+            "game_length": self.game_length.to_dict(),
+            "reshuffles": self.reshuffles.to_dict(),
+            "special_plays_per_game": self.special_plays_per_game(),
+        }
+
+
+class ResultWriter:
+    """
+    Buffered writer of per-game results as CSV or JSON lines
+    """
+
+    def __init__(self, stream: TextIO, format: str = "csv", chunk_size: int = 4096) -> None:
+        """
+        Constructor for the ResultWriter class
+
+        Args:
+            stream (TextIO): The text stream the results are written to, opened with newline=""
+                for CSV
+            format (str): "csv" or "jsonl"
+            chunk_size (int): The number of results buffered before they are written
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the format is not supported
+        """
+        if format not in FORMATS:
+            raise ValueError(f"unsupported format {format!r}, expected one of {FORMATS}")
+        self.stream = stream
+        self.format = format
+        self.chunk_size = chunk_size
+        self.rows = []
+        self.header_written = False
+
+    def write(self, result) -> None:
+        """
+        Appends the result of one game
+
+        Args:
+            result (GameResult): The result of the game
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(c) when the buffer of c results is written out
+        """
+        self.rows.append(
+            (result.seed, result.winner, result.winner_seat, result.turns, result.reshuffles, result.outcome.name)
+        )
+        if len(self.rows) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes every buffered result to the stream
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(c) where c is the number of buffered results
+        """
+        if self.format == "csv":
+            writer = csv.writer(self.stream)
+            if not self.header_written:
+                writer.writerow(FIELDS)
+                self.header_written = True
+            writer.writerows(self.rows)
+        else:
+            self.stream.write("".join(json.dumps(dict(zip(FIELDS, row))) + "\n" for row in self.rows))
+        self.rows = []
+        self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the results, the stream itself is left open for its owner to close
+        """
+        self.flush()
+
+    def __enter__(self) -> ResultWriter:
+        """
+        Use the writer as a context manager that flushes on exit
+        """
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Flushes the results when leaving the with block
+        """
+        self.close()
@@ -0,0 +1,194 @@
+"""
+Player strategies: how a player picks the card to play and the colour to
+name after a black card.
+
+The engine hands a strategy a PlayableView of the position instead of the
+hand itself. The view works out the playable cards at most once per turn and
+only when asked, so strategies share that work and cannot change the hand.
+
+Usage:
+```
+class MostCardsColor(Strategy):
+    def choose_card(self, view):
+        return view.lowest_playable()
+
+    def choose_color(self, view, rng):
+        return CardColor(max(range(CardColor.BLACK), key=view.color_count))
+
+players.insert(0, Player("Alice", MostCardsColor()))
+```
+"""
+from __future__ import annotations
+
+from card import Card, CardColor, CardLabel, is_playable
+from hand import Hand
+
+__author__ = "Divyana (Divi) Ahuja"
+
+_UNSET = object()
+
+
+class PlayableView:
+    """
+    Read-only view of a turn given to a strategy: the playable cards, the size of
+    every hand and the current colour and label
+    """
+
+    __slots__ = ("current_color", "current_label", "_hand", "_players", "_player", "_playable", "_lowest")
+
+    def __init__(self, hand: Hand, current_color: CardColor, current_label: CardLabel,
+                 players=None, player=None) -> None:
+        """
+        Constructor for the PlayableView class
+
+        Args:
+            hand (Hand): The hand of the player choosing
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+            players (TurnOrder): The turn order, used for the opponents' hand sizes
+            player (Player): The player choosing
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - nothing is computed until a strategy asks for it
+        """
+        self.current_color = current_color
+        self.current_label = current_label
+        self._hand = hand
+        self._players = players
+        self._player = player
+        self._playable = None
+        self._lowest = _UNSET
+
+    def is_playable(self, card: Card) -> bool:
+        """
+        Returns True if the card can be played on the current colour and label
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return is_playable(card, self.current_color, self.current_label)
+
+    def playable(self) -> list:
+        """
+        Returns the distinct playable cards in the hand, lowest by colour then label first
+
+        Complexity:
+            Best Case Complexity:o(1) once computed for the turn
+            Worst Case Complexity:o(1) - bounded by NUM_CARD_CODES, see Hand.playable
+        """
+        if self._playable is None:
+            self._playable = self._hand.playable(self.current_color, self.current_label)
+        return list(self._playable)
+
+    def lowest_playable(self) -> Card | None:
+        """
+        Returns the lowest playable card by colour then label, None if nothing is playable
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1) - see Hand.lowest_playable
+        """
+        if self._lowest is _UNSET:
+            if self._playable is not None:
+                self._lowest = self._playable[0] if self._playable else None
+            else:
+                self._lowest = self._hand.lowest_playable(self.current_color, self.current_label)
+        return self._lowest
+
+    def hand_size(self) -> int:
+        """
+        Returns the number of cards in the hand of the player choosing
+        """
+        return len(self._hand)
+
+    def count(self, card: Card) -> int:
+        """
+        Returns the number of copies of a card in the hand of the player choosing
+        """
+        return self._hand.count(card)
+
+    def color_count(self, color: CardColor) -> int:
+        """
+        Returns the number of cards of a colour in the hand of the player choosing
+        """
+        return self._hand.color_counts[color]
+
+    def opponent_hand_sizes(self) -> list:
+        """
+        Returns the hand size of every other player, starting with the one who plays next
+
+        Complexity:
+            Best Case Complexity:o(n) where n is the number of players
+            Worst Case Complexity:o(n)
+        """
+        if self._players is None:
+            return []
+        return [len(player.hand) for player in self._players if player is not self._player]
+
+
+class Strategy:
+    """
+    Base class of player strategies, subclasses override choose_card and choose_color
+    """
+
+    def choose_card(self, view: PlayableView) -> Card | None:
+        """
+        Picks the card to play
+
+        Args:
+            view (PlayableView): The position the player is in
+
+        Returns:
+            Card: One of view.playable(), or None to draw a card instead
+        """
+        raise NotImplementedError
+
+    def choose_color(self, view: PlayableView, rng) -> CardColor:
+        """
+        Picks the colour to name after playing a black card
+
+        Args:
+            view (PlayableView): The position after the black card was played
+            rng (RandomGen): The random stream of the game
+
+        Returns:
+            CardColor: Any colour except CardColor.BLACK
+        """
+        raise NotImplementedError
+
+
+class LowestCardStrategy(Strategy):
+    """
+    The default strategy: play the lowest playable card by colour then label, and
+    name a random colour after a black card
+    """
+
+    def choose_card(self, view: PlayableView) -> Card | None:
+        """
+        Returns the lowest playable card, None if nothing is playable
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return view.lowest_playable()
+
+    def choose_color(self, view: PlayableView, rng) -> CardColor:
+        """
+        Returns a random colour other than black
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return CardColor(rng.randint(0, 3))
+
+
+# strategies keep no state of their own, so every player can share this one
+DEFAULT_STRATEGY = LowestCardStrategy()
@@ -0,0 +1,45 @@
+"""
+Helpers shared by the test modules: seating players and dealing seeded games.
+"""
+from __future__ import annotations
+
+from data_structures import *
+
+from game import Game
+from player import Player
+from random_gen import RandomGen
+
+NAMES = ("Alice", "Bob", "Charlie", "David")
+
+
+def seated(players) -> ArrayList[Player]:
+    """
+    Returns the players in seat order as the ArrayList Game and TurnOrder expect
+
+    Args:
+        players: Players, or names to create players with the default strategy
+    """
+    seats: ArrayList[Player] = ArrayList(len(players))
+    for i in range(len(players)):
+        seats.insert(i, Player(players[i]) if isinstance(players[i], str) else players[i])
+    return seats
+
+
+def new_game(seed: int, players=NAMES) -> Game:
+    """
+    Returns a game dealt from its own RandomGen(seed), not started yet
+
+    Args:
+        seed (int): The seed of the game's random stream
+        players: Players, or names to create players with the default strategy
+    """
+    game = Game(RandomGen(seed))
+    game.initialise_game(seated(players))
+    return game
+
+
+def hands(game: Game) -> list:
+    """
+    Returns the card codes of every hand, in seat order
+    """
+    return [[card.code for card in player.hand] for player in game.players.seats]
@@ -0,0 +1,95 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from batch_runner import run_batch
+from checkpoint import CheckpointMismatch, SweepCheckpoint
+from config import Config
+from stats import SimulationStats
+
+NAMES = ["Alice", "Bob", "Charlie"]
+
+
+class TestCheckpoint(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "sweep.ckpt")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def new_checkpoint(self, seeds: range, config=None, chunk_size: int = 10) -> SweepCheckpoint:
+        return SweepCheckpoint(self.path, seeds, config or {"players": NAMES}, chunk_size, interval=0.0)
+
+    @number("14.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_chunks_done(self) -> None:
+        checkpoint = self.new_checkpoint(range(100, 150))
+        chunks = list(checkpoint.pending())
+        self.assertEqual(chunks, [range(100 + i, 110 + i) for i in range(0, 50, 10)])
+        for i in (3, 1, 0, 4):
+            checkpoint.chunk_done(chunks[i])
+        self.assertEqual(checkpoint.done, [[100, 120], [130, 150]])
+        self.assertEqual(checkpoint.games, 40)
+        self.assertEqual(list(checkpoint.pending()), [chunks[2]])
+        self.assertTrue(checkpoint.is_done(chunks[4]))
+        self.assertFalse(checkpoint.finished())
+        checkpoint.chunk_done(chunks[2])
+        self.assertEqual(checkpoint.done, [[100, 150]])
+        self.assertTrue(checkpoint.finished())
+        self.assertEqual(list(checkpoint.pending()), [])
+
+    @number("14.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_save_and_load(self) -> None:
+        checkpoint = self.new_checkpoint(range(50))
+        checkpoint.stats = SimulationStats()
+        checkpoint.chunk_done(range(0, 10)) # saved, the interval is 0
+        checkpoint.chunk_done(range(20, 30))
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+        loaded = SweepCheckpoint.load(self.path, range(50), {"players": NAMES}, 10)
+        self.assertEqual(loaded.done, [[0, 10], [20, 30]])
+        self.assertEqual(loaded.games, 20)
+        self.assertIsInstance(loaded.stats, SimulationStats)
+        self.assertEqual([chunk.start for chunk in loaded.pending()], [10, 30, 40])
+
+    @number("14.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_load_another_sweep(self) -> None:
+        self.new_checkpoint(range(50)).save()
+        for seeds, config, chunk_size in ((range(60), {"players": NAMES}, 10),
+                                          (range(50), {"players": NAMES[:2]}, 10),
+                                          (range(50), {"players": NAMES}, 5)):
+            with self.assertRaises(CheckpointMismatch):
+                SweepCheckpoint.load(self.path, seeds, config, chunk_size)
+
+    @number("14.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_resume_sweep(self) -> None:
+        seeds = range(200)
+        full = SimulationStats()
+        expected = {result.seed: str(result) for result in run_batch(seeds, NAMES, 1, 10, stats=full)}
+
+        checkpoint = self.new_checkpoint(seeds)
+        checkpoint.stats = SimulationStats()
+        played = 0
+        for _ in run_batch(seeds, NAMES, 1, 10, stats=checkpoint.stats, checkpoint=checkpoint):
+            played += 1
+            if played == 75: # interrupted half way through a chunk
+                break
+
+        resumed = SweepCheckpoint.load(self.path, seeds, {"players": NAMES}, 10)
+        self.assertEqual(resumed.games, 70)
+        results = {}
+        for result in run_batch(seeds, NAMES, 1, 10, stats=resumed.stats, checkpoint=resumed):
+            self.assertNotIn(result.seed, results)
+            results[result.seed] = str(result)
+        self.assertEqual(sorted(results), list(range(70, 200)))
+        self.assertEqual(results, {seed: expected[seed] for seed in range(70, 200)})
+        self.assertTrue(resumed.finished())
+        self.assertEqual(resumed.stats.to_dict(), full.to_dict())
@@ -0,0 +1,108 @@
+from io import BytesIO
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from config import Config
+from event_log import EventLogReader, EventLogWriter, EventType, replay
+from tests.helpers import new_game
+
+
+def logged_game(seed: int) -> tuple:
+    stream = BytesIO()
+    game = new_game(seed)
+    game.attach_event_log(EventLogWriter(stream))
+    game.play_game()
+    game.event_log.flush()
+    stream.seek(0)
+    return game, stream
+
+
+def codes(hand) -> list:
+    return [card.code for card in hand]
+
+
+class TestEventLog(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    @number("7.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_replay_rebuilds_final_hands(self) -> None:
+        for seed in range(10):
+            game, stream = logged_game(seed)
+            state = replay(stream)
+            self.assertEqual(state.names, [player.name for player in game.players.seats])
+            self.assertEqual([codes(hand) for hand in state.hands], [codes(player.hand) for player in game.players.seats])
+            self.assertEqual(state.turns, game.turns)
+            self.assertEqual(state.reshuffles, game.game_board.reshuffles)
+            self.assertEqual(state.current_color, game.current_color)
+            self.assertEqual(state.winner(), game.winner().name)
+
+    @number("7.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_replay_to_a_turn(self) -> None:
+        _, stream = logged_game(5)
+        for turn in (0, 1, 7, 30):
+            stream.seek(0)
+            state = replay(stream, turn)
+            game = new_game(5)
+            for _ in range(turn):
+                game.step()
+            self.assertEqual(state.turns, turn)
+            self.assertEqual([codes(hand) for hand in state.hands], [codes(player.hand) for player in game.players.seats])
+            self.assertEqual(state.current_color, game.current_color)
+            self.assertEqual(state.current_label, game.current_label)
+            self.assertIsNone(state.winner())
+
+    @number("7.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_events(self) -> None:
+        game, stream = logged_game(3)
+        events = list(EventLogReader(stream).events())
+        turns = [seat for event_type, seat, _ in events if event_type == EventType.TURN]
+        self.assertEqual(len(turns), game.turns)
+        self.assertEqual(events[-1][0], EventType.GAME_END)
+        self.assertEqual(turns[-1], game.winner().seat)
+
+    @number("7.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_not_a_log(self) -> None:
+        with self.assertRaises(ValueError):
+            EventLogReader(BytesIO(b"not an event log at all"))
+        _, stream = logged_game(3)
+        with self.assertRaises(ValueError):
+            replay(BytesIO(stream.getvalue()[:-1]))
+
+    @number("7.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_replay_follows_turn_order(self) -> None:
+        moves = {EventType.REVERSE: 0, EventType.SKIP: 0}
+        for seed, players in ((0, 4), (8, 2), (13, 6)):
+            names = tuple(f"Player {i}" for i in range(players))
+            stream = BytesIO()
+            logged = new_game(seed, names)
+            logged.attach_event_log(EventLogWriter(stream))
+            logged.play_game()
+            stream.seek(0)
+            reader = EventLogReader(stream)
+            state = reader.initial_state()
+            game = new_game(seed, names)
+            for event_type, seat, arg in reader.events():
+                if event_type == EventType.TURN:# compare the position left by the previous turn
+                    self.assert_same_turn_order(state, game)
+                    game.step()
+                if event_type in moves:
+                    moves[event_type] += 1
+                state.apply(event_type, seat, arg)
+            self.assert_same_turn_order(state, game)
+        self.assertTrue(all(moves.values()), "the games should reverse and skip")
+
+    def assert_same_turn_order(self, state, game) -> None:
+        position = f"after turn {state.turns}"
+        self.assertEqual(state.turns, game.turns, position)
+        self.assertEqual(state.cursor, game.players.cursor, position)
+        self.assertEqual(state.direction, game.players.direction, position)
+        self.assertEqual(state.current_seat, None if game.current_player is None else game.current_player.seat, position)
+        self.assertEqual([codes(hand) for hand in state.hands], [codes(player.hand) for player in game.players.seats])
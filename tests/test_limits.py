@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from config import Config
+from game import GameOutcome
+from tests.helpers import new_game
+
+
+class TestLimits(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+        self.saved = (Config.MAX_ROUNDS_PER_PLAYER, Config.MAX_ROUNDS_WITHOUT_PROGRESS)
+
+    def tearDown(self) -> None:
+        Config.MAX_ROUNDS_PER_PLAYER, Config.MAX_ROUNDS_WITHOUT_PROGRESS = self.saved
+
+    @number("8.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_turn_limit_aborts(self) -> None:
+        Config.MAX_ROUNDS_PER_PLAYER = 2
+        game = new_game(1)
+        self.assertIsNone(game.play_game())
+        self.assertEqual(game.outcome, GameOutcome.ABORTED)
+        self.assertEqual(game.end_reason, "turn limit reached")
+        self.assertEqual(game.turns, 2 * len(game.players))
+        self.assertIsNone(game.step())
+
+    @number("8.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_no_progress_draws(self) -> None:
+        Config.MAX_ROUNDS_WITHOUT_PROGRESS = 1
+        draws = 0
+        for seed in range(30):
+            game = new_game(seed)
+            winner = game.play_game()
+            if game.outcome == GameOutcome.DRAW and game.end_reason == "no progress":
+                draws += 1
+                self.assertIsNone(winner)
+                self.assertEqual(game.turns - game.last_progress_turn, len(game.players))
+            else:
+                self.assertEqual(game.outcome, GameOutcome.WIN)
+        self.assertGreater(draws, 0, "one round without progress should end some of the games")
+
+    @number("8.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_limits_do_not_change_normal_games(self) -> None:
+        for seed in range(20):
+            game = new_game(seed)
+            game.play_game()
+            self.assertEqual(game.outcome, GameOutcome.WIN)
+            self.assertIsNone(game.end_reason)
+            self.assertLess(game.turns, Config.MAX_ROUNDS_WITHOUT_PROGRESS * len(game.players))
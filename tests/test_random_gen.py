@@ -0,0 +1,30 @@
+from unittest import TestCase, skipIf
+
+from ed_utils.decorators import number, visibility
+
+from random_gen import RandomGen, np
+
+
+class TestRandomGen(TestCase):
+
+    @number("16.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @skipIf(np is None, "the vectorised random_many needs NumPy")
+    def test_random_many_numpy(self) -> None:
+        for seed in (0, 123, -1, -(1 << 50), (1 << 48) + 5, 1 << 70):
+            python, vectorised = RandomGen(seed), RandomGen(seed)
+            self.assertEqual(vectorised.random_many(1000, use_numpy=True).tolist(), python.random_many(1000))
+            self.assertEqual(vectorised.seed, python.seed)
+            self.assertEqual(vectorised.random(), python.random())
+
+    @number("16.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_streams(self) -> None:
+        stepped, jumped = RandomGen(-7), RandomGen(-7)
+        for _ in range(1000):
+            stepped.random()
+        jumped.jump(1000)
+        self.assertEqual(jumped.random(), stepped.random())
+        RandomGen.set_seed(5)
+        shared = [RandomGen.random() for _ in range(10)]
+        self.assertEqual(RandomGen(5).random_many(10), shared)
@@ -0,0 +1,62 @@
+from collections import Counter
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from card import Card, CardColor, CardLabel
+from config import Config
+from game import Game, deck_template
+from game_board import DeckExhausted, GameBoard
+from random_gen import RandomGen
+from tests.helpers import new_game
+
+
+def cards_in_game(game: Game) -> Counter:
+    # played special cards leave the game, every other card is in a hand or a pile
+    board = game.game_board
+    cards = Counter(card.code for card in board.draw_pile)
+    cards.update(card.code for card in board.discard_pile)
+    for player in game.players.seats:
+        cards.update(card.code for card in player.hand)
+    return cards
+
+
+class TestReshuffle(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+        self.swap_reshuffle = Config.SWAP_RESHUFFLE
+
+    def tearDown(self) -> None:
+        Config.SWAP_RESHUFFLE = self.swap_reshuffle
+
+    @number("9.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_swap_reshuffle_board(self) -> None:
+        cards = [Card(CardColor.RED, CardLabel(i)) for i in range(5)]
+        board = GameBoard(cards, RandomGen(1), swap_reshuffle=True)
+        for _ in range(5):
+            board.discard_card(board.draw_card())
+        top = cards[-1]
+        drawn = [board.draw_card() for _ in range(4)]
+        self.assertEqual(board.reshuffles, 1)
+        self.assertEqual(sorted(card.code for card in drawn), sorted(card.code for card in cards[:-1]))
+        self.assertEqual(len(board.discard_pile), 1)
+        self.assertEqual(board.discard_pile.peek().code, top.code, "the top discard should stay in place")
+        with self.assertRaises(DeckExhausted):
+            board.draw_card()
+
+    @number("9.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_swap_reshuffle_games(self) -> None:
+        Config.SWAP_RESHUFFLE = True
+        deck = Counter(card.code for card in deck_template())
+        reshuffled = 0
+        for seed in range(30):
+            game = new_game(seed, tuple(f"Player {i}" for i in range(10))) # big tables run out of cards
+            self.assertTrue(game.game_board.swap_reshuffle)
+            for _ in game.iter_turns():
+                self.assertEqual(cards_in_game(game) - deck, Counter(), "no card should be copied")
+            self.assertIsNotNone(game.outcome)
+            reshuffled += game.game_board.reshuffles > 0
+        self.assertGreater(reshuffled, 0, "some of the games should run through the draw pile")
@@ -0,0 +1,108 @@
+import os
+import tempfile
+from unittest import TestCase, skipIf
+
+from ed_utils.decorators import number, visibility
+
+from batch_runner import GameResult, play_seed
+from config import Config
+from game import GameOutcome
+from metrics import SPECIAL_LABELS
+from result_store import FIELDS, HEADER, MIN_CAPACITY, RECORD, ResultStore, load_results, np
+
+NAMES = ["Alice", "Bob", "Charlie"]
+
+
+def read_records(path: str) -> list:
+    with open(path, "rb") as f:
+        data = f.read()
+    count = HEADER.unpack_from(data)[3]
+    return [RECORD.unpack_from(data, HEADER.size + i * RECORD.size) for i in range(count)]
+
+
+def fake_result(seed: int) -> GameResult:
+    return GameResult(seed, NAMES, None if seed % 5 == 0 else seed % 3, seed % 1000, seed % 7,
+                      GameOutcome.DRAW if seed % 5 == 0 else GameOutcome.WIN, seed % 300, (1, 2, 3, 4, 5))
+
+
+class TestResultStore(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "results.bin")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    @number("15.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_records(self) -> None:
+        results = [play_seed(seed, NAMES, counts=True) for seed in range(30)]
+        with ResultStore(self.path) as store:
+            for result in results:
+                store.append(result)
+            self.assertEqual(len(store), 30)
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 30 * RECORD.size)
+        for result, record in zip(results, read_records(self.path)):
+            winner = -1 if result.winner_seat is None else result.winner_seat
+            self.assertEqual(record, (result.seed, 3, winner, result.outcome, result.turns, result.reshuffles,
+                                      result.cards_drawn) + tuple(result.special_plays))
+
+    @number("15.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_grows(self) -> None:
+        count = 2 * MIN_CAPACITY + 1
+        with ResultStore(self.path) as store:
+            for seed in range(count):
+                store.append(fake_result(seed))
+        records = read_records(self.path)
+        self.assertEqual(len(records), count)
+        self.assertEqual([record[0] for record in records], list(range(count)))
+
+    @number("15.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bad_results(self) -> None:
+        with ResultStore(self.path) as store:
+            store.append(play_seed(4, NAMES)) # played without counts
+            for seed in (-1, 1 << 64):
+                with self.assertRaises(ValueError):
+                    store.append(fake_result(seed))
+            self.assertEqual(len(store), 1)
+        record = read_records(self.path)[0]
+        self.assertEqual(record[0], 4)
+        self.assertEqual(record[6:], (0,) * (1 + len(SPECIAL_LABELS)))
+
+    @number("15.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reopen(self) -> None:
+        with ResultStore(self.path) as store:
+            for seed in range(10):
+                store.append(fake_result(seed))
+        with ResultStore(self.path, 6) as store:
+            store.append(fake_result(100))
+        self.assertEqual([record[0] for record in read_records(self.path)], [0, 1, 2, 3, 4, 5, 100])
+        with self.assertRaises(ValueError):
+            ResultStore(self.path, 8)
+        with open(self.path, "wb") as f:
+            f.write(b"not a store")
+        with self.assertRaises(ValueError):
+            ResultStore(self.path, 0)
+
+    @number("15.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @skipIf(np is None, "load_results needs NumPy")
+    def test_load_results(self) -> None:
+        with ResultStore(self.path) as store:
+            for seed in range(100):
+                store.append(fake_result(seed))
+        results = load_results(self.path)
+        self.assertEqual(list(results.dtype.names), FIELDS)
+        self.assertEqual(results["seed"].tolist(), list(range(100)))
+        self.assertEqual(results["winner_seat"].tolist(), [-1 if seed % 5 == 0 else seed % 3 for seed in range(100)])
+        self.assertEqual(results["turns"].tolist(), [seed % 1000 for seed in range(100)])
+        self.assertEqual(results[FIELDS[-1]].tolist(), [5] * 100)
+
+        with ResultStore(self.path):
+            pass
+        self.assertEqual(len(load_results(self.path)), 0)
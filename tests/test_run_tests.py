@@ -0,0 +1,80 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from run_tests import discover, shard, source_files, source_hash
+
+TEST_FILE = '''from unittest import TestCase
+from ed_utils.decorators import number
+
+
+class TestA(TestCase):
+    @number("1.1")
+    def test_one(self):
+        pass
+
+    @number("10.1")
+    def test_ten(self):
+        pass
+
+    def test_unnumbered(self):
+        pass
+
+    def helper(self):
+        pass
+'''
+
+
+class TestRunTests(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        (self.root / "game.py").write_text("x = 1\n")
+        (self.root / "test4_1.md").write_text("golden\n")
+        (self.root / "tests").mkdir()
+        (self.root / "tests" / "__init__.py").write_text("")
+        (self.root / "tests" / "test_a.py").write_text(TEST_FILE)
+        (self.root / "venv").mkdir() # not a package, neither tested nor hashed
+        (self.root / "venv" / "test_b.py").write_text(TEST_FILE)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    @number("13.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_discover(self) -> None:
+        self.assertEqual(discover(self.root), [
+            ("tests.test_a.TestA.test_one", "1.1"),
+            ("tests.test_a.TestA.test_ten", "10.1"),
+            ("tests.test_a.TestA.test_unnumbered", ""),
+        ])
+        self.assertEqual(discover(self.root, "1"), [("tests.test_a.TestA.test_one", "1.1")])
+        self.assertEqual(discover(self.root, 10), [("tests.test_a.TestA.test_ten", "10.1")])
+        self.assertEqual(discover(self.root, "2"), [])
+
+    @number("13.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shard(self) -> None:
+        tests = [f"t{i}" for i in range(7)]
+        durations = {"t0": 6.0, "t1": 1.0, "t2": 1.0, "t3": 2.0, "t4": 2.0, "t5": 1.0, "t6": 1.0}
+        shards = shard(tests, 2, durations)
+        self.assertEqual(sorted(test for part in shards for test in part), tests)
+        self.assertEqual(sorted(sum(durations[test] for test in part) for part in shards), [7.0, 7.0])
+        for part in shards:
+            self.assertEqual(part, sorted(part), "a shard should keep the source order")
+        self.assertEqual(len(shard(tests[:2], 8, durations)), 2)
+        self.assertEqual(shard(tests, 1, {}), [tests])
+
+    @number("13.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_source_hash(self) -> None:
+        self.assertEqual([path.relative_to(self.root).as_posix() for path in source_files(self.root)],
+                         ["game.py", "test4_1.md", "tests/__init__.py", "tests/test_a.py"])
+        before = source_hash(self.root)
+        (self.root / "venv" / "test_b.py").write_text("changed\n")
+        self.assertEqual(source_hash(self.root), before, "files outside the packages should not count")
+        (self.root / "test4_1.md").write_text("changed\n")
+        self.assertNotEqual(source_hash(self.root), before)
@@ -0,0 +1,92 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from config import Config
+from game import GameOutcome
+from tests.helpers import hands, new_game
+
+NAMES = ("Alice", "Bob", "Charlie")
+
+
+class TestSnapshot(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    @number("6.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_restore_finished_game_then_step(self) -> None:
+        game = new_game(123, NAMES)
+        game.step()
+        game.step()
+        snapshot = game.snapshot()
+        rest = [(event.turn, event.seat, event.card, event.drew) for event in game.iter_turns()]
+        outcome, winner, final_hands = game.outcome, game.winner().name, hands(game)
+        self.assertEqual(outcome, GameOutcome.WIN)
+
+        game.restore(snapshot)
+        self.assertIsNone(game.outcome, "a restored position in play should not be over")
+        event = game.step()
+        self.assertIsNotNone(event, "step after restore should play a turn")
+        replay = [(event.turn, event.seat, event.card, event.drew)]
+        replay += [(event.turn, event.seat, event.card, event.drew) for event in game.iter_turns()]
+        self.assertEqual(replay, rest)
+        self.assertEqual(game.outcome, outcome)
+        self.assertEqual(game.winner().name, winner)
+        self.assertEqual(hands(game), final_hands)
+
+    @number("6.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_restore_finished_snapshot_stays_over(self) -> None:
+        game = new_game(7, NAMES)
+        game.play_game()
+        snapshot = game.snapshot()
+        outcome, reason = game.outcome, game.end_reason
+        game.restore(snapshot)
+        self.assertEqual(game.outcome, outcome)
+        self.assertEqual(game.end_reason, reason)
+        self.assertIsNone(game.step())
+
+    @number("6.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_fork_is_independent(self) -> None:
+        game = new_game(42, NAMES)
+        for _ in range(10):
+            game.step()
+        before = hands(game)
+        other = game.fork()
+        other.play_game()
+        self.assertEqual(hands(game), before, "playing the fork should not change the original")
+        self.assertIsNone(game.outcome)
+
+        game.play_game()
+        self.assertEqual(game.outcome, other.outcome)
+        self.assertEqual(game.turns, other.turns)
+        self.assertEqual(game.winner().name, other.winner().name)
+        self.assertEqual(hands(game), hands(other))
+
+    @number("6.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_fork_finished_game(self) -> None:
+        saved = Config.MAX_ROUNDS_PER_PLAYER
+        Config.MAX_ROUNDS_PER_PLAYER = 2
+        try:
+            aborted = new_game(1)
+            aborted.play_game()
+        finally:
+            Config.MAX_ROUNDS_PER_PLAYER = saved
+        drawn = new_game(11, tuple(f"Player {i}" for i in range(15)))
+        drawn.play_game()
+        won = new_game(3, NAMES)
+        won.play_game()
+        for game, outcome in ((aborted, GameOutcome.ABORTED), (drawn, GameOutcome.DRAW), (won, GameOutcome.WIN)):
+            self.assertEqual(game.outcome, outcome)
+            other = game.fork()
+            self.assertEqual(other.outcome, game.outcome)
+            self.assertEqual(other.end_reason, game.end_reason)
+            self.assertIsNone(other.step(), "a fork of a finished game should not play on")
+            self.assertEqual(list(other.iter_turns()), [])
+            other.play_game()
+            self.assertEqual(other.turns, game.turns)
+            self.assertEqual(hands(other), hands(game))
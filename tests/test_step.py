@@ -0,0 +1,101 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from config import Config
+from game import GameOutcome
+from tests.helpers import hands, new_game
+
+NAMES = ("Alice", "Bob", "Charlie")
+
+
+class TestStep(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    @number("12.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_iter_turns_plays_like_play_game(self) -> None:
+        for seed in range(20):
+            game = new_game(seed, NAMES)
+            winner = game.play_game()
+            stepped = new_game(seed, NAMES)
+            events = list(stepped.iter_turns())
+            self.assertEqual(len(events), game.turns)
+            self.assertEqual([event.turn for event in events], list(range(1, game.turns + 1)))
+            self.assertEqual(stepped.outcome, game.outcome)
+            self.assertEqual(None if winner is None else winner.name,
+                             None if stepped.winner() is None else stepped.winner().name)
+            self.assertEqual(hands(stepped), hands(game))
+            self.assertIsNone(stepped.step(), "a finished game should not play another turn")
+
+    @number("12.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_iter_turns_stops_and_resumes(self) -> None:
+        game = new_game(9, NAMES)
+        turns = game.iter_turns()
+        first = [next(turns) for _ in range(5)]
+        self.assertEqual(game.turns, 5)
+        rest = list(game.iter_turns())
+        self.assertEqual([event.turn for event in first + rest], list(range(1, game.turns + 1)))
+
+        played = new_game(9, NAMES)
+        played.play_game()
+        self.assertEqual(game.turns, played.turns)
+        self.assertEqual(hands(game), hands(played))
+
+    @number("12.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_finished_game_stays_over(self) -> None:
+        game = new_game(11, tuple(f"Player {i}" for i in range(15)))
+        events = list(game.iter_turns())
+        self.assertEqual(game.outcome, GameOutcome.DRAW)
+        self.assertEqual(game.end_reason, "deck exhausted")
+        turns, final_hands = game.turns, hands(game)
+        self.assertEqual(len(events), turns - 1, "the turn cut short by the empty deck is not an event")
+
+        self.assertEqual(list(game.iter_turns()), [])
+        self.assertIsNone(game.play_game())
+        self.assertIsNone(game.step())
+        self.assertEqual(game.outcome, GameOutcome.DRAW)
+        self.assertEqual(game.end_reason, "deck exhausted")
+        self.assertEqual(game.turns, turns)
+        self.assertEqual(hands(game), final_hands)
+
+    @number("12.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_restore_before_first_turn_plays_again(self) -> None:
+        game = new_game(21, NAMES)
+        snapshot = game.snapshot()
+        winner = game.play_game().name
+        turns, final_hands = game.turns, hands(game)
+        game.restore(snapshot)
+        self.assertIsNone(game.outcome)
+        self.assertEqual(game.play_game().name, winner)
+        self.assertEqual(game.turns, turns)
+        self.assertEqual(hands(game), final_hands)
+
+    @number("12.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_is_over(self) -> None:
+        for seed in range(20):
+            game = new_game(seed, NAMES)
+            game.start_play()
+            while not game.is_over():
+                turns = game.turns
+                game.play_turn()
+                self.assertTrue(game.turns == turns + 1 or game.end_reason == "deck exhausted")
+            self.assertIsNotNone(game.outcome)
+            self.assertFalse(game.play_turn(), "play_turn should agree the game is over")
+            self.assertTrue(game.is_over())
+
+        game = new_game(1, NAMES)
+        game.start_play()
+        game.max_turns = 2
+        self.assertFalse(game.is_over())
+        game.play_turn()
+        game.play_turn()
+        self.assertTrue(game.is_over())
+        self.assertEqual(game.outcome, GameOutcome.ABORTED)
+        self.assertEqual(game.turns, 2)
@@ -0,0 +1,130 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from card import Card, CardColor, CardLabel
+from config import Config
+from game import GameOutcome
+from player import Player
+from random_gen import RandomGen
+from strategy import DEFAULT_STRATEGY, LowestCardStrategy, PlayableView, Strategy
+from tests.helpers import new_game
+from turn_order import TurnOrder
+
+
+class HighestCard(Strategy):
+    """
+    Plays the highest playable card and names the colour it holds most of, checking every view it gets
+    """
+
+    def __init__(self, test: TestCase) -> None:
+        self.test = test
+        self.cards = 0
+        self.colors = 0
+
+    def choose_card(self, view):
+        playable = view.playable()
+        self.test.assertEqual(playable, sorted(playable, key=lambda card: card.code))
+        self.test.assertTrue(all(view.is_playable(card) and view.count(card) > 0 for card in playable))
+        self.test.assertEqual(view.lowest_playable(), playable[0] if playable else None)
+        self.cards += 1
+        return playable[-1] if playable else None
+
+    def choose_color(self, view, rng):
+        self.colors += 1
+        return CardColor(max(range(CardColor.BLACK), key=view.color_count))
+
+
+class AlwaysDraw(Strategy):
+    def choose_card(self, view):
+        return None
+
+    def choose_color(self, view, rng):
+        return CardColor.RED
+
+
+class Cheat(Strategy):
+    def __init__(self, card: Card = None, color: CardColor = CardColor.RED) -> None:
+        self.card = card
+        self.color = color
+
+    def choose_card(self, view):
+        return self.card
+
+    def choose_color(self, view, rng):
+        return self.color
+
+
+class TestStrategy(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    @number("10.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_default_strategy(self) -> None:
+        self.assertIsInstance(Player("Alice").strategy, LowestCardStrategy)
+        self.assertIs(Player("Alice").strategy, DEFAULT_STRATEGY)
+        for seed in range(10):
+            default = new_game(seed, [Player("Alice"), Player("Bob"), Player("Charlie")])
+            explicit = new_game(seed, [Player(name, LowestCardStrategy()) for name in ("Alice", "Bob", "Charlie")])
+            self.assertEqual(default.play_game().name, explicit.play_game().name)
+            self.assertEqual(default.turns, explicit.turns)
+
+    @number("10.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_custom_strategy_is_used(self) -> None:
+        strategy = HighestCard(self)
+        game = new_game(4, [Player("Alice", strategy), Player("Bob"), Player("Charlie")])
+        game.play_game()
+        self.assertEqual(game.outcome, GameOutcome.WIN)
+        self.assertGreater(strategy.cards, 0)
+
+    @number("10.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_player_who_always_draws(self) -> None:
+        game = new_game(2, [Player("Alice", AlwaysDraw()), Player("Bob"), Player("Charlie")])
+        alice = game.players.seats[0]
+        for event in game.iter_turns():
+            if event.seat == alice.seat:
+                self.assertTrue(event.drew, "a strategy returning None should draw")
+        self.assertNotEqual(game.winner(), alice)
+        self.assertGreaterEqual(len(alice.hand), Config.NUM_CARDS_AT_INIT, "only drawn cards can be played")
+
+    @number("10.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_view(self) -> None:
+        players = [Player("Alice"), Player("Bob"), Player("Charlie")]
+        order = TurnOrder(players)
+        for card in (Card(CardColor.RED, CardLabel.ONE), Card(CardColor.RED, CardLabel.ONE),
+                     Card(CardColor.BLUE, CardLabel.FIVE), Card(CardColor.BLACK, CardLabel.CRAZY)):
+            players[0].add_card(card)
+        players[1].add_card(Card(CardColor.GREEN, CardLabel.TWO))
+        view = PlayableView(players[0].hand, CardColor.RED, CardLabel.SEVEN, order, players[0])
+        self.assertEqual(view.playable(), [Card(CardColor.RED, CardLabel.ONE), Card(CardColor.BLACK, CardLabel.CRAZY)])
+        self.assertEqual(view.lowest_playable(), Card(CardColor.RED, CardLabel.ONE))
+        self.assertEqual(view.hand_size(), 4)
+        self.assertEqual(view.count(Card(CardColor.RED, CardLabel.ONE)), 2)
+        self.assertEqual(view.color_count(CardColor.BLUE), 1)
+        self.assertEqual(sorted(view.opponent_hand_sizes()), [0, 1])
+
+    @number("10.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_illegal_choices(self) -> None:
+        player = Player("Alice", Cheat(Card(CardColor.BLUE, CardLabel.FIVE)))
+        player.add_card(Card(CardColor.BLUE, CardLabel.FIVE))
+        with self.assertRaises(ValueError):
+            player.play_card(CardColor.RED, CardLabel.SEVEN)
+        self.assertEqual(len(player.hand), 1, "a rejected card should stay in the hand")
+
+        player = Player("Bob", Cheat(Card(CardColor.RED, CardLabel.SEVEN)))
+        with self.assertRaises(ValueError):
+            player.play_card(CardColor.RED, CardLabel.SEVEN)
+
+        for color in (CardColor.BLACK, 7, -1, "RED", None, 1.0):
+            player = Player("Charlie", Cheat(color=color))
+            with self.assertRaises(ValueError):
+                player.choose_color(CardColor.BLACK, CardLabel.CRAZY, RandomGen(1))
+
+        color = Player("David", Cheat(color=2)).choose_color(CardColor.BLACK, CardLabel.CRAZY, RandomGen(1))
+        self.assertIs(color, CardColor(2), "an int colour should come back as a CardColor")
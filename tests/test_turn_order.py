@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from tests.helpers import seated
+from turn_order import TurnOrder
+
+
+def names(order: TurnOrder) -> list:
+    return [player.name for player in order]
+
+
+class TestTurnOrder(TestCase):
+
+    def setUp(self) -> None:
+        self.order = TurnOrder(seated(["A", "B", "C", "D", "E"]))
+
+    @number("5.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_seats(self) -> None:
+        self.assertEqual(len(self.order), 5)
+        self.assertFalse(self.order.is_empty())
+        self.assertEqual([player.seat for player in self.order.seats], [0, 1, 2, 3, 4])
+        self.assertEqual(self.order.peek().name, "A")
+        self.assertEqual(self.order.peek_seat(), 0)
+
+    @number("5.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_matches_a_queue(self) -> None:
+        # every operation is checked against the queue TurnOrder replaced
+        queue = ["A", "B", "C", "D", "E"]
+        for op in "aaarasaarrsaaasraaaasrrsa" * 3:
+            if op == "a":
+                self.assertEqual(self.order.advance().name, queue[0])
+                queue = queue[1:] + queue[:1]
+            elif op == "s":
+                self.order.skip()
+                queue = queue[1:] + queue[:1]
+            else:
+                self.order.reverse()
+                queue.reverse()
+            self.assertEqual(names(self.order), queue)
+            self.assertEqual(self.order.peek().name, queue[0])
+            self.assertEqual(self.order.seats[self.order.peek_seat()].name, queue[0])
+
+    @number("5.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reverse_twice(self) -> None:
+        self.order.advance()
+        self.order.advance()
+        before = names(self.order)
+        self.order.reverse()
+        self.assertEqual(names(self.order), before[::-1])
+        self.order.reverse()
+        self.assertEqual(names(self.order), before)
+
+    @number("5.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_copy_is_independent(self) -> None:
+        self.order.advance()
+        self.order.reverse()
+        other = self.order.copy()
+        self.assertEqual(names(other), names(self.order))
+        other.advance()
+        other.reverse()
+        self.assertNotEqual(names(other), names(self.order))
+        self.assertEqual(self.order.peek().name, "A")
+
+    @number("5.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_empty(self) -> None:
+        order = TurnOrder(seated([]))
+        self.assertTrue(order.is_empty())
+        self.assertEqual(len(order), 0)
+        with self.assertRaises(Exception):
+            order.peek()
@@ -0,0 +1,47 @@
+from unittest import TestCase, skipIf
+
+from ed_utils.decorators import number, visibility
+
+from config import Config
+from game import GameOutcome
+from tests.helpers import new_game
+from vector_sim import NO_WINNER, NOT_OVER, VectorSimulator, np, verify
+
+
+@skipIf(np is None, "the vector simulator needs NumPy")
+class TestVectorSim(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+        self.swap_reshuffle = Config.SWAP_RESHUFFLE
+
+    def tearDown(self) -> None:
+        Config.SWAP_RESHUFFLE = self.swap_reshuffle
+
+    @number("11.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_plays_like_game(self) -> None:
+        seeds = range(1000, 1050)
+        sim = VectorSimulator(seeds, 4)
+        sim.run()
+        self.assertFalse((sim.outcome == NOT_OVER).any())
+        for row, seed in enumerate(seeds):
+            game = new_game(seed)
+            winner = game.play_game()
+            self.assertEqual(GameOutcome(sim.outcome[row]), game.outcome)
+            self.assertEqual(int(sim.winner[row]), NO_WINNER if winner is None else winner.seat)
+            self.assertEqual(int(sim.turns[row]), game.turns)
+            self.assertEqual(int(sim.reshuffles[row]), game.game_board.reshuffles)
+
+    @number("11.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_verify(self) -> None:
+        for num_players, num_decks in ((2, 1), (3, 1), (10, 1), (6, 2)):
+            self.assertEqual(verify(range(100), num_players, num_decks), 0)
+
+    @number("11.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_swap_reshuffle_not_supported(self) -> None:
+        Config.SWAP_RESHUFFLE = True
+        with self.assertRaises(ValueError):
+            VectorSimulator(range(10), 3)
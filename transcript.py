@@ -0,0 +1,244 @@
+"""
+Round by round Markdown transcript of a game, written as the game is played.
+
+A TranscriptWriter is attached to a game like an event log and writes each
+round to its stream as soon as the round is over. In "full" mode it writes
+the legacy format of test4_1.md, with every hand after every round. In
+"delta" mode a round only lists the cards that moved, and the full state is
+written every `full_every` rounds, so a reader can seek to the nearest full
+state and apply the changes after it.
+
+The golden files have CRLF line endings: open the stream with
+newline="\\r\\n" (--crlf) to reproduce them byte for byte.
+
+Usage:
+```
+with open("game.md", "w") as f:
+    game.initialise_game(players)
+    game.attach_transcript(TranscriptWriter(f, "delta", full_every=20))
+    game.play_game()
+
+python transcript.py 123 Alice Bob Charlie --output game.md
+python transcript.py 123 Alice Bob Charlie --output game.md --crlf   same bytes as test4_1.md
+```
+"""
+from __future__ import annotations
+import argparse
+import sys
+from typing import TextIO
+
+from card import CardColor, CardLabel, NUM_CARD_CODES, NUM_LABELS
+from event_log import EventType, NO_SEAT
+from game import GameOutcome
+
+__author__ = "Divyana (Divi) Ahuja"
+
+MODES = ("full", "delta")
+
+# "RED FOUR" for every card code
+CARD_NAMES = [
+    f"{CardColor(code // NUM_LABELS).name} {CardLabel(code % NUM_LABELS).name}" for code in range(NUM_CARD_CODES)
+]
+
+
+class TranscriptWriter:
+    """
+    Writes the transcript of a game from its events, one round at a time
+    """
+
+    def __init__(self, stream: TextIO, mode: str = "full", full_every: int = 10) -> None:
+        """
+        Constructor for the TranscriptWriter class
+
+        Args:
+            stream (TextIO): The text stream the transcript is written to
+            mode (str): "full" for the legacy format, "delta" for the changes of each round only
+            full_every (int): In delta mode, the number of rounds between full states
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the mode is not supported
+        """
+        if mode not in MODES:
+            raise ValueError(f"unsupported mode {mode!r}, expected one of {MODES}")
+        self.stream = stream
+        self.mode = mode
+        self.full_every = full_every
+        self.game = None
+        self.round = 0
+        self.lines = []      # lines of the round being played
+        self.action = None
+        self.drawn = None    # card code the current player drew on their turn
+        self.drawn_seat = NO_SEAT
+        self.changes = []    # cards that moved this round, delta mode
+
+    def start(self, game) -> None:
+        """
+        Writes the position of an initialised game, called when the transcript is attached to it
+
+        Complexity:
+            Best Case Complexity:o(n*h) where n is the number of players and h the hand size
+            Worst Case Complexity:o(n*h)
+        """
+        self.game = game
+        self.round = 0
+        lines = [
+            "### State at the beginning",
+            self._color_line(),
+        ]
+        for player in game.players:
+            lines.append("- " + self._hand_line(player))
+        self.stream.write("\n".join(lines) + "\n")
+
+    def record(self, event_type: EventType, seat: int, arg: int = 0) -> None:
+        """
+        Adds one event of the game to the round being played
+
+        Args:
+            event_type (EventType): The type of the event
+            seat (int): The seat of the player the event belongs to
+            arg (int): The card code, colour or count of the event
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(n*h) when a round with the full state is written out
+        """
+        if event_type == EventType.TURN:
+            self._end_round(seat)
+            self.round += 1
+            self.lines = [
+                f"### Round {self.round}",
+                f"- **Current player**: {self._name(seat)}",
+                self._color_line(),
+            ]
+        elif event_type == EventType.DRAW:
+            self.drawn = arg
+            self.drawn_seat = seat
+        elif event_type == EventType.PLAY:
+            if self.drawn == arg:
+                self.action = f"{self._name(seat)} draws a card {CARD_NAMES[arg]} and plays it."
+            else:
+                self.action = f"{self._name(seat)} plays {CARD_NAMES[arg]}"
+                self.changes.append(f"{self._name(seat)} -({CARD_NAMES[arg]})")
+            self.drawn = None
+        elif event_type == EventType.PENALTY_DRAW:
+            self.changes.append(f"{self._name(seat)} +({CARD_NAMES[arg]})")
+        elif event_type == EventType.COLOR_CHOICE and self.mode == "delta":
+            self.changes.append(f"{self._name(seat)} names {CardColor(arg).name}")
+        elif event_type == EventType.GAME_END:
+            self._end_game(seat, arg)
+
+    def _end_round(self, next_seat: int) -> None:
+        """
+        Writes the round that just finished, with the state after it listed from next_seat on.
+        """
+        if not self.lines:
+            return
+        lines = self.lines
+        self._end_action()
+        if self.mode == "delta" and self.changes:
+            lines.append("- **Changes**: " + ", ".join(self.changes))
+        if self.mode == "full" or self.round % self.full_every == 0:
+            lines.append("- **State after the round**")
+            game = self.game
+            seats = game.players.seats
+            direction = game.players.direction
+            for i in range(len(seats)):
+                lines.append("\t- " + self._hand_line(seats[(next_seat + i * direction) % len(seats)]))
+        lines.append("")
+        self.stream.write("\n".join(lines) + "\n")
+        self.lines = []
+        self.changes = []
+
+    def _end_action(self) -> None:
+        """
+        Adds the action line of the round being played.
+        """
+        if self.drawn is not None:# drawn on their turn and kept
+            seat = self.drawn_seat
+            self.action = f"{self._name(seat)} draws a card into their hand."
+            self.changes.append(f"{self._name(seat)} +({CARD_NAMES[self.drawn]})")
+            self.drawn = None
+        if self.action is not None:
+            self.lines.append(f"- **Action**: {self.action}")
+            self.action = None
+
+    def _end_game(self, seat: int, outcome: int) -> None:
+        """
+        Writes the last round, without a state after it, and the result.
+        """
+        lines = self.lines
+        self._end_action()
+        if self.mode == "delta" and self.changes:
+            lines.append("- **Changes**: " + ", ".join(self.changes))
+        if outcome == GameOutcome.WIN:
+            lines.append(f"## End of Game, winner: {self._name(seat)}")
+        else:
+            lines.append(f"## End of Game, no winner: {self.game.end_reason}")
+        self.stream.write("\n".join(lines) + "\n")
+        self.lines = []
+        self.changes = []
+        self.stream.flush()
+
+    def flush(self) -> None:
+        """
+        Flushes the stream, rounds are written as soon as they are over
+        """
+        self.stream.flush()
+
+    def _name(self, seat: int) -> str:
+        """
+        Returns the name of the player in a seat.
+        """
+        return self.game.players.seats[seat].name
+
+    def _color_line(self) -> str:
+        """
+        Returns the line with the current colour and label of the game.
+        """
+        game = self.game
+        return f"- **Current color: {game.current_color.name} Current label: {game.current_label.name}**"
+
+    def _hand_line(self, player) -> str:
+        """
+        Returns the line listing a player's hand, lowest card first.
+        """
+        size = len(player.hand)
+        cards = ",".join(f"({CARD_NAMES[card.code]})" for card in player.hand)
+        return f"Player {player.name} has {size} card{'' if size == 1 else 's'}: [{cards}]"
+
+
+if __name__ == "__main__":
+    from config import Config
+    from data_structures.array_list import ArrayList
+    from game import Game
+    from player import Player
+    from random_gen import RandomGen
+
+    p = argparse.ArgumentParser(description="Write the transcript of a seeded game.")
+    p.add_argument("seed", type=int, help="Seed of the game.")
+    p.add_argument("players", nargs="+", help="Player names, in seating order.")
+    p.add_argument("--cards", type=int, default=Config.NUM_CARDS_AT_INIT, help="Cards dealt to each player.")
+    p.add_argument("--mode", choices=MODES, default="full", help="Legacy format or changes only.")
+    p.add_argument("--every", type=int, default=10, help="Rounds between full states in delta mode.")
+    p.add_argument("--output", help="Write the transcript to this file (default: stdout).")
+    p.add_argument("--crlf", action="store_true", help="End the lines of the output file with CRLF, like the golden files.")
+    args = p.parse_args()
+
+    Config.NUM_CARDS_AT_INIT = args.cards
+    players: ArrayList[Player] = ArrayList(len(args.players))
+    for i in range(len(args.players)):
+        players.insert(i, Player(args.players[i]))
+    game = Game(RandomGen(args.seed))
+    game.initialise_game(players)
+
+    output = open(args.output, "w", newline="\r\n" if args.crlf else None) if args.output else sys.stdout
+    game.attach_transcript(TranscriptWriter(output, args.mode, args.every))
+    game.play_game()
+    if args.output:
+        output.close()
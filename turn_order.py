@@ -0,0 +1,150 @@
+from __future__ import annotations
+from player import Player
+from data_structures import *
+
+__author__ = "Divyana (Divi) Ahuja"
+
+
+class TurnOrder:
+    """
+    Turn order of the players, stored as fixed seats with a cursor and a direction.
+
+    It behaves like the CircularQueue the game used to rebuild: the queue from front
+    to rear is seats[cursor], seats[cursor + direction], ... wrapping around the table.
+    Serving the front player and appending them again is a single cursor step, and
+    reversing the whole queue is a direction flip, so every operation is o(1).
+    """
+
+    def __init__(self, players: ArrayList[Player]) -> None:
+        """
+        Constructor for the TurnOrder class
+
+        Args:
+            players (ArrayList[Player]): The players in seating order, the first one plays first
+
+        Returns:
+            None
+
+        Complexity:
+            -n is the number of players
+            Best Case Complexity:o(n)
+            Worst Case Complexity:o(n)
+            - copies each player into their seat once and gives them their seat number
+        """
+        self.seats = [player for player in players]
+        for seat in range(len(self.seats)):
+            self.seats[seat].seat = seat
+        self.cursor = 0 # seat of the player at the front of the queue
+        self.direction = 1
+
+    def __len__(self) -> int:
+        """
+        Returns the number of players
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return len(self.seats)
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if there are no players
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return len(self.seats) == 0
+
+    def peek(self) -> Player:
+        """
+        Returns the player at the front of the queue, the next one to play
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        if not self.seats:
+            raise Exception("Queue is empty")
+        return self.seats[self.cursor]
+
+    def peek_seat(self) -> int:
+        """
+        Returns the seat index of the player at the front of the queue
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        return self.cursor
+
+    def advance(self) -> Player:
+        """
+        Serves the player at the front of the queue and puts them back at the rear
+
+        Returns:
+            Player: The player that was at the front
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        player = self.seats[self.cursor]
+        self.cursor = (self.cursor + self.direction) % len(self.seats)
+        return player
+
+    def skip(self) -> None:
+        """
+        Moves the player at the front of the queue to the rear without them playing
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+        """
+        self.cursor = (self.cursor + self.direction) % len(self.seats)
+
+    def reverse(self) -> None:
+        """
+        Reverses the queue, the player at the rear becomes the front
+
+        Complexity:
+            Best Case Complexity:o(1)
+            Worst Case Complexity:o(1)
+            - the rear of the queue is one step behind the cursor, so the cursor
+            moves there and the direction flips
+        """
+        self.cursor = (self.cursor - self.direction) % len(self.seats)
+        self.direction = -self.direction
+
+    def copy(self, seats=None) -> TurnOrder:
+        """
+        Returns a turn order at the same position
+
+        Args:
+            seats: The players for the copy in seat order, defaults to the same players
+
+        Returns:
+            TurnOrder: The copy of the turn order
+
+        Complexity:
+            -n is the number of players
+            Best Case Complexity:o(n)
+            Worst Case Complexity:o(n)
+        """
+        other = TurnOrder.__new__(TurnOrder)
+        other.seats = self.seats[:] if seats is None else seats
+        other.cursor = self.cursor
+        other.direction = self.direction
+        return other
+
+    def __iter__(self):
+        """
+        Yields the players from the front of the queue to the rear
+
+        Complexity:
+            Best Case Complexity:o(n) where n is the number of players
+            Worst Case Complexity:o(n)
+        """
+        for i in range(len(self.seats)):
+            yield self.seats[(self.cursor + i * self.direction) % len(self.seats)]
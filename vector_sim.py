@@ -0,0 +1,393 @@
+"""
+Vectorised lockstep simulator: plays thousands of independent games at once
+with NumPy, one array row per game.
+
+Every game follows the same rules as Game.play_game with the default player
+strategy and the legacy reshuffle, and uses the same random stream as
+Game(RandomGen(seed)), so each row plays out exactly like the object engine
+(same winner, turns, reshuffles and outcome). Hands are per-player counts
+of each card code, the draw pile is an array of codes with a read position,
+and the discard pile is a count per code (the legacy reshuffle sorts the
+cards by code before shuffling, so their order never matters).
+
+Every turn is one step of all the unfinished games, each rule applied to
+the rows it concerns as a masked array operation.
+
+Usage:
+```
+sim = VectorSimulator(range(100000), num_players=4)
+sim.run()
+print(sim.winner[:10], sim.turns.mean())
+
+python vector_sim.py 0 100000 4
+python vector_sim.py 0 1000 4 --verify
+```
+"""
+from __future__ import annotations
+import argparse
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only this module needs it
+    np = None
+
+from card import CardColor, CardLabel, NUM_CARD_CODES, NUM_LABELS, PLAYABLE_MASK
+from config import Config
+from game import GameOutcome, deck_template
+from random_gen import RandomGen
+
+__author__ = "Divyana (Divi) Ahuja"
+
+NOT_OVER = -1 # outcome of a game still being played
+NO_WINNER = -1
+
+
+def _playable_table():
+    """
+    Returns a NUM_CARD_CODES x NUM_CARD_CODES table, True where the card (column)
+    can be played on the current colour and label (row, as a card code), from PLAYABLE_MASK.
+    """
+    masks = np.array([[mask >> code & 1 for code in range(NUM_CARD_CODES)] for mask in PLAYABLE_MASK])
+    return masks.astype(bool)
+
+
+def _deck_codes(num_decks: int = 1):
+    """
+    Returns the codes of the cards of Game.generate_cards with num_decks decks, lowest code first.
+    """
+    return np.array([card.code for card in deck_template(num_decks, legacy=True)], dtype=np.int8)
+
+
+class VectorSimulator:
+    """
+    Plays one game per seed in lockstep, the results are left in per-game arrays
+    """
+
+    def __init__(self, seeds, num_players: int, num_decks: int = None) -> None:
+        """
+        Constructor for the VectorSimulator class, deals every game
+
+        Args:
+            seeds: The seed of each game, as given to RandomGen
+            num_players (int): The number of players in every game
+            num_decks (int): The number of decks in every game, defaults to Config.NUM_DECKS
+
+        Returns:
+            None
+
+        Raises:
+            ImportError: if NumPy is not installed
+            ValueError: if Config.SWAP_RESHUFFLE is set, only the legacy reshuffle is supported
+
+        Complexity:
+        -g is the number of games
+        -m is the number of cards in the game
+        -k is the number of cards dealt to each player
+            Best Case Complexity:o(g*m log m)
+            Worst Case Complexity:o(g*m log m)
+            - the decks are shuffled with one sort per row, dealing is n*k vector steps
+        """
+        if np is None:
+            raise ImportError("VectorSimulator requires NumPy")
+        if Config.SWAP_RESHUFFLE:
+            raise ValueError("VectorSimulator only supports the legacy reshuffle")
+        self.seeds = np.array([seed % RandomGen.MOD for seed in seeds], dtype=np.uint64)
+        self.num_players = num_players
+        games = len(self.seeds)
+        self.num_decks = Config.NUM_DECKS if num_decks is None else num_decks
+        deck = _deck_codes(self.num_decks)
+        self.deck_size = len(deck)
+        self.playable = _playable_table()
+
+        self.rng = self.seeds.copy() # position of each game's random stream
+        self.pile = np.zeros((games, self.deck_size), dtype=np.int8) # draw pile, drawn from the front
+        self.pile_pos = np.zeros(games, dtype=np.int64)
+        self.pile_end = np.zeros(games, dtype=np.int64)
+        self.discard = np.zeros((games, NUM_CARD_CODES), dtype=np.int16)
+        self.discard_len = np.zeros(games, dtype=np.int64)
+        self.hands = np.zeros((games, num_players, NUM_CARD_CODES), dtype=np.int16)
+        self.hand_size = np.zeros((games, num_players), dtype=np.int64)
+        self.cursor = np.zeros(games, dtype=np.int64)
+        self.direction = np.ones(games, dtype=np.int64)
+        self.current = np.zeros(games, dtype=np.int64)
+        self.color = np.zeros(games, dtype=np.int64)
+        self.label = np.zeros(games, dtype=np.int64)
+        self.turns = np.zeros(games, dtype=np.int64)
+        self.reshuffles = np.zeros(games, dtype=np.int64)
+        self.lowest_hand = np.zeros(games, dtype=np.int64)
+        self.last_progress_turn = np.zeros(games, dtype=np.int64)
+        self.outcome = np.full(games, NOT_OVER, dtype=np.int64)
+        self.winner = np.full(games, NO_WINNER, dtype=np.int64)
+
+        # Game.generate_cards: the legacy shuffle puts the sorted deck in the order of a stable sort of the next m randoms
+        all_games = np.arange(games)
+        self.pile[:, :self.deck_size] = deck[np.argsort(self._random_rows(all_games, self.deck_size), axis=1, kind="stable")]
+        self.pile_end[:] = self.deck_size
+        self._deal(all_games)
+
+    def _random_rows(self, rows, n: int):
+        """
+        Returns the next n numbers of RandomGen.random for each row, advancing their streams.
+        """
+        a_k, c_k = RandomGen._numpy_jump_table(n)
+        states = (a_k[None, :] * self.rng[rows, None] + c_k[None, :]) & np.uint64(RandomGen.MOD - 1)
+        self.rng[rows] = states[:, n - 1]
+        return states >> np.uint64(16)
+
+    def _random_ints(self, rows, hi: int):
+        """
+        Returns RandomGen.randint(0, hi) for each row, advancing their streams by one number.
+        """
+        state = (np.uint64(RandomGen.A) * self.rng[rows] + np.uint64(RandomGen.C)) & np.uint64(RandomGen.MOD - 1)
+        self.rng[rows] = state
+        return ((state >> np.uint64(16)) % np.uint64(hi + 1)).astype(np.int64)
+
+    def _end(self, rows, outcome: GameOutcome) -> None:
+        """
+        Records how the games of the given rows ended.
+        """
+        self.outcome[rows] = outcome
+
+    def _draw(self, rows):
+        """
+        GameBoard.draw_card for each row: reshuffles rows with an empty draw pile
+        and ends the rows with nothing left to draw as a DRAW.
+
+        Returns:
+            The rows that drew a card and the code of the card each of them drew
+        """
+        empty = rows[self.pile_pos[rows] == self.pile_end[rows]]
+        if len(empty):
+            exhausted = empty[self.discard_len[empty] == 0]
+            if len(exhausted):
+                self._end(exhausted, GameOutcome.DRAW)
+                rows = rows[self.outcome[rows] == NOT_OVER]
+                empty = empty[self.discard_len[empty] != 0]
+            if len(empty):
+                self._reshuffle(empty)
+        codes = self.pile[rows, self.pile_pos[rows]].astype(np.int64)
+        self.pile_pos[rows] += 1
+        return rows, codes
+
+    def _reshuffle(self, rows) -> None:
+        """
+        GameBoard.reshuffle for each row: the legacy shuffle of the discard pile,
+        which only depends on which cards it holds.
+        """
+        sizes = self.discard_len[rows]
+        width = int(sizes.max())
+        # the discard pile of each row written out lowest code first
+        ends = np.cumsum(self.discard[rows], axis=1)
+        positions = np.arange(width)
+        cards = (positions[None, :, None] >= ends[:, None, :]).sum(axis=2).astype(np.int8)
+        # each row draws only as many numbers as it has cards, the padding sorts last
+        start = self.rng[rows]
+        values = self._random_rows(rows, width)
+        a, c = RandomGen._numpy_jump_table(width)
+        self.rng[rows] = (a[sizes - 1] * start + c[sizes - 1]) & np.uint64(RandomGen.MOD - 1)
+        values[positions[None, :] >= sizes[:, None]] = np.uint64(1 << 32)
+        order = np.argsort(values, axis=1, kind="stable")
+        self.pile[rows, :width] = np.take_along_axis(cards, order, axis=1)
+        self.pile_pos[rows] = 0
+        self.pile_end[rows] = sizes
+        self.discard[rows] = 0
+        self.discard_len[rows] = 0
+        self.reshuffles[rows] += 1
+
+    def _give(self, rows, seats, codes) -> None:
+        """
+        Adds one card to the hand of the given seat of each row.
+        """
+        self.hands[rows, seats, codes] += 1
+        self.hand_size[rows, seats] += 1
+
+    def _deal(self, rows) -> None:
+        """
+        Game.initialise_game after the deck is shuffled: deals the hands and turns
+        up the first number card. Rows that run out of cards end as a DRAW.
+        """
+        for _ in range(Config.NUM_CARDS_AT_INIT):
+            for seat in range(self.num_players):
+                rows, codes = self._draw(rows)
+                self._give(rows, seat, codes)
+        top = np.zeros(len(self.outcome), dtype=np.int64)
+        rows, codes = self._draw(rows)
+        top[rows] = codes
+        special = rows[top[rows] % NUM_LABELS > CardLabel.NINE]
+        while len(special):
+            # special cards go on the discard pile until a number card turns up
+            self.discard[special, top[special]] += 1
+            self.discard_len[special] += 1
+            stuck = self.pile_pos[special] == self.pile_end[special]
+            self._end(special[stuck], GameOutcome.DRAW)
+            special, codes = self._draw(special[~stuck])
+            top[special] = codes
+            special = special[codes % NUM_LABELS > CardLabel.NINE]
+        rows = rows[self.outcome[rows] == NOT_OVER]
+        codes = top[rows]
+        self.discard[rows, codes] += 1
+        self.discard_len[rows] += 1
+        self.color[rows] = codes // NUM_LABELS
+        self.label[rows] = codes % NUM_LABELS
+
+        # play_game: the first player is served before the loop
+        self.current[rows] = self.cursor[rows]
+        self.cursor[rows] = (self.cursor[rows] + self.direction[rows]) % self.num_players
+        self.lowest_hand[rows] = self.hand_size[rows].min(axis=1)
+
+    def step(self, rows):
+        """
+        Plays one turn (one pass of the play_game loop) of each given row
+
+        Args:
+            rows: The rows of the games still being played
+
+        Returns:
+            The rows still being played after the turn
+
+        Complexity:
+            Best Case Complexity:o(g) where g is the number of rows
+            Worst Case Complexity:o(g*m) when rows reshuffle m cards
+        """
+        players = self.num_players
+        # the loop condition and the runtime limits
+        won = self.hand_size[rows, self.current[rows]] == 0
+        self.winner[rows[won]] = self.current[rows[won]]
+        self._end(rows[won], GameOutcome.WIN)
+        rows = rows[~won]
+        aborted = self.turns[rows] >= Config.MAX_ROUNDS_PER_PLAYER * players
+        self._end(rows[aborted], GameOutcome.ABORTED)
+        rows = rows[~aborted]
+        stale = self.turns[rows] - self.last_progress_turn[rows] >= Config.MAX_ROUNDS_WITHOUT_PROGRESS * players
+        self._end(rows[stale], GameOutcome.DRAW)
+        rows = rows[~stale]
+        if len(rows) == 0:
+            return rows
+
+        later = rows[self.turns[rows] != 0]
+        self.current[later] = self.cursor[later]
+        self.cursor[later] = (self.cursor[later] + self.direction[later]) % players
+        self.turns[rows] += 1
+
+        # the lowest playable card is the lowest code both in the hand and playable
+        state = self.color[rows] * NUM_LABELS + self.label[rows]
+        seats = self.current[rows]
+        can_play = self.playable[state] & (self.hands[rows, seats] > 0)
+        has_card = can_play.any(axis=1)
+        played = rows[has_card]
+        played_codes = can_play[has_card].argmax(axis=1)
+        self.hands[played, self.current[played], played_codes] -= 1
+        self.hand_size[played, self.current[played]] -= 1
+
+        # nothing to play: draw, and play the drawn card if it can be played
+        drawing, drawn = self._draw(rows[~has_card])
+        playable = self.playable[self.color[drawing] * NUM_LABELS + self.label[drawing], drawn]
+        self._give(drawing[~playable], self.current[drawing[~playable]], drawn[~playable])
+        played = np.concatenate((played, drawing[playable]))
+        codes = np.concatenate((played_codes, drawn[playable]))
+
+        sizes = self.hand_size[played, self.current[played]]
+        progress = sizes < self.lowest_hand[played]
+        self.lowest_hand[played[progress]] = sizes[progress]
+        self.last_progress_turn[played[progress]] = self.turns[played[progress]]
+
+        colors, labels = codes // NUM_LABELS, codes % NUM_LABELS
+        self.color[played] = colors
+        self.label[played] = labels
+
+        number = labels <= CardLabel.NINE
+        self.discard[played[number], codes[number]] += 1
+        self.discard_len[played[number]] += 1
+
+        black = played[colors == CardColor.BLACK]
+        self.color[black] = self._random_ints(black, 3)
+        draw_four = played[labels == CardLabel.DRAW_FOUR]
+        for _ in range(4):
+            draw_four, drawn = self._draw(draw_four)
+            self._give(draw_four, self.cursor[draw_four], drawn)
+        self.cursor[draw_four] = (self.cursor[draw_four] + self.direction[draw_four]) % players
+
+        draw_two = played[labels == CardLabel.DRAW_TWO]
+        for _ in range(2):
+            draw_two, drawn = self._draw(draw_two)
+            self._give(draw_two, self.cursor[draw_two], drawn)
+
+        reverse = played[labels == CardLabel.REVERSE]
+        self.cursor[reverse] = (self.cursor[reverse] - self.direction[reverse]) % players
+        self.direction[reverse] = -self.direction[reverse]
+        self.current[reverse] = self.cursor[reverse]
+        self.cursor[reverse] = (self.cursor[reverse] + self.direction[reverse]) % players
+
+        skip = played[labels == CardLabel.SKIP]
+        self.cursor[skip] = (self.cursor[skip] + self.direction[skip]) % players
+
+        return rows[self.outcome[rows] == NOT_OVER]
+
+    def run(self) -> None:
+        """
+        Plays every game to the end, see outcome, winner, turns and reshuffles
+
+        Complexity:
+            Best Case Complexity:o(t*g) where t is the length of the longest game
+            Worst Case Complexity:o(t*g*m)
+        """
+        rows = np.flatnonzero(self.outcome == NOT_OVER)
+        while len(rows):
+            rows = self.step(rows)
+
+
+def verify(seeds, num_players: int, num_decks: int = None) -> int:
+    """
+    Plays every seed with both engines and returns the number of games that differ
+    """
+    from data_structures import ArrayList
+    from game import Game
+    from game_board import DeckExhausted
+    from player import Player
+
+    sim = VectorSimulator(seeds, num_players, num_decks)
+    sim.run()
+    mismatches = 0
+    for row, seed in enumerate(seeds):
+        players = ArrayList(num_players)
+        for i in range(num_players):
+            players.insert(i, Player(str(i)))
+        game = Game(RandomGen(seed), num_decks)
+        try:
+            game.initialise_game(players)
+            winner = game.play_game()
+            expected = (GameOutcome(game.outcome), -1 if winner is None else winner.seat, game.turns,
+                        game.game_board.reshuffles)
+        except DeckExhausted:# ran out of cards before the first turn, any other error is a real bug
+            expected = (GameOutcome.DRAW, -1, 0, game.game_board.reshuffles)
+        got = (GameOutcome(sim.outcome[row]), int(sim.winner[row]), int(sim.turns[row]), int(sim.reshuffles[row]))
+        if got != expected:
+            mismatches += 1
+            print(f"seed {seed}: object engine {expected}, vector engine {got}")
+    return mismatches
+
+
+if __name__ == "__main__":
+
+    p = argparse.ArgumentParser(description="Play a range of seeded games in lockstep with NumPy.")
+    p.add_argument("start", type=int, help="First seed to play.")
+    p.add_argument("stop", type=int, help="Seed to stop at (exclusive).")
+    p.add_argument("players", type=int, help="Number of players in every game.")
+    p.add_argument("--decks", type=int, default=Config.NUM_DECKS, help="Decks in every game.")
+    p.add_argument("--verify", action="store_true", help="Check every game against Game.play_game.")
+    args = p.parse_args()
+
+    seeds = range(args.start, args.stop)
+    if args.verify:
+        bad = verify(seeds, args.players, args.decks)
+        print(f"# {bad} of {len(seeds)} games differ")
+    else:
+        start_time = time.perf_counter()
+        sim = VectorSimulator(seeds, args.players, args.decks)
+        sim.run()
+        elapsed = time.perf_counter() - start_time
+        rate = len(seeds) / elapsed if elapsed > 0 else float("inf")
+        wins = np.bincount(sim.winner[sim.winner != NO_WINNER], minlength=args.players)
+        print(f"wins by seat: {wins.tolist()}, mean turns {sim.turns.mean():.1f}, reshuffles {int(sim.reshuffles.sum())}")
+        print(f"# {len(seeds)} games in {elapsed:.2f}s ({rate:.0f} games/sec)")
@@ -0,0 +1,462 @@
+"""
+Differential check of the game engines against the frozen reference rules.
+
+Every seed of a range is played by ReferenceGame (reference_engine.py) and by
+each engine mode under test, and the two are compared: outcome, winner, the
+full sequence of turns, the final hands and the number of reshuffles. For the
+first turn of a seed where a mode differs from the reference, the report
+shows both versions of that turn and the position before it on both sides.
+
+Modes:
+- play_game: Game.play_game, the turns rebuilt from its events
+- step: Game.iter_turns
+- vector: VectorSimulator, the turns rebuilt from its arrays after every step (needs NumPy)
+
+Seeds are checked in chunks across worker processes, like batch_runner.
+The reference only knows the legacy reshuffle, so Config.SWAP_RESHUFFLE
+must be off.
+
+Usage:
+```
+python verify_engine.py 0 10000 4
+python verify_engine.py 0 2000 10 --decks 2 --cards 5 --modes step vector --processes 8
+```
+"""
+from __future__ import annotations
+import argparse
+import sys
+import time
+from contextlib import nullcontext
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError: # only the vector mode needs NumPy
+    np = None
+
+from card import CardColor, CardLabel, NUM_CARD_CODES, NUM_LABELS
+from config import Config
+from data_structures.array_list import ArrayList
+from event_log import EventType
+from game import Game, GameOutcome
+from game_board import DeckExhausted
+from player import Player
+from random_gen import RandomGen
+from reference_engine import ReferenceGame
+from transcript import CARD_NAMES
+
+__author__ = "Divyana (Divi) Ahuja"
+
+MODES = ("play_game", "step", "vector")
+
+
+class Trace:
+    """
+    Everything that is compared of one game: a turn is (turn, seat, card code or -1, drew,
+    colour, label) with the colour and label after the turn, a hand is its sorted card codes
+    """
+
+    __slots__ = ("outcome", "winner", "turns", "hands", "reshuffles")
+    FIELDS = ("turns", "outcome", "winner", "hands", "reshuffles")
+
+    def __init__(self, outcome: int, winner: int | None, turns: list, hands: list, reshuffles: int) -> None:
+        """
+        Constructor for the Trace class
+
+        Args:
+            outcome (int): The GameOutcome
+            winner (int): The seat of the winner, None if there is none
+            turns (list): The turns played, in order
+            hands (list): The final hand of every seat
+            reshuffles (int): The number of reshuffles
+
+        Returns:
+            None
+        """
+        self.outcome = outcome
+        self.winner = winner
+        self.turns = turns
+        self.hands = hands
+        self.reshuffles = reshuffles
+
+    def first_difference(self, other: Trace) -> str | None:
+        """
+        Returns the name of the first field that differs from the other trace, None if none does
+        """
+        for field in self.FIELDS:
+            if getattr(self, field) != getattr(other, field):
+                return field
+        return None
+
+
+class _TurnRecorder:
+    """
+    Rebuilds the turns of a game from its events, attached like an event log
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the _TurnRecorder class
+        """
+        self.game = None
+        self.turns = []
+        self.turn = None # [turn, seat, card, drew] of the turn being played
+
+    def start(self, game) -> None:
+        """
+        Watches an initialised game
+        """
+        self.game = game
+
+    def record(self, event_type: EventType, seat: int, arg: int = 0) -> None:
+        """
+        Adds one event of the game to the turn being played
+        """
+        if event_type == EventType.TURN:
+            self._end_turn()
+            self.turn = [self.game.turns, seat, -1, False]
+        elif event_type == EventType.DRAW:
+            self.turn[3] = True
+        elif event_type == EventType.PLAY:
+            self.turn[2] = arg
+        elif event_type == EventType.GAME_END:
+            if self.game.end_reason == "deck exhausted":# the turn was cut short and does not count
+                self.turn = None
+            self._end_turn()
+
+    def _end_turn(self) -> None:
+        """
+        Adds the turn being played, with the colour and label it left behind.
+        """
+        if self.turn is not None:
+            self.turns.append(tuple(self.turn) + (int(self.game.current_color), int(self.game.current_label)))
+            self.turn = None
+
+    def flush(self) -> None:
+        """
+        Nothing to flush, the turns are kept in memory
+        """
+
+
+def reference_trace(seed: int, num_players: int, num_decks: int) -> Trace:
+    """
+    Plays a seed by the reference rules
+
+    Args:
+        seed (int): The seed of the game
+        num_players (int): The number of players
+        num_decks (int): The number of decks
+
+    Returns:
+        Trace: The game as the reference played it
+    """
+    game = _reference_game(seed, num_players, num_decks)
+    turns = list(iter(game.step, None))
+    return Trace(game.outcome, game.winner, turns, game.hand_codes(), game.reshuffles)
+
+
+def _reference_game(seed: int, num_players: int, num_decks: int) -> ReferenceGame:
+    """
+    Returns the reference game of a seed, dealt with the current Config.
+    """
+    return ReferenceGame(
+        seed, num_players, Config.NUM_CARDS_AT_INIT, num_decks,
+        Config.MAX_ROUNDS_PER_PLAYER, Config.MAX_ROUNDS_WITHOUT_PROGRESS,
+    )
+
+
+def _new_game(seed: int, num_players: int, num_decks: int) -> Game:
+    """
+    Returns the engine game of a seed, dealt if there are enough cards to start it.
+    """
+    players: ArrayList[Player] = ArrayList(num_players)
+    for i in range(num_players):
+        players.insert(i, Player(str(i)))
+    game = Game(RandomGen(seed), num_decks)
+    try:
+        game.initialise_game(players)
+    except DeckExhausted:# ends as a draw before the first turn, like the reference
+        game.outcome = GameOutcome.DRAW
+    return game
+
+
+def _game_trace(game: Game, turns: list) -> Trace:
+    """
+    Returns the trace of a finished engine game.
+    """
+    winner = game.winner()
+    hands = [sorted(card.code for card in player.hand) for player in game.players.seats]
+    return Trace(int(game.outcome), None if winner is None else winner.seat, turns, hands, game.game_board.reshuffles)
+
+
+def play_game_trace(seed: int, num_players: int, num_decks: int) -> Trace:
+    """
+    Plays a seed with Game.play_game, see reference_trace
+    """
+    game = _new_game(seed, num_players, num_decks)
+    recorder = _TurnRecorder()
+    if game.outcome is None:
+        game.attach_event_log(recorder)
+        game.play_game()
+    return _game_trace(game, recorder.turns)
+
+
+def step_trace(seed: int, num_players: int, num_decks: int) -> Trace:
+    """
+    Plays a seed with Game.iter_turns, see reference_trace
+    """
+    game = _new_game(seed, num_players, num_decks)
+    turns = []
+    if game.outcome is None:
+        for event in game.iter_turns():
+            card = -1 if event.card is None else event.card.code
+            turns.append((event.turn, event.seat, card, event.drew, int(event.color), int(event.label)))
+    return _game_trace(game, turns)
+
+
+def vector_traces(seeds, num_players: int, num_decks: int) -> list:
+    """
+    Plays the seeds in lockstep with VectorSimulator, see reference_trace
+
+    The simulator does not say what each turn was, so the turns are read off
+    the arrays around every step: the hand of the seat to move lost a card
+    (played it), gained one (drew and kept it) or stayed the same (drew and
+    played it, the card follows from the label and colour left behind).
+
+    Returns:
+        list: The Trace of each seed, in order
+    """
+    from vector_sim import VectorSimulator, NO_WINNER, NOT_OVER
+
+    sim = VectorSimulator(seeds, num_players, num_decks)
+    steps = []
+    rows = np.flatnonzero(sim.outcome == NOT_OVER)
+    while len(rows):
+        seats = np.where(sim.turns[rows] == 0, sim.current[rows], sim.cursor[rows])
+        before = sim.hands[rows, seats]
+        turns = sim.turns[rows].copy()
+        remaining = sim.step(rows)
+        # a turn that ran out of cards ends the game and, as in Game.step, does not count
+        kept = (sim.turns[rows] > turns) & (sim.outcome[rows] == NOT_OVER)
+        played_rows, seats = rows[kept], seats[kept]
+        change = sim.hands[played_rows, seats] - before[kept]
+        lost = (change < 0).any(axis=1)
+        gained = (change > 0).any(axis=1)
+        labels = sim.label[played_rows]
+        colors = np.where(labels > CardLabel.DRAW_TWO, int(CardColor.BLACK), sim.color[played_rows])
+        cards = np.where(lost, change.argmin(axis=1), np.where(gained, -1, colors * NUM_LABELS + labels))
+        steps.append((played_rows, sim.turns[played_rows], seats, cards, ~lost, sim.color[played_rows], labels))
+        rows = remaining
+
+    if steps:
+        columns = [np.concatenate(column) for column in zip(*steps)]
+    else:
+        columns = [np.zeros(0, dtype=np.int64)] * 7
+    order = np.lexsort((columns[1], columns[0]))
+    game_rows, *columns = [column[order] for column in columns]
+    bounds = np.searchsorted(game_rows, np.arange(len(seeds) + 1))
+    columns = [column.tolist() for column in columns]
+    codes = np.arange(NUM_CARD_CODES)
+    traces = []
+    for row in range(len(seeds)):
+        start, stop = bounds[row], bounds[row + 1]
+        turns = list(zip(*(column[start:stop] for column in columns)))
+        hands = [np.repeat(codes, counts).tolist() for counts in sim.hands[row]]
+        winner = int(sim.winner[row])
+        traces.append(Trace(
+            int(sim.outcome[row]), None if winner == NO_WINNER else winner, turns, hands, int(sim.reshuffles[row])
+        ))
+    return traces
+
+
+def describe_turn(turn: tuple | None) -> str:
+    """
+    Returns a turn as a line of text, "-" when there is none
+    """
+    if turn is None:
+        return "-"
+    number, seat, card, drew, color, label = turn
+    if card < 0:
+        action = "draws a card and keeps it"
+    else:
+        action = ("draws and plays " if drew else "plays ") + CARD_NAMES[card]
+    return f"turn {number}: seat {seat} {action}, then {CardColor(color).name} {CardLabel(label).name}"
+
+
+def _describe_state(name: str, turns: int, to_move, color, label, hands, draw_pile: int,
+                    discard_pile: int, reshuffles: int) -> list:
+    """
+    Returns the lines of a minimal dump of a position.
+    """
+    color = "-" if color is None else CardColor(color).name
+    label = "-" if label is None else CardLabel(label).name
+    lines = [
+        f"  {name} after {turns} turns: {color} {label}, seat {to_move} to move, "
+        f"draw pile {draw_pile}, discard pile {discard_pile}, reshuffles {reshuffles}"
+    ]
+    for seat, hand in enumerate(hands):
+        lines.append(f"    seat {seat} ({len(hand)}): " + ", ".join(CARD_NAMES[code] for code in hand))
+    return lines
+
+
+def _reference_state(seed: int, num_players: int, num_decks: int, turns: int) -> list:
+    """
+    Returns the dump of the reference game of a seed after the given number of turns.
+    """
+    game = _reference_game(seed, num_players, num_decks)
+    while game.turns < turns and game.step() is not None:
+        pass
+    to_move = game.current if game.turns == 0 else game.cursor
+    return _describe_state(
+        "reference", game.turns, to_move, game.color, game.label, game.hand_codes(),
+        len(game.draw_pile), len(game.discard_pile), game.reshuffles,
+    )
+
+
+def _engine_state(mode: str, seed: int, num_players: int, num_decks: int, turns: int) -> list:
+    """
+    Returns the dump of the engine game of a seed after the given number of turns.
+    """
+    if mode == "vector":
+        from vector_sim import VectorSimulator, NOT_OVER
+
+        sim = VectorSimulator([seed], num_players, num_decks)
+        rows = np.flatnonzero(sim.outcome == NOT_OVER)
+        while len(rows) and sim.turns[0] < turns:
+            rows = sim.step(rows)
+        codes = np.arange(NUM_CARD_CODES)
+        return _describe_state(
+            mode, int(sim.turns[0]), int(sim.current[0] if sim.turns[0] == 0 else sim.cursor[0]),
+            int(sim.color[0]), int(sim.label[0]), [np.repeat(codes, counts).tolist() for counts in sim.hands[0]],
+            int(sim.pile_end[0] - sim.pile_pos[0]), int(sim.discard_len[0]), int(sim.reshuffles[0]),
+        )
+    game = _new_game(seed, num_players, num_decks)
+    if game.outcome is None:
+        game.start_play()
+        while game.turns < turns and game.step() is not None:
+            pass
+    to_move = None if game.current_player is None else game.player_to_move().seat
+    hands = [sorted(card.code for card in player.hand) for player in game.players.seats]
+    board = game.game_board
+    return _describe_state(
+        mode, game.turns, to_move, game.current_color, game.current_label, hands,
+        len(board.draw_pile), len(board.discard_pile), board.reshuffles,
+    )
+
+
+def report(mode: str, seed: int, num_players: int, num_decks: int, expected: Trace, got: Trace) -> str:
+    """
+    Describes where a game played by an engine mode first differs from the reference
+
+    Args:
+        mode (str): The engine mode, one of MODES
+        seed (int): The seed of the game
+        num_players (int): The number of players
+        num_decks (int): The number of decks
+        expected (Trace): The game played by the reference
+        got (Trace): The game played by the engine mode
+
+    Returns:
+        str: The first differing turn, or field if every turn agrees, and the position before it
+    """
+    field = expected.first_difference(got)
+    if field == "turns":
+        i = 0
+        while i < min(len(expected.turns), len(got.turns)) and expected.turns[i] == got.turns[i]:
+            i += 1
+        lines = [
+            f"seed {seed}, {mode}: first difference at turn {i + 1}",
+            f"  reference: {describe_turn(expected.turns[i] if i < len(expected.turns) else None)}",
+            f"  {mode}: {describe_turn(got.turns[i] if i < len(got.turns) else None)}",
+        ]
+        turns = i
+    else:
+        lines = [
+            f"seed {seed}, {mode}: every turn agrees, the {field} differ"
+            f" (reference {getattr(expected, field)}, {mode} {getattr(got, field)})"
+        ]
+        turns = len(expected.turns)
+    lines += _reference_state(seed, num_players, num_decks, turns)
+    lines += _engine_state(mode, seed, num_players, num_decks, turns)
+    return "\n".join(lines)
+
+
+def verify_chunk(seeds: range, num_players: int, num_decks: int, modes) -> tuple:
+    """
+    Checks every seed of a chunk against the reference in every mode
+
+    Args:
+        seeds (range): The seeds to check
+        num_players (int): The number of players
+        num_decks (int): The number of decks
+        modes: The engine modes to check, from MODES
+
+    Returns:
+        tuple: The number of games that differ per mode, and the report of each of them
+    """
+    expected = [reference_trace(seed, num_players, num_decks) for seed in seeds]
+    differ = dict.fromkeys(modes, 0)
+    reports = []
+    for mode in modes:
+        if mode == "vector":
+            traces = vector_traces(seeds, num_players, num_decks)
+        else:
+            play = play_game_trace if mode == "play_game" else step_trace
+            traces = [play(seed, num_players, num_decks) for seed in seeds]
+        for seed, reference, trace in zip(seeds, expected, traces):
+            if reference.first_difference(trace) is not None:
+                differ[mode] += 1
+                reports.append(report(mode, seed, num_players, num_decks, reference, trace))
+    return differ, reports
+
+
+def _star_verify_chunk(job) -> tuple:
+    """
+    Unpacks a (seeds, num_players, num_decks, modes, num_cards) job for Pool.imap and applies
+    the number of cards dealt in the worker.
+    """
+    Config.NUM_CARDS_AT_INIT = job[4]
+    return verify_chunk(*job[:4])
+
+
+if __name__ == "__main__":
+
+    p = argparse.ArgumentParser(description="Compare the game engines with the frozen reference rules.")
+    p.add_argument("start", type=int, help="First seed to check.")
+    p.add_argument("stop", type=int, help="Seed to stop at (exclusive).")
+    p.add_argument("players", type=int, help="Number of players in every game.")
+    p.add_argument("--cards", type=int, default=Config.NUM_CARDS_AT_INIT, help="Cards dealt to each player.")
+    p.add_argument("--decks", type=int, default=Config.NUM_DECKS, help="Decks in every game.")
+    p.add_argument("--modes", nargs="+", choices=MODES, default=None, help="Engine modes to check (default: all available).")
+    p.add_argument("--processes", type=int, default=None, help="Worker processes (default: CPU count).")
+    p.add_argument("--chunk-size", type=int, default=200, help="Seeds per worker task.")
+    p.add_argument("--max-reports", type=int, default=5, help="Differences to describe, the rest are only counted.")
+    args = p.parse_args()
+
+    modes = args.modes or [mode for mode in MODES if mode != "vector" or np is not None]
+    if "vector" in modes and np is None:
+        p.error("the vector mode requires NumPy")
+
+    start_time = time.perf_counter()
+    seeds = range(args.start, args.stop)
+    jobs = [
+        (seeds[i:i + args.chunk_size], args.players, args.decks, modes, args.cards)
+        for i in range(0, len(seeds), args.chunk_size)
+    ]
+    differ = dict.fromkeys(modes, 0)
+    shown = 0
+    with Pool(args.processes) if args.processes != 1 else nullcontext() as pool:
+        checked = map(_star_verify_chunk, jobs) if pool is None else pool.imap(_star_verify_chunk, jobs)
+        for chunk_differ, reports in checked:
+            for mode, count in chunk_differ.items():
+                differ[mode] += count
+            for text in reports[:max(0, args.max_reports - shown)]:
+                print(text)
+                print()
+            shown += len(reports)
+
+    elapsed = time.perf_counter() - start_time
+    for mode in modes:
+        print(f"{mode}: {differ[mode]} of {len(seeds)} games differ from the reference")
+    print(f"# {len(seeds)} seeds in {elapsed:.2f}s")
+    sys.exit(1 if any(differ.values()) else 0)